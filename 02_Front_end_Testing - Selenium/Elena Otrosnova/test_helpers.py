@@ -1,74 +1,17 @@
 import time
 import os
+import sys
 import signal
-from selenium import webdriver
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.edge.service import Service as EdgeService
-
-
-class WebDriverFactory:
-    """Factory class for creating browser instances with proper configuration"""
-
-    @staticmethod
-    def create_chrome_driver(disable_javascript=False):
-        """Create Chrome WebDriver with optimized settings"""
-        chrome_options = ChromeOptions()
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--start-maximized")
-
-        if disable_javascript:
-            prefs = {"profile.managed_default_content_settings.javascript": 2}
-            chrome_options.add_experimental_option("prefs", prefs)
-
-        try:
-            service = ChromeService()
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            if not disable_javascript:
-                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            print(f"Failed to create Chrome driver: {e}")
-            raise
-
-    @staticmethod
-    def create_edge_driver(disable_javascript=False):  # ← ADD THIS PARAMETER
-        """Create Edge WebDriver with optimized settings"""
-        edge_options = EdgeOptions()
-        edge_options.add_argument("--disable-blink-features=AutomationControlled")
-        edge_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        edge_options.add_experimental_option('useAutomationExtension', False)
-        edge_options.add_argument("--no-sandbox")
-        edge_options.add_argument("--disable-dev-shm-usage")
-        edge_options.add_argument("--start-maximized")
-
-        # ← ADD THESE 3 LINES
-        if disable_javascript:
-            prefs = {"profile.managed_default_content_settings.javascript": 2}
-            edge_options.add_experimental_option("prefs", prefs)
-
-        try:
-            service = EdgeService()
-            driver = webdriver.Edge(service=service, options=edge_options)
-
-            # ← WRAP THIS IN AN IF STATEMENT
-            if not disable_javascript:
-                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-            return driver
-        except Exception as e:
-            print(f"Failed to create Edge driver: {e}")
-            raise
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from common.driver_factory import WebDriverFactory
+from common.fast_sleeps import settle_scroll
+from common.readiness import wait_until_ready, wait_for_count_change, CountChangeResult
+from common.locator_race import race_locators
+from common.text_harvest import harvest_text
+from common.site_config import site_url
+from pages.stories_page import StoriesPage, STORY_COUNT_JS
 
 
 class ElementInteraction:
@@ -98,7 +41,7 @@ class ElementInteraction:
             driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
         else:
             driver.execute_script("arguments[0].scrollIntoView({block:'center'});", element)
-        time.sleep(1)
+        settle_scroll(driver, element, 1)
 
 
 class TestUtils:
@@ -106,12 +49,12 @@ class TestUtils:
 
     @staticmethod
     def safe_teardown(driver, browser_name=""):
-        """Safely teardown driver with error handling"""
+        """Safely hand the driver back to the pool with error handling"""
         try:
             if driver:
                 time.sleep(1)
-                driver.quit()
-                print(f"{browser_name}: Driver successfully closed")
+                WebDriverFactory.release_driver(driver, browser_name)
+                print(f"{browser_name}: Driver successfully released")
         except Exception as e:
             print(f"{browser_name}: Warning during teardown: {e}")
             try:
@@ -121,15 +64,14 @@ class TestUtils:
                 pass
 
     @staticmethod
-    def wait_for_page_load(driver, timeout=5):
-        """Wait for page to load completely"""
-        try:
-            wait = WebDriverWait(driver, timeout)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            driver.execute_script("return document.readyState") == "complete"
-            time.sleep(2)
-        except TimeoutException:
-            print("Page load timeout - continuing anyway")
+    def wait_for_page_load(driver, timeout=5, criteria=("load", "network-idle"), selector=None):
+        """Wait until the page meets the readiness criteria (see common.readiness) and report the wait"""
+        result = wait_until_ready(driver, criteria, timeout=timeout, selector=selector)
+        if result:
+            print(f"Page ready ({', '.join(result.criteria)}) in {result.elapsed:.2f}s")
+        else:
+            print(f"Page load timeout ({', '.join(result.unmet)} not met) - continuing anyway")
+        return result
 
 
 class PageHelpers:
@@ -161,17 +103,10 @@ class StoriesPageHelpers:
             (By.CSS_SELECTOR, "img")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in story_image_selectors:
-            try:
-                images = wait.until(EC.presence_of_all_elements_located((by_type, selector)))
-                if images and len(images) > 0:
-                    visible_images = [img for img in images if img.is_displayed()]
-                    if visible_images:
-                        print(f"{browser_name}: Found {len(visible_images)} story images using selector: {selector}")
-                        return True
-            except TimeoutException:
-                continue
+        result = race_locators(driver, story_image_selectors, timeout, condition="visible")
+        if result:
+            print(f"{browser_name}: Found {len(result.elements)} story images using selector: {result.selector}")
+            return True
 
         print(f"{browser_name}: No story images found")
         return False
@@ -191,17 +126,12 @@ class StoriesPageHelpers:
             (By.CSS_SELECTOR, "h3")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in story_title_selectors:
-            try:
-                titles = wait.until(EC.presence_of_all_elements_located((by_type, selector)))
-                if titles and len(titles) > 0:
-                    visible_titles = [title for title in titles if title.is_displayed() and title.text.strip()]
-                    if visible_titles:
-                        print(f"{browser_name}: Found {len(visible_titles)} story titles using selector: {selector}")
-                        return True
-            except TimeoutException:
-                continue
+        titles = harvest_text(driver, story_title_selectors, timeout, visible_only=True, enough=1)
+        if titles:
+            longest = max(item.length for item in titles)
+            print(f"{browser_name}: Found {len(titles)} story titles using selector: {titles[0].locator[1]} "
+                  f"(longest {longest} chars)")
+            return True
 
         print(f"{browser_name}: No story titles found")
         return False
@@ -219,18 +149,11 @@ class StoriesPageHelpers:
             (By.CSS_SELECTOR, "p")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in story_description_selectors:
-            try:
-                descriptions = wait.until(EC.presence_of_all_elements_located((by_type, selector)))
-                if descriptions and len(descriptions) > 0:
-                    visible_descriptions = [desc for desc in descriptions if desc.is_displayed() and desc.text.strip()]
-                    if visible_descriptions:
-                        print(
-                            f"{browser_name}: Found {len(visible_descriptions)} story descriptions using selector: {selector}")
-                        return True
-            except TimeoutException:
-                continue
+        descriptions = harvest_text(driver, story_description_selectors, timeout, visible_only=True, enough=1)
+        if descriptions:
+            print(f"{browser_name}: Found {len(descriptions)} story descriptions using selector: "
+                  f"{descriptions[0].locator[1]}")
+            return True
 
         print(f"{browser_name}: No story descriptions found")
         return False
@@ -260,15 +183,10 @@ class StoriesPageHelpers:
             (By.XPATH, "//button[contains(., 'Load more')]")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in load_more_selectors:
-            try:
-                button = wait.until(EC.visibility_of_element_located((by_type, selector)))
-                if button.is_displayed():
-                    print(f"{browser_name}: Load more button is visible using selector: {selector}")
-                    return True
-            except TimeoutException:
-                continue
+        result = race_locators(driver, load_more_selectors, timeout, condition="visible", limit=1)
+        if result:
+            print(f"{browser_name}: Load more button is visible using selector: {result.selector}")
+            return True
 
         print(f"{browser_name}: Load more button not visible")
         return False
@@ -276,49 +194,26 @@ class StoriesPageHelpers:
     @staticmethod
     def get_stories_count(driver, browser_name="", timeout=5):
         """Get the current count of story cards on the page"""
-        # Try multiple strategies to count stories
-        story_card_selectors = [
-            (By.XPATH,
-             "//a[contains(@href, '/stories/') and not(contains(@href, '/stories?')) and not(contains(@href, '/stories#'))]"),
-            (By.CSS_SELECTOR, "a[href*='/stories/'][href*='-']"),  # Stories have dashes in URLs
-            (By.CSS_SELECTOR, "article"),
-            (By.CSS_SELECTOR, ".story-card"),
-            (By.CSS_SELECTOR, "[class*='story-card']"),
-            (By.CSS_SELECTOR, "[data-story]")
-        ]
+        count = len(StoriesPageHelpers.extract_story_cards(driver))
+        if count > 0:
+            print(f"{browser_name}: Found {count} stories")
+        else:
+            print(f"{browser_name}: Could not count stories")
+        return count
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in story_card_selectors:
-            try:
-                # Use find_elements instead of wait to get all elements immediately
-                stories = driver.find_elements(by_type, selector)
-                if stories:
-                    # Filter for unique stories (don't require visibility since stories might be below fold)
-                    unique_stories = []
-                    seen_hrefs = set()
-
-                    for story in stories:
-                        try:
-                            # For link elements, check href to avoid duplicates
-                            if story.tag_name == 'a':
-                                href = story.get_attribute('href')
-                                if href and '/stories/' in href and href not in seen_hrefs:
-                                    seen_hrefs.add(href)
-                                    unique_stories.append(story)
-                            else:
-                                unique_stories.append(story)
-                        except:
-                            continue
-
-                    count = len(unique_stories)
-                    if count > 0:
-                        print(f"{browser_name}: Found {count} stories using selector: {selector}")
-                        return count
-            except Exception as e:
-                continue
-
-        print(f"{browser_name}: Could not count stories")
-        return 0
+    @staticmethod
+    def extract_story_cards(driver, include_titles=False):
+        """Deduplicated story cards as [{'href': ..., 'title': ...}] from a single execute_script"""
+        try:
+            return StoriesPage(driver).story_cards(include_titles)
+        except Exception as e:
+            print(f"Story card extraction failed: {e}")
+            return []
+
+    @staticmethod
+    def get_story_hrefs(driver):
+        """Unique story link URLs currently on the page"""
+        return [card["href"] for card in StoriesPageHelpers.extract_story_cards(driver) if card["href"]]
 
     @staticmethod
     def click_load_more_button(driver, browser_name="", timeout=5):
@@ -332,53 +227,31 @@ class StoriesPageHelpers:
             (By.XPATH, "//button[contains(., 'Load more')]")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in load_more_selectors:
-            try:
-                button = wait.until(EC.element_to_be_clickable((by_type, selector)))
-                ElementInteraction.scroll_to_element(driver, button)
-
-                if ElementInteraction.safe_click(driver, button, browser_name):
-                    print(f"{browser_name}: Clicked Load more button")
-                    return True
-            except TimeoutException:
-                continue
+        if StoriesPageHelpers._click_first(driver, load_more_selectors, browser_name, timeout):
+            print(f"{browser_name}: Clicked Load more button")
+            return True
 
         print(f"{browser_name}: Could not click Load more button")
         return False
 
     @staticmethod
-    def wait_for_loading_complete(driver, browser_name="", timeout=10):
-        """Wait for loading indicator to complete"""
-        time.sleep(1)  # Initial wait for loading to start
-
-        loading_selectors = [
-            "//div[contains(@class, 'loading')]",
-            "//div[contains(@class, 'spinner')]",
-            "//*[contains(@aria-label, 'loading')]",
-            "//div[contains(@class, 'loader')]"
-        ]
-
+    def wait_for_loading_complete(driver, browser_name="", timeout=10, previous_count=None, quiet_period=1.5):
+        """Wait until more story cards appear or the card count settles; returns a CountChangeResult"""
         try:
-            wait = WebDriverWait(driver, timeout)
-            for selector in loading_selectors:
-                try:
-                    wait.until(EC.invisibility_of_element_located((By.XPATH, selector)))
-                except TimeoutException:
-                    pass
-
-            time.sleep(5)  # Wait for new stories to appear and render
-            # Scroll slightly to trigger any lazy loading
-            driver.execute_script("window.scrollBy(0, 100);")
-            time.sleep(1)
-            driver.execute_script("window.scrollBy(0, -100);")
-            time.sleep(1)
-
-            print(f"{browser_name}: Loading completed")
-            return True
+            result = wait_for_count_change(driver, STORY_COUNT_JS, previous_count,
+                                           quiet_ms=int(quiet_period * 1000), timeout=timeout)
         except Exception as e:
-            print(f"{browser_name}: Loading indicator check completed with note: {e}")
-            return True
+            print(f"{browser_name}: Loading check completed with note: {e}")
+            return CountChangeResult(previous_count or 0, previous_count or 0, False, False, 0.0)
+
+        if result.grew:
+            print(f"{browser_name}: Loading completed - {result.count} stories "
+                  f"(+{result.count - result.previous_count}) in {result.elapsed:.2f}s")
+        elif result:
+            print(f"{browser_name}: Loading completed - story count settled at {result.count} in {result.elapsed:.2f}s")
+        else:
+            print(f"{browser_name}: Story count still changing after {timeout}s ({result.count})")
+        return result
 
     @staticmethod
     def check_if_load_more_available(driver, browser_name="", timeout=2):
@@ -387,58 +260,42 @@ class StoriesPageHelpers:
             # Check if button is disabled or if there's a message saying no more stories
             # First check if button still exists and is enabled
             load_more_buttons = [
-                "//button[contains(text(), 'Load more')]",
-                "//button[contains(., 'Load more')]"
+                (By.XPATH, "//button[contains(text(), 'Load more')]"),
+                (By.XPATH, "//button[contains(., 'Load more')]")
             ]
 
-            button_found = False
-            button_disabled = False
+            result = race_locators(driver, load_more_buttons, timeout=0, limit=1)
+            if not result:
+                print(f"{browser_name}: Load more button disappeared - likely all stories loaded")
+                return False
 
-            for selector in load_more_buttons:
-                try:
-                    button = driver.find_element(By.XPATH, selector)
-                    if button:
-                        button_found = True
-                        # Check if button is disabled
-                        is_disabled = button.get_attribute("disabled")
-                        aria_disabled = button.get_attribute("aria-disabled")
-
-                        if is_disabled == "true" or aria_disabled == "true":
-                            button_disabled = True
-                            print(f"{browser_name}: Load more button is disabled - no more stories available")
-                            return False
-
-                        # Check button classes for disabled state
-                        button_class = button.get_attribute("class") or ""
-                        if "disabled" in button_class.lower():
-                            button_disabled = True
-                            print(f"{browser_name}: Load more button has disabled class - no more stories available")
-                            return False
-                        break
-                except:
-                    continue
+            button = result.elements[0]
+            # Check if button is disabled
+            is_disabled = button.get_attribute("disabled")
+            aria_disabled = button.get_attribute("aria-disabled")
 
-            if not button_found:
-                print(f"{browser_name}: Load more button disappeared - likely all stories loaded")
+            if is_disabled == "true" or aria_disabled == "true":
+                print(f"{browser_name}: Load more button is disabled - no more stories available")
+                return False
+
+            # Check button classes for disabled state
+            button_class = button.get_attribute("class") or ""
+            if "disabled" in button_class.lower():
+                print(f"{browser_name}: Load more button has disabled class - no more stories available")
                 return False
 
             # Check for "no more" messages
             no_more_messages = [
-                "//div[contains(text(), 'No more stories')]",
-                "//div[contains(text(), 'no more')]",
-                "//p[contains(text(), 'No more stories')]",
-                "//*[contains(text(), 'reached the end')]",
-                "//*[contains(text(), 'all stories')]"
+                (By.XPATH, "//div[contains(text(), 'No more stories')]"),
+                (By.XPATH, "//div[contains(text(), 'no more')]"),
+                (By.XPATH, "//p[contains(text(), 'No more stories')]"),
+                (By.XPATH, "//*[contains(text(), 'reached the end')]"),
+                (By.XPATH, "//*[contains(text(), 'all stories')]")
             ]
 
-            for selector in no_more_messages:
-                try:
-                    msg = driver.find_element(By.XPATH, selector)
-                    if msg and msg.is_displayed():
-                        print(f"{browser_name}: No more stories message found")
-                        return False
-                except:
-                    continue
+            if race_locators(driver, no_more_messages, timeout=0, condition="visible", limit=1):
+                print(f"{browser_name}: No more stories message found")
+                return False
 
             # If button is enabled and no "no more" messages, assume more are available
             # BUT also check the current story count - if it's very low (< 6), might be all stories
@@ -466,17 +323,9 @@ class StoriesPageHelpers:
             (By.XPATH, "//*[contains(@class, 'category') or contains(@class, 'section')]//a[contains(text(), 'API')]")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in api_section_selectors:
-            try:
-                api_link = wait.until(EC.element_to_be_clickable((by_type, selector)))
-                ElementInteraction.scroll_to_element(driver, api_link)
-
-                if ElementInteraction.safe_click(driver, api_link, browser_name):
-                    print(f"{browser_name}: Clicked API section")
-                    return True
-            except TimeoutException:
-                continue
+        if StoriesPageHelpers._click_first(driver, api_section_selectors, browser_name, timeout):
+            print(f"{browser_name}: Clicked API section")
+            return True
 
         print(f"{browser_name}: Could not click API section")
         return False
@@ -499,16 +348,7 @@ class StoriesPageHelpers:
                 (By.CSS_SELECTOR, ".story-card")
             ]
 
-            wait = WebDriverWait(driver, timeout)
-            stories = None
-
-            for by_type, selector in story_selectors:
-                try:
-                    stories = wait.until(EC.presence_of_all_elements_located((by_type, selector)))
-                    if stories:
-                        break
-                except TimeoutException:
-                    continue
+            stories = race_locators(driver, story_selectors, timeout).elements
 
             if not stories:
                 print(f"{browser_name}: No stories found")
@@ -546,18 +386,10 @@ class StoriesPageHelpers:
             (By.XPATH, "//button[contains(., 'Sort')]")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in sort_button_selectors:
-            try:
-                button = wait.until(EC.element_to_be_clickable((by_type, selector)))
-                ElementInteraction.scroll_to_element(driver, button)
-
-                if ElementInteraction.safe_click(driver, button, browser_name):
-                    print(f"{browser_name}: Clicked Sort button")
-                    time.sleep(1)
-                    return True
-            except TimeoutException:
-                continue
+        if StoriesPageHelpers._click_first(driver, sort_button_selectors, browser_name, timeout):
+            print(f"{browser_name}: Clicked Sort button")
+            time.sleep(1)
+            return True
 
         print(f"{browser_name}: Could not click Sort button")
         return False
@@ -575,15 +407,10 @@ class StoriesPageHelpers:
             (By.XPATH, "//div[contains(@role, 'menu')]")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in sort_menu_selectors:
-            try:
-                menu = wait.until(EC.visibility_of_element_located((by_type, selector)))
-                if menu.is_displayed():
-                    print(f"{browser_name}: Sort menu is visible using selector: {selector}")
-                    return True
-            except TimeoutException:
-                continue
+        result = race_locators(driver, sort_menu_selectors, timeout, condition="visible", limit=1)
+        if result:
+            print(f"{browser_name}: Sort menu is visible using selector: {result.selector}")
+            return True
 
         print(f"{browser_name}: Sort menu not visible")
         return False
@@ -594,19 +421,12 @@ class StoriesPageHelpers:
         expected_options = ['Newest First', 'Oldest First', 'A-Z', 'newest', 'oldest', 'a-z']
 
         try:
-            # Get all buttons or clickable elements in the popover/menu
-            wait = WebDriverWait(driver, timeout)
-
             # First, try to find the popover
-            popover = None
-            try:
-                popover = wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'popover')]")))
-            except:
-                pass
+            popover = race_locators(driver, [(By.XPATH, "//div[contains(@class, 'popover')]")], timeout, limit=1)
 
             if popover:
                 # Get all text content from the popover
-                popover_text = popover.text.lower()
+                popover_text = popover.elements[0].text.lower()
                 print(f"{browser_name}: Popover content: {popover_text}")
 
                 # Check if expected options appear in the text
@@ -628,14 +448,11 @@ class StoriesPageHelpers:
             ]
 
             found_options = []
-            for by_type, selector in sort_option_selectors:
+            for opt in race_locators(driver, sort_option_selectors, timeout=0, condition="visible", mode="all").elements:
                 try:
-                    options = driver.find_elements(by_type, selector)
-                    for opt in options:
-                        if opt.is_displayed():
-                            text = opt.text.strip()
-                            if text and text not in found_options:
-                                found_options.append(text)
+                    text = opt.text.strip()
+                    if text and text not in found_options:
+                        found_options.append(text)
                 except:
                     continue
 
@@ -667,18 +484,10 @@ class StoriesPageHelpers:
             (By.XPATH, "//button[contains(., 'Filter')]")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in filter_button_selectors:
-            try:
-                button = wait.until(EC.element_to_be_clickable((by_type, selector)))
-                ElementInteraction.scroll_to_element(driver, button)
-
-                if ElementInteraction.safe_click(driver, button, browser_name):
-                    print(f"{browser_name}: Clicked Filter button")
-                    time.sleep(1)
-                    return True
-            except TimeoutException:
-                continue
+        if StoriesPageHelpers._click_first(driver, filter_button_selectors, browser_name, timeout):
+            print(f"{browser_name}: Clicked Filter button")
+            time.sleep(1)
+            return True
 
         print(f"{browser_name}: Could not click Filter button")
         return False
@@ -695,15 +504,10 @@ class StoriesPageHelpers:
             (By.CSS_SELECTOR, "[class*='filter'][class*='panel']")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-        for by_type, selector in filter_panel_selectors:
-            try:
-                panel = wait.until(EC.visibility_of_element_located((by_type, selector)))
-                if panel.is_displayed():
-                    print(f"{browser_name}: Filter panel is visible using selector: {selector}")
-                    return True
-            except TimeoutException:
-                continue
+        result = race_locators(driver, filter_panel_selectors, timeout, condition="visible", limit=1)
+        if result:
+            print(f"{browser_name}: Filter panel is visible using selector: {result.selector}")
+            return True
 
         print(f"{browser_name}: Filter panel not visible")
         return False
@@ -721,8 +525,6 @@ class StoriesPageHelpers:
             (By.CSS_SELECTOR, ".filter-group")
         ]
 
-        wait = WebDriverWait(driver, timeout)
-
         label_selectors = [
             (By.XPATH, "//label[contains(text(), 'Industry')]"),
             (By.XPATH, "//label[contains(text(), 'Company')]"),
@@ -734,16 +536,12 @@ class StoriesPageHelpers:
 
         found_categories = []
 
-        for by_type, selector in filter_category_selectors + label_selectors:
-            try:
-                elements = wait.until(EC.presence_of_all_elements_located((by_type, selector)))
-                for elem in elements:
-                    if elem.is_displayed():
-                        text = elem.text
-                        if text and text not in found_categories:
-                            found_categories.append(text)
-            except TimeoutException:
-                continue
+        result = race_locators(driver, filter_category_selectors + label_selectors, timeout,
+                               condition="visible", mode="all")
+        for elem in result.elements:
+            text = elem.text
+            if text and text not in found_categories:
+                found_categories.append(text)
 
         if found_categories:
             print(f"{browser_name}: Found filter categories: {found_categories}")
@@ -758,11 +556,23 @@ class StoriesPageHelpers:
         print(f"{browser_name}: Not all filter categories visible")
         return False
 
+    @staticmethod
+    def _click_first(driver, locators, browser_name="", timeout=5):
+        """Race the locators for a clickable element, scroll to it and click it"""
+        result = race_locators(driver, locators, timeout, condition="clickable", limit=1)
+        if not result:
+            return False
+        button = result.elements[0]
+        ElementInteraction.scroll_to_element(driver, button)
+        return ElementInteraction.safe_click(driver, button, browser_name)
+
 
 class Constants:
     """Test constants and test data"""
-    STORIES_URL = "https://openai.com/stories"
-    STORIES_API_URL = "https://openai.com/stories/api/"
+    STORIES_URL = site_url("/stories")
+    STORIES_API_URL = site_url("/stories/api/")
+    INCORRECT_STORIES_URL = site_url("/storiessss")
+    NON_EXISTENT_STORY_URL = site_url("/stories/nonexistent-story-99999")
     EXPECTED_STORIES_TITLE_TEXTS = ["Stories", "OpenAI", "stories"]
     DEFAULT_TIMEOUT = 5
     LONG_TIMEOUT = 10
\ No newline at end of file
@@ -1,23 +1,37 @@
 import time
 #import self
 from selenium.webdriver.common.by import By
+from pages.safety_page import SafetyPage
+from common.fast_sleeps import pause, switch_to_new_window
+from common.storage_state import storage_state
 
+# With QA_FAST_SLEEPS=1 the fixed sleeps below become condition waits capped at the same time (see common.fast_sleeps)
 
 def Safety_Link(driver):
-    driver.get("https://openai.com/safety/")
-    time.sleep(4)
+    page = SafetyPage(driver).open()
+    pause(4, driver)
+    return page
 
 def switch_window(driver):
-        driver.switch_to.window(driver.window_handles[-1])
-        time.sleep(5)
+        switch_to_new_window(driver, 5)
 
 def API_log_in(driver):
-    driver.find_element(By.XPATH, "//a[@href='https://platform.openai.com/login']").click()
+    SafetyPage(driver).api_log_in_link().click()
     time.sleep(3)
 
 def continue_button(driver):
         driver.find_element(By.XPATH, "//button[normalize-space()='Continue']")
 
+def open_platform_login(driver):
+# Opens the 'OpenAI Platform' login form: the first time via Safety -> 'API log in' -> new tab,
+# afterwards by restoring the saved cookies/storage/URL in one navigation (see common.storage_state)
+        storage_state(driver, "platform-login-form", _platform_login_via_safety)
+
+def _platform_login_via_safety(driver):
+        Safety_Link(driver)
+        API_log_in(driver)
+        switch_window(driver)
+
 
 # import time
 # from selenium.webdriver.common.by import By
@@ -1,22 +1,37 @@
+import os
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common import NoSuchElementException
-import time
+from selenium.common import NoSuchElementException, TimeoutException
+from common.site_config import site_url, site_host
+from common.fast_sleeps import pause
+from common.screenshots import screenshots
+from common import link_verifier
+from common.pom import Locator
 
-url_main = "https://openai.com/"
-url_company = "https://openai.com/about"
+# Live openai.com by default, the offline fixture site with OPENAI_QA_BASE_URL (see common.site_config)
+url_main = site_url("/")
+url_company = site_url("/about")
+host = site_host()
 
-def delay(seconds=1):
-    time.sleep(seconds)
+def delay(driver, seconds=1):
+    # A fixed sleep, or with QA_FAST_SLEEPS=1 a wait for driver's page to settle capped at seconds
+    pause(seconds, driver)
 
-def take_screenshot(driver, filename="screenshot.png"):
-    driver.save_screenshot(filename)
+def take_screenshot(driver, filename="screenshot.png", element=None):
+    # Saved per worker and test under screenshots/ (see common.screenshots), returns the file path
+    return screenshots.capture(getattr(driver, "driver", driver), os.path.splitext(filename)[0], element)
+
+def _find(driver, xpath):
+    # xpath is an XPath string, or a Locator when driver is a page object (cached lookup, see common.pom)
+    if isinstance(xpath, Locator):
+        return driver.find(xpath)
+    return driver.find_element(By.XPATH, xpath)
 
 def assert_element_visible(driver, xpath, description="element"):
-  # Checks that element is displayed
+  # Checks that element is displayed; driver can also be a page object with xpath one of its Locators
     try:
-        element = driver.find_element(By.XPATH, xpath)
+        element = _find(driver, xpath)
         assert element.is_displayed()
         print(f"{description} is displayed")
         return True
@@ -30,9 +45,9 @@ def assert_element_visible(driver, xpath, description="element"):
         return False
 
 def assert_element_text_equals(driver, xpath, expected_text, description="element"):
-# Checks element is equal
+# Checks element is equal; driver can also be a page object with xpath one of its Locators
     try:
-        element = driver.find_element(By.XPATH, xpath)
+        element = _find(driver, xpath)
         actual_text = element.text.strip()
         assert expected_text in actual_text, f"Expected '{expected_text}', got '{actual_text}'"
         print(f"{expected_text} is in {description}'s text")
@@ -43,6 +58,40 @@ def assert_element_text_equals(driver, xpath, expected_text, description="elemen
         return False
 
 def click_and_verify(driver, click_xpath, url_contains, text_xpath, expected_text, description="link"):
+    # Checks the link's target over HTTP and opens it in the browser only if that can't confirm it (see common.link_verifier)
+    return verify_links(driver, [(click_xpath, url_contains, text_xpath, expected_text, description)])[0]
+
+def verify_links(driver, links, timeout=10):
+    # Checks many links at once; links are (click_xpath, url_contains, text_xpath, expected_text, description) tuples
+    results = []
+    for result in link_verifier.verify_links(driver, links, lambda check: _click_and_verify_in_browser(driver, *check), timeout,
+                                             check_page=lambda check: _verify_in_tab(driver, *check)):
+        check = result.check
+        if result.via == "http":
+            if result.ok:
+                print(f"{check.expected_text} is in {check.description}'s text")
+                print(f"{check.description} leads to correct page")
+            else:
+                print(f"{check.description} leads to incorrect page: {result.detail}")
+        results.append(result.ok)
+    return results
+
+def _verify_in_tab(driver, click_xpath, url_contains, text_xpath, expected_text, description="link"):
+    # The checks of _click_and_verify_in_browser on a target already loaded in its own tab
+    try:
+        WebDriverWait(driver, 10).until(EC.url_contains(url_contains))
+        if not assert_element_text_equals(driver, text_xpath, expected_text, description):
+            print(f"{description} leads to incorrect page: {driver.current_url}")
+            return False
+        print(f"{description} leads to correct page")
+        return True
+    except (TimeoutException, NoSuchElementException):
+        # Returned, not raised: TabNavigator would re-raise it and lose the other links' results
+        print(f"{description} leads to incorrect page: {driver.current_url}")
+        take_screenshot(driver)
+        return False
+
+def _click_and_verify_in_browser(driver, click_xpath, url_contains, text_xpath, expected_text, description="link"):
 
     try:
         element = WebDriverWait(driver, 10).until(
@@ -63,4 +112,4 @@ def click_and_verify(driver, click_xpath, url_contains, text_xpath, expected_tex
     except AssertionError:
         print(f"{description} leads to incorrect page")
         take_screenshot(driver)
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,71 @@
+"""Compare per-test browser launch against pooled driver reuse across the Chrome and Edge suites
+
+Every suite is run twice in a fresh interpreter: once with SELENIUM_POOL_SIZE=0 (a browser per
+test, the old behaviour) and once with the pool enabled. Wall time and the pool's launch/reuse
+counters are reported per suite.
+
+Usage:
+    python benchmarks/bench_driver_pool.py [--pool-size 2] [--max-reuse 25] [--profile headless] [suite ...]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+SELENIUM_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SUITES = [
+    "Elena Otrosnova/PositiveTest_openai_stories.py",
+    "Elena Otrosnova/NegativeTest_openai_stories.py",
+    "MilaS/untittest_Open_AI.py",
+    "MilaS/untittest_Open_AI_Negative.py",
+    "Lana_Chovgan/Unittest/Tests_OpenAI.py",
+]
+
+
+def run_suite(suite, pool_size, max_reuse):
+    """Run one suite file under unittest and return (seconds, tests run, launches, reuses)"""
+    path = os.path.join(SELENIUM_DIR, suite)
+    env = dict(os.environ, SELENIUM_POOL_SIZE=str(pool_size), SELENIUM_POOL_MAX_REUSE=str(max_reuse))
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-m", "unittest", os.path.splitext(os.path.basename(path))[0]],
+        cwd=os.path.dirname(path), env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+    output = result.stdout + result.stderr
+
+    tests = re.search(r"Ran (\d+) tests?", output)
+    pool_stats = re.search(r"Driver pool: (\d+) launches, (\d+) reuses", output)
+    launches, reuses = (int(pool_stats.group(1)), int(pool_stats.group(2))) if pool_stats else (0, 0)
+    return elapsed, int(tests.group(1)) if tests else 0, launches, reuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--max-reuse", type=int, default=25)
+    parser.add_argument("--profile", help="launch profile for both runs (see common.launch_profiles)")
+    parser.add_argument("suites", nargs="*", default=SUITES)
+    args = parser.parse_args()
+    if args.profile:
+        os.environ["SELENIUM_PROFILE"] = args.profile
+
+    print(f"{'suite':<48}{'tests':>6}{'per-test s':>12}{'pooled s':>10}{'launches':>10}{'speedup':>9}")
+    total_cold = total_pooled = 0.0
+    for suite in args.suites:
+        cold, tests, _, _ = run_suite(suite, 0, args.max_reuse)
+        pooled, _, launches, reuses = run_suite(suite, args.pool_size, args.max_reuse)
+        total_cold += cold
+        total_pooled += pooled
+        speedup = cold / pooled if pooled else 0
+        print(f"{suite:<48}{tests:>6}{cold:>12.1f}{pooled:>10.1f}{f'{launches}/{launches + reuses}':>10}{speedup:>8.2f}x")
+
+    if total_pooled:
+        print(f"{'total':<54}{total_cold:>12.1f}{total_pooled:>10.1f}{'':>10}{total_cold / total_pooled:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
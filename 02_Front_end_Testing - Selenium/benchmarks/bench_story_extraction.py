@@ -0,0 +1,95 @@
+"""Compare per-element story counting against the single-script bulk extraction as card count grows
+
+A local stories fixture with N cards (two links per card, like the live page) is generated for
+every size and loaded from disk, so only the counting itself is timed. The legacy approach is the
+original get_stories_count loop: find_elements followed by tag_name + get_attribute('href') per link.
+
+Usage:
+    python benchmarks/bench_story_extraction.py [--sizes 25 100 250 500 1000] [--repeat 3] [--browser chrome]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from selenium.webdriver.common.by import By
+
+SELENIUM_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(SELENIUM_DIR)
+sys.path.append(os.path.join(SELENIUM_DIR, "Elena Otrosnova"))
+from common.driver_factory import WebDriverFactory
+from test_helpers import StoriesPageHelpers
+
+CARD_TEMPLATE = """
+<article class="story-card">
+  <a href="https://openai.com/stories/customer-story-{i}" aria-label="Customer story {i}">
+    <img src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" alt="story {i}" width="320" height="180">
+    <div class="text-h5">Customer story number {i} about building with the API</div>
+  </a>
+  <p>How team {i} shipped faster with OpenAI.</p>
+  <a href="https://openai.com/stories/customer-story-{i}">Read story</a>
+</article>
+"""
+
+
+def write_fixture(directory, size):
+    path = os.path.join(directory, f"stories_{size}.html")
+    cards = "".join(CARD_TEMPLATE.format(i=i) for i in range(size))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"<!doctype html><html><head><title>Stories | OpenAI</title></head><body><main>{cards}</main></body></html>")
+    return path
+
+
+def legacy_story_count(driver):
+    """The original get_stories_count: two WebDriver round trips per matching link"""
+    stories = driver.find_elements(
+        By.XPATH,
+        "//a[contains(@href, '/stories/') and not(contains(@href, '/stories?')) and not(contains(@href, '/stories#'))]"
+    )
+    seen_hrefs = set()
+    for story in stories:
+        if story.tag_name == 'a':
+            href = story.get_attribute('href')
+            if href and '/stories/' in href:
+                seen_hrefs.add(href)
+    return len(seen_hrefs)
+
+
+def bulk_story_count(driver):
+    return len(StoriesPageHelpers.extract_story_cards(driver))
+
+
+def timed(function, driver, repeat):
+    samples, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(driver)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 100, 250, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--browser", choices=["chrome", "edge"], default="chrome")
+    args = parser.parse_args()
+
+    create = WebDriverFactory.create_edge_driver if args.browser == "edge" else WebDriverFactory.create_chrome_driver
+    driver = create()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            print(f"{'cards':>7}{'legacy s':>11}{'bulk s':>10}{'speedup':>10}")
+            for size in args.sizes:
+                driver.get("file://" + write_fixture(directory, size))
+                legacy, legacy_count = timed(legacy_story_count, driver, args.repeat)
+                bulk, bulk_count = timed(bulk_story_count, driver, args.repeat)
+                assert legacy_count == bulk_count == size, (legacy_count, bulk_count, size)
+                print(f"{size:>7}{legacy:>11.3f}{bulk:>10.3f}{legacy / bulk:>9.1f}x")
+    finally:
+        WebDriverFactory.release_driver(driver)
+
+
+if __name__ == '__main__':
+    main()
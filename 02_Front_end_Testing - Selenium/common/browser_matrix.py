@@ -0,0 +1,95 @@
+import os
+import sys
+import unittest
+from common.driver_factory import WebDriverFactory
+from common.launch_profiles import PROFILES
+
+BROWSERS = ("chrome", "edge", "firefox")
+BROWSER_TITLES = {"chrome": "Chrome", "edge": "Edge", "firefox": "Firefox"}
+
+# Matrix axes for this run, as comma-separated lists:
+#   SELENIUM_BROWSERS         - browsers to generate classes for (default: chrome,edge)
+#   SELENIUM_MATRIX_PROFILES  - launch profiles to generate classes for (default: the selected profile)
+BROWSERS_ENV_VAR = "SELENIUM_BROWSERS"
+PROFILES_ENV_VAR = "SELENIUM_MATRIX_PROFILES"
+DEFAULT_BROWSERS = ("chrome", "edge")
+
+
+def selected_browsers():
+    """Browsers of the matrix for this run"""
+    names = _split(os.environ.get(BROWSERS_ENV_VAR)) or list(DEFAULT_BROWSERS)
+    for name in names:
+        if name not in BROWSERS:
+            raise ValueError(f"Unknown browser '{name}', expected one of: {', '.join(BROWSERS)}")
+    return names
+
+
+def selected_profiles():
+    """Launch profiles of the matrix for this run; [None] means whichever profile is selected when tests start"""
+    names = _split(os.environ.get(PROFILES_ENV_VAR)) or [None]
+    for name in filter(None, names):
+        if name not in PROFILES:
+            raise ValueError(f"Unknown launch profile '{name}', expected one of: {', '.join(PROFILES)}")
+    return names
+
+
+def browser_of(test_class):
+    """Browser a test class runs in: its matrix browser, or guessed from the class name for hand-written classes"""
+    if getattr(test_class, "browser", None):
+        return test_class.browser
+    name = test_class.__name__.lower()
+    return next((browser for browser in BROWSERS if browser in name), None)
+
+
+class BrowserTestCase(unittest.TestCase):
+    """Base of every generated matrix class: a pooled driver for the class's browser and profile per test"""
+
+    browser = None
+    profile = None  # None follows SELENIUM_PROFILE / --profile at setUp time
+    driver_options = {}  # extra WebDriverFactory.create_driver() arguments, e.g. download_dir
+
+    @property
+    def browser_name(self):
+        return BROWSER_TITLES[self.browser]
+
+    def setUp(self):
+        self.driver = WebDriverFactory.create_driver(self.browser, profile=self.profile, **self.driver_options)
+
+    def tearDown(self):
+        WebDriverFactory.release_driver(self.driver, self.browser_name)
+
+
+def browser_matrix(browsers=None, profiles=None):
+    """Class decorator that fans a scenario out into one TestCase class per browser x launch profile
+
+    The scenario is a plain class (not a TestCase, so unittest does not collect it) holding
+    test_* methods that use self.driver. For every combination a class named e.g.
+    ChromePositiveTestCases or EdgeMobilePositiveTestCases is added to the scenario's module;
+    the profile only appears in the name when the matrix spans explicit profiles.
+    browsers/profiles default to the run's matrix (SELENIUM_BROWSERS / SELENIUM_MATRIX_PROFILES).
+    """
+    def expand(scenario):
+        module = sys.modules[scenario.__module__]
+        scenario.__test__ = False  # keep pytest from collecting the bare scenario
+        for browser in browsers or selected_browsers():
+            for profile in profiles or selected_profiles():
+                name = matrix_class_name(scenario.__name__, browser, profile)
+                setattr(module, name, type(name, (scenario, BrowserTestCase), {
+                    "browser": browser,
+                    "profile": profile,
+                    "__test__": True,
+                    "__module__": scenario.__module__,
+                    "__qualname__": name,
+                }))
+        return scenario
+    return expand
+
+
+def matrix_class_name(scenario_name, browser, profile):
+    profile_part = "" if profile is None else \
+        "".join(part.capitalize() for part in profile.replace("_", "-").split("-"))
+    return f"{BROWSER_TITLES[browser]}{profile_part}{scenario_name}"
+
+
+def _split(value):
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
@@ -0,0 +1,237 @@
+import os
+import tempfile
+import time
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from common import instrumentation
+from common.driver_pool import pool
+from common.launch_profiles import BACKGROUND_TAB_ARGUMENTS, get_profile_name, get_profile
+from common.driver_resolver import resolve_driver_path
+from common.network_replay import attach_network_layer, network_mode
+
+instrumentation.install()  # no-op unless SELENIUM_INSTRUMENT is set
+
+
+class WebDriverFactory:
+    """Factory class for creating browser instances with proper configuration
+
+    Drivers are handed out from a session-scoped pool (see common.driver_pool), so
+    tests must give them back with release_driver() instead of calling quit().
+    Browser flags come from the launch profile selected with SELENIUM_PROFILE or
+    --profile (see common.launch_profiles); every launch is timed in launch_times.
+    SELENIUM_NETWORK_MODE=record|replay routes Chrome/Edge traffic through common.network_replay.
+    """
+
+    launch_times = []  # [(browser, profile, seconds)]
+
+    @staticmethod
+    def create_driver(browser, disable_javascript=False, download_dir=None, profile=None):
+        """Create a WebDriver for browser ('chrome', 'edge' or 'firefox')"""
+        create = {
+            "chrome": WebDriverFactory.create_chrome_driver,
+            "edge": WebDriverFactory.create_edge_driver,
+            "firefox": WebDriverFactory.create_firefox_driver,
+        }.get(browser)
+        if create is None:
+            raise ValueError(f"Unknown browser '{browser}', expected chrome, edge or firefox")
+        return create(disable_javascript=disable_javascript, download_dir=download_dir, profile=profile)
+
+    @staticmethod
+    def create_chrome_driver(disable_javascript=False, download_dir=None, profile=None):
+        """Create Chrome WebDriver with optimized settings"""
+        profile = profile or get_profile_name()
+        return WebDriverFactory._acquire(
+            ("chrome", profile, disable_javascript, download_dir),
+            lambda: WebDriverFactory._timed_launch(
+                "Chrome", profile, WebDriverFactory._launch_chrome, disable_javascript, download_dir, profile)
+        )
+
+    @staticmethod
+    def create_edge_driver(disable_javascript=False, download_dir=None, profile=None):
+        """Create Edge WebDriver with optimized settings"""
+        profile = profile or get_profile_name()
+        return WebDriverFactory._acquire(
+            ("edge", profile, disable_javascript, download_dir),
+            lambda: WebDriverFactory._timed_launch(
+                "Edge", profile, WebDriverFactory._launch_edge, disable_javascript, download_dir, profile)
+        )
+
+    @staticmethod
+    def create_firefox_driver(disable_javascript=False, download_dir=None, profile=None):
+        """Create Firefox WebDriver with optimized settings"""
+        profile = profile or get_profile_name()
+        return WebDriverFactory._acquire(
+            ("firefox", profile, disable_javascript, download_dir),
+            lambda: WebDriverFactory._timed_launch(
+                "Firefox", profile, WebDriverFactory._launch_firefox, disable_javascript, download_dir, profile)
+        )
+
+    @staticmethod
+    def release_driver(driver, browser_name=""):
+        """Return driver to the pool (or quit it when pooling is disabled)"""
+        pool.release(driver, browser_name)
+
+    @staticmethod
+    def _acquire(key, launch):
+        """Pooled driver for key; with SELENIUM_INSTRUMENT set its commands and the helpers are timed"""
+        instrumentation.instrument_helpers()
+        return instrumentation.instrument_driver(pool.acquire(key, launch))
+
+    @staticmethod
+    def _timed_launch(browser, profile, launch, *args):
+        """Launch a browser and record how long startup took"""
+        start = time.perf_counter()
+        driver = launch(*args)
+        elapsed = time.perf_counter() - start
+        WebDriverFactory.launch_times.append((browser, profile, elapsed))
+        print(f"{browser} launched with '{profile}' profile in {elapsed:.2f}s")
+        return driver
+
+    @staticmethod
+    def _launch_chrome(disable_javascript=False, download_dir=None, profile=None):
+        """Start a new Chrome browser"""
+        chrome_options = ChromeOptions()
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        for argument in BACKGROUND_TAB_ARGUMENTS:
+            chrome_options.add_argument(argument)
+        chrome_options.add_argument("--disable-extensions")
+        for argument in get_profile(profile)["arguments"]:
+            chrome_options.add_argument(argument)
+        user_data_dir = WebDriverFactory._user_data_dir("chrome")
+        if user_data_dir:
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+
+        prefs = WebDriverFactory._prefs(disable_javascript, download_dir)
+        if prefs:
+            chrome_options.add_experimental_option("prefs", prefs)
+        if get_profile(profile).get("mobile_emulation"):
+            chrome_options.add_experimental_option("mobileEmulation", get_profile(profile)["mobile_emulation"])
+        # CDP Network events feed the network-idle readiness check (common.readiness)
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+        try:
+            service = ChromeService(executable_path=WebDriverFactory._driver_path("chrome"))
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver.qa_network_events = True
+            attach_network_layer(driver, "Chrome")
+            if not disable_javascript:
+                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            return driver
+        except Exception as e:
+            print(f"Failed to create Chrome driver: {e}")
+            raise
+
+    @staticmethod
+    def _launch_edge(disable_javascript=False, download_dir=None, profile=None):
+        """Start a new Edge browser"""
+        edge_options = EdgeOptions()
+        edge_options.add_argument("--disable-blink-features=AutomationControlled")
+        edge_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        edge_options.add_experimental_option('useAutomationExtension', False)
+        edge_options.add_argument("--no-sandbox")
+        edge_options.add_argument("--disable-dev-shm-usage")
+        for argument in BACKGROUND_TAB_ARGUMENTS:
+            edge_options.add_argument(argument)
+        for argument in get_profile(profile)["arguments"]:
+            edge_options.add_argument(argument)
+        user_data_dir = WebDriverFactory._user_data_dir("edge")
+        if user_data_dir:
+            edge_options.add_argument(f"--user-data-dir={user_data_dir}")
+
+        prefs = WebDriverFactory._prefs(disable_javascript, download_dir)
+        if prefs:
+            edge_options.add_experimental_option("prefs", prefs)
+        if get_profile(profile).get("mobile_emulation"):
+            edge_options.add_experimental_option("mobileEmulation", get_profile(profile)["mobile_emulation"])
+        edge_options.set_capability("ms:loggingPrefs", {"performance": "ALL"})
+        edge_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+        try:
+            service = EdgeService(executable_path=WebDriverFactory._driver_path("edge"))
+            driver = webdriver.Edge(service=service, options=edge_options)
+            driver.qa_network_events = True
+            attach_network_layer(driver, "Edge")
+            if not disable_javascript:
+                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            return driver
+        except Exception as e:
+            print(f"Failed to create Edge driver: {e}")
+            raise
+
+    @staticmethod
+    def _launch_firefox(disable_javascript=False, download_dir=None, profile=None):
+        """Start a new Firefox browser"""
+        firefox_options = FirefoxOptions()
+        firefox_options.set_preference("dom.webdriver.enabled", False)
+        for argument in get_profile(profile).get("firefox_arguments", []):
+            firefox_options.add_argument(argument)
+        user_data_dir = WebDriverFactory._user_data_dir("firefox")
+        if user_data_dir:
+            firefox_options.add_argument("-profile")
+            firefox_options.add_argument(user_data_dir)
+
+        for name, value in get_profile(profile).get("firefox_prefs", {}).items():
+            firefox_options.set_preference(name, value)
+        if disable_javascript:
+            firefox_options.set_preference("javascript.enabled", False)
+        if download_dir:
+            firefox_options.set_preference("browser.download.folderList", 2)
+            firefox_options.set_preference("browser.download.dir", download_dir)
+            firefox_options.set_preference("browser.download.useDownloadDir", True)
+            firefox_options.set_preference("browser.helperApps.neverAsk.saveToDisk",
+                                           "application/zip,application/json,application/octet-stream,text/csv")
+
+        try:
+            service = FirefoxService(executable_path=WebDriverFactory._driver_path("firefox"))
+            driver = webdriver.Firefox(service=service, options=firefox_options)
+            driver.qa_network_events = False  # no CDP performance log; readiness falls back to resource timing
+            if network_mode() != "off":
+                print(f"Firefox: Network {network_mode()} needs CDP Fetch, running against the live network")
+            if "--start-maximized" in get_profile(profile)["arguments"]:
+                driver.maximize_window()  # Firefox has no start-maximized switch
+            return driver
+        except Exception as e:
+            print(f"Failed to create Firefox driver: {e}")
+            raise
+
+    @staticmethod
+    def _driver_path(browser):
+        """Cached driver binary path, or None to let Selenium Manager resolve it at launch"""
+        try:
+            return resolve_driver_path(browser)
+        except Exception as e:
+            print(f"Driver resolution for {browser} failed, falling back to Selenium Manager: {e}")
+            return None
+
+    @staticmethod
+    def _user_data_dir(browser):
+        """Fresh profile folder under SELENIUM_USER_DATA_DIR (set per worker by common.parallel_runner), or None
+
+        Every launch gets its own folder because Chrome and Edge lock a user-data-dir while running.
+        """
+        base_dir = os.environ.get("SELENIUM_USER_DATA_DIR")
+        if not base_dir:
+            return None
+        os.makedirs(base_dir, exist_ok=True)
+        return tempfile.mkdtemp(prefix=f"{browser}-", dir=base_dir)
+
+    @staticmethod
+    def _prefs(disable_javascript, download_dir):
+        """Chromium preferences shared by Chrome and Edge"""
+        prefs = {}
+        if disable_javascript:
+            prefs["profile.managed_default_content_settings.javascript"] = 2
+        if download_dir:
+            prefs["download.default_directory"] = download_dir
+            prefs["download.prompt_for_download"] = False
+        return prefs
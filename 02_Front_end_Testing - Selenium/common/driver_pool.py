@@ -0,0 +1,149 @@
+import atexit
+import os
+from urllib.parse import urlsplit
+
+
+class DriverPool:
+    """Session-scoped pool of warm WebDriver instances shared by all test classes
+
+    Pool size is the number of idle drivers kept warm between tests (0 disables pooling),
+    max reuse is how many tests a single browser may serve before it is recycled.
+    Both can be set through SELENIUM_POOL_SIZE and SELENIUM_POOL_MAX_REUSE.
+    """
+
+    def __init__(self, size=None, max_reuse=None):
+        self.size = int(os.environ.get("SELENIUM_POOL_SIZE", 2)) if size is None else size
+        self.max_reuse = int(os.environ.get("SELENIUM_POOL_MAX_REUSE", 25)) if max_reuse is None else max_reuse
+        self.idle = []          # [(key, driver)] oldest first
+        self.entries = {}       # id(driver) -> {"key", "uses", "window_rect", "in_use"}
+        self.launches = 0
+        self.reuses = 0
+
+    @property
+    def enabled(self):
+        return self.size > 0
+
+    def acquire(self, key, launch):
+        """Return a warm driver for key, launching a new one through launch() if none is idle"""
+        for index, (idle_key, driver) in enumerate(self.idle):
+            if idle_key != key:
+                continue
+            del self.idle[index]
+            if self._is_alive(driver):
+                self.entries[id(driver)]["in_use"] = True
+                self.reuses += 1
+                return driver
+            self._discard(driver)
+            break
+
+        driver = launch()
+        self.launches += 1
+        try:
+            window_rect = driver.get_window_rect()
+        except Exception:
+            window_rect = None
+        self.entries[id(driver)] = {"key": key, "uses": 0, "window_rect": window_rect, "in_use": True}
+        return driver
+
+    def release(self, driver, browser_name=""):
+        """Reset driver and keep it warm, or quit it when pooling is off or its reuse budget is spent"""
+        entry = self.entries.get(id(driver))
+        if entry is None:
+            driver.quit()
+            return
+        if not entry["in_use"]:
+            return  # already released
+        entry["in_use"] = False
+        entry["uses"] += 1
+
+        if not self.enabled or entry["uses"] >= self.max_reuse:
+            self._discard(driver)
+            return
+
+        try:
+            reset_driver_state(driver, entry["window_rect"])
+        except Exception as e:
+            print(f"{browser_name}: Pooled driver reset failed, quitting it: {e}")
+            self._discard(driver)
+            return
+
+        self.idle.append((entry["key"], driver))
+        while len(self.idle) > self.size:
+            _, oldest = self.idle.pop(0)
+            self._discard(oldest)
+
+    def shutdown(self):
+        """Quit every idle driver"""
+        while self.idle:
+            _, driver = self.idle.pop()
+            self._discard(driver)
+        if self.launches:
+            print(f"Driver pool: {self.launches} launches, {self.reuses} reuses")
+
+    def _discard(self, driver):
+        self.entries.pop(id(driver), None)
+        if getattr(driver, "qa_network_layer", None):
+            driver.qa_network_layer.stop()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+
+def reset_driver_state(driver, window_rect=None):
+    """Bring a used driver back to a clean state: one tab, no cookies/storage/cache, original window size
+
+    Chrome and Edge clear the storage of every origin the test's tabs navigated to and reset
+    the page scale. Other browsers can only clear the storage of the documents open at reset time.
+    """
+    chromium = getattr(driver, "qa_network_events", False)  # Chrome and Edge: CDP available
+    origins = set()
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        _clear_page_state(driver, origins, chromium)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    _clear_page_state(driver, origins, chromium)
+
+    if chromium:
+        for cookie in driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]:
+            domain = cookie["domain"].lstrip(".")
+            origins.update((f"https://{domain}", f"http://{domain}"))
+        for origin in sorted(origins):
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+        driver.execute_cdp_cmd("Emulation.setPageScaleFactor", {"pageScaleFactor": 1})
+    driver.delete_all_cookies()
+
+    driver.get("about:blank")
+    if chromium:
+        driver.get_log("performance")  # drop events buffered by the previous test
+    if window_rect:
+        driver.set_window_rect(**window_rect)
+    else:
+        driver.maximize_window()
+
+
+def _clear_page_state(driver, origins, chromium):
+    """Clear storage of the current document; on Chromium also note every origin in the tab's history"""
+    driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+    if chromium:
+        for entry in driver.execute_cdp_cmd("Page.getNavigationHistory", {})["entries"]:
+            parts = urlsplit(entry["url"])
+            if parts.scheme in ("http", "https") and parts.netloc:
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+
+
+pool = DriverPool()
+atexit.register(pool.shutdown)
@@ -0,0 +1,141 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+# Where resolved driver paths are persisted between runs, keyed by "<browser>-<browser version>"
+CACHE_PATH = os.environ.get(
+    "SELENIUM_DRIVER_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "openai-qa", "drivers.json")
+)
+# SELENIUM_OFFLINE=1 never touches the network: only the cache, PATH and Selenium Manager's own cache are used
+OFFLINE = os.environ.get("SELENIUM_OFFLINE", "") not in ("", "0")
+
+BROWSERS = {
+    "chrome": {
+        "driver": "chromedriver",
+        "binaries": ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+                     "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"],
+        "registry": r"Software\Google\Chrome\BLBeacon",
+        "mirror": None,
+    },
+    "edge": {
+        "driver": "msedgedriver",
+        "binaries": ["microsoft-edge", "microsoft-edge-stable", "msedge",
+                     "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge"],
+        "registry": r"Software\Microsoft\Edge\BLBeacon",
+        "mirror": "https://msedgedriver.microsoft.com",
+    },
+    "firefox": {
+        "driver": "geckodriver",  # versioned independently of Firefox, so any geckodriver on PATH will do
+        "binaries": ["firefox", "firefox-esr", "/Applications/Firefox.app/Contents/MacOS/firefox"],
+        "registry": r"Software\Mozilla\Mozilla Firefox",
+        "mirror": None,
+    },
+}
+
+_resolved = {}
+
+
+def resolve_driver_path(browser):
+    """Path of the driver binary for browser ('chrome', 'edge' or 'firefox'), resolved once per process
+
+    Lookup order: in-process memo, on-disk cache for the installed browser version,
+    a matching driver on PATH, then Selenium Manager (offline when SELENIUM_OFFLINE=1).
+    """
+    if browser in _resolved:
+        return _resolved[browser]
+
+    version = detect_browser_version(browser)
+    key = f"{browser}-{version}"
+    cache = _load_cache()
+    path = cache.get(key)
+
+    if not path or not os.path.exists(path):
+        path = _locate_driver(browser, version)
+        cache[key] = path
+        _save_cache(cache)
+        print(f"Resolved {BROWSERS[browser]['driver']} for {browser} {version}: {path}")
+
+    _resolved[browser] = path
+    return path
+
+
+def detect_browser_version(browser):
+    """Installed browser version without any network access, or 'unknown'"""
+    info = BROWSERS[browser]
+    if sys.platform.startswith("win"):
+        try:
+            import winreg
+            if browser == "firefox":
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, info["registry"]) as key:
+                    return winreg.QueryValueEx(key, "CurrentVersion")[0].split(" ")[0]
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, info["registry"]) as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            return "unknown"
+
+    for binary in info["binaries"]:
+        executable = shutil.which(binary) or (binary if os.path.isfile(binary) else None)
+        if not executable:
+            continue
+        try:
+            output = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"\d+(\.\d+)+", output)
+        if match:
+            return match.group(0)
+    return "unknown"
+
+
+def _locate_driver(browser, version):
+    """Find a driver binary for the given browser version"""
+    info = BROWSERS[browser]
+
+    on_path = shutil.which(info["driver"])
+    if on_path and (browser == "firefox" or _same_major(_driver_version(on_path), version)):
+        return on_path
+
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+    args = ["--browser", {"edge": "MicrosoftEdge"}.get(browser, browser)]
+    if version != "unknown":
+        args += ["--browser-version", version.split(".")[0]]
+    if OFFLINE:
+        args.append("--offline")
+    elif info["mirror"]:
+        args += ["--driver-mirror-url", info["mirror"]]
+    return SeleniumManager().binary_paths(args)["driver_path"]
+
+
+def _driver_version(path):
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    match = re.search(r"\d+\.\d+\.\d+\.\d+", output)
+    return match.group(0) if match else "unknown"
+
+
+def _same_major(driver_version, browser_version):
+    if "unknown" in (driver_version, browser_version):
+        return browser_version == "unknown"
+    return driver_version.split(".")[0] == browser_version.split(".")[0]
+
+
+def _load_cache():
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    """Write the cache atomically so parallel workers never read a half-written file"""
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, CACHE_PATH)
@@ -0,0 +1,72 @@
+"""Condition waits that stand in for the helpers' fixed sleeps when QA_FAST_SLEEPS=1
+
+Each replacement waits for what the sleep was there for (page loaded and settled, new tab
+open, scroll finished) and is capped at the original sleep length, so a run in fast mode is
+never slower than a normal one. Without QA_FAST_SLEEPS the helpers sleep exactly as before.
+"""
+import os
+import time
+from selenium.common.exceptions import WebDriverException
+from common.instrumentation import condition_wait
+from common.readiness import wait_until_ready
+
+FAST_SLEEPS_ENV_VAR = "QA_FAST_SLEEPS"
+SETTLE_IDLE_MS = 300  # how long network and DOM must stay quiet to count as settled
+
+# Resolves once the element's position stops changing between animation frames (smooth scroll done)
+_SCROLL_SETTLED_SCRIPT = """
+var element = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var start = performance.now(), lastTop = null, stableFrames = 0;
+function frame() {
+    var top = element.getBoundingClientRect().top;
+    stableFrames = top === lastTop ? stableFrames + 1 : 0;
+    lastTop = top;
+    if (stableFrames >= 3 || performance.now() - start > timeoutMs) { done(stableFrames >= 3); return; }
+    requestAnimationFrame(frame);
+}
+requestAnimationFrame(frame);
+"""
+
+
+def fast_sleeps_enabled():
+    return os.environ.get(FAST_SLEEPS_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def pause(seconds, driver=None):
+    """time.sleep(seconds), or in fast mode wait at most that long for driver's page to load and settle
+
+    Without a driver there is nothing to wait for, so it always sleeps.
+    """
+    if not fast_sleeps_enabled() or driver is None:
+        time.sleep(seconds)
+        return
+    try:
+        wait_until_ready(driver, ("load", "network-idle", "dom-quiet"), timeout=seconds, idle_ms=SETTLE_IDLE_MS)
+    except WebDriverException:
+        pass  # e.g. an alert is open; the test's next step reports it
+
+
+def switch_to_new_window(driver, seconds, previous_count=1):
+    """Switch to the newest window and sleep, or in fast mode wait (at most seconds) for the tab and its page"""
+    if not fast_sleeps_enabled():
+        driver.switch_to.window(driver.window_handles[-1])
+        time.sleep(seconds)
+        return
+    start = time.perf_counter()
+    with condition_wait("new window", timeout=seconds):
+        while len(driver.window_handles) <= previous_count and time.perf_counter() - start < seconds:
+            time.sleep(0.05)
+    driver.switch_to.window(driver.window_handles[-1])
+    pause(max(0.0, seconds - (time.perf_counter() - start)), driver)
+
+
+def settle_scroll(driver, element, seconds):
+    """Sleep after scrolling element into view, or in fast mode wait (at most seconds) until the scroll is done"""
+    if not fast_sleeps_enabled():
+        time.sleep(seconds)
+        return
+    try:
+        driver.execute_async_script(_SCROLL_SETTLED_SCRIPT, element, seconds * 1000)
+    except WebDriverException:
+        pass
+
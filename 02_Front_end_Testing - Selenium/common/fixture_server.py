@@ -0,0 +1,240 @@
+"""Offline mirror of the openai.com pages the Selenium suites test
+
+Serves hand-maintained snapshots from fixtures/openai_site with the dynamic behaviour the helpers
+exercise: "Load more" pagination, sort/filter popovers, the API category, 404 pages, the search
+box and the Platform login form. Point the suites at it with OPENAI_QA_BASE_URL (see common.site_config).
+
+Usage (from the "02_Front_end_Testing - Selenium" folder):
+    python -m common.fixture_server [--host 127.0.0.1] [--port 8765]
+"""
+import argparse
+import html
+import json
+import mimetypes
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+SITE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'openai_site'))
+PAGE_SIZE = 12
+
+# path -> (page template, <title>, stories category shown on the page)
+PAGES = {
+    "/": ("home.html", "OpenAI", None),
+    "/about/": ("about.html", "About | OpenAI", None),
+    "/safety/": ("safety.html", "Safety & responsibility | OpenAI", None),
+    "/security-and-privacy/": ("security-and-privacy.html", "Security & privacy | OpenAI", None),
+    "/safety/evaluations-hub/": ("evaluations-hub.html", "Safety evaluations hub | OpenAI", None),
+    "/stories/": ("stories.html", "Stories | OpenAI", None),
+    "/stories/api/": ("stories.html", "API Stories | OpenAI", "api"),
+    "/search/": ("search.html", "Search | OpenAI", None),
+}
+DOWNLOADS = {
+    "/safety/evaluations-hub/download/": "safety-evaluations-hub.json",
+}
+SORTS = {
+    "newest": (lambda story: story["date"], True),
+    "oldest": (lambda story: story["date"], False),
+    "a-z": (lambda story: story["title"].lower(), False),
+}
+
+
+def _load_json(name):
+    with open(os.path.join(SITE_DIR, "data", name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read(*parts):
+    with open(os.path.join(SITE_DIR, *parts), encoding="utf-8") as f:
+        return f.read()
+
+
+class FixtureSite:
+    """Templates and data of the mirrored site, read once and rendered per request"""
+
+    def __init__(self):
+        self.stories = _load_json("stories.json")
+        self.articles = _load_json("articles.json")
+        self.layout = _read("pages", "layout.html")
+        self.templates = {}
+
+    def template(self, name):
+        if name not in self.templates:
+            self.templates[name] = _read("pages", name)
+        return self.templates[name]
+
+    def query_stories(self, category=None, sort="newest", filters=None, offset=0, limit=PAGE_SIZE):
+        """(page of stories, total matching) for the stories grid and its JSON endpoint"""
+        stories = [s for s in self.stories if not category or s["category"] == category]
+        for field, values in (filters or {}).items():
+            if values:
+                stories = [s for s in stories if s.get(field) in values]
+        key, reverse = SORTS.get(sort, SORTS["newest"])
+        stories = sorted(stories, key=key, reverse=reverse)
+        return stories[offset:offset + limit], len(stories)
+
+    def render_cards(self, stories):
+        card = self.template("story-card.html")
+        return "".join(card.replace("{{SLUG}}", s["slug"])
+                       .replace("{{TITLE}}", html.escape(s["title"]))
+                       .replace("{{DESCRIPTION}}", html.escape(s["description"]))
+                       .replace("{{CATEGORY}}", s["category"]) for s in stories)
+
+    def render(self, template, title, base_url, values=None):
+        values = dict(values or {})
+        content = self.template(template)
+        for name, value in values.items():
+            content = content.replace("{{" + name + "}}", value)
+        page = self.layout.replace("{{CONTENT}}", content).replace("{{TITLE}}", html.escape(title))
+        return page.replace("{{BASE_URL}}", base_url)
+
+    def render_stories_page(self, template, title, base_url, category):
+        stories, total = self.query_stories(category)
+        return self.render(template, title, base_url, {
+            "STORY_CARDS": self.render_cards(stories),
+            "CATEGORY": category or "",
+            "TOTAL": str(total),
+            "API_CURRENT": ' aria-current="page"' if category == "api" else "",
+            "ALL_CURRENT": "" if category else ' aria-current="page"',
+        })
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to pages, story/article templates, JSON data, downloads and static assets"""
+
+    protocol_version = "HTTP/1.1"
+    site = None  # FixtureSite, set by make_server()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path, query = url.path, parse_qs(url.query)
+        base_url = f"http://{self.headers.get('Host', '127.0.0.1')}"
+
+        if path.startswith("/assets/"):
+            return self._send_file("assets", path[len("/assets/"):])
+        if path == "/_data/stories":
+            return self._send_stories_json(query)
+        if path in DOWNLOADS:
+            return self._send_file("downloads", DOWNLOADS[path], attachment=True)
+        if path == "/platform/login":
+            return self._send(200, _read("pages", "login.html").replace("{{BASE_URL}}", base_url))
+
+        if not path.endswith("/") and self._page_exists(path + "/"):
+            return self._redirect(path + "/" + (f"?{url.query}" if url.query else ""))
+
+        if path in PAGES:
+            template, title, category = PAGES[path]
+            if template == "stories.html":
+                return self._send(200, self.site.render_stories_page(template, title, base_url, category))
+            query_text = query.get("q", [""])[0]
+            return self._send(200, self.site.render(template, title, base_url, {"QUERY": html.escape(query_text)}))
+
+        story = self._story_for(path)
+        if story:
+            return self._send(200, self.site.render("story.html", f"{story['title']} | OpenAI", base_url, {
+                "TITLE": html.escape(story["title"]),
+                "DESCRIPTION": html.escape(story["description"]),
+            }))
+        if path in self.site.articles:
+            article = self.site.articles[path]
+            return self._send(200, self.site.render("article.html", f"{article['title']} | OpenAI", base_url, {
+                "TITLE": html.escape(article["title"]),
+                "SUMMARY": html.escape(article["summary"]),
+            }))
+
+        self._send(404, self.site.render("404.html", "Page not found | OpenAI", base_url))
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def _page_exists(self, path):
+        return path in PAGES or path in self.site.articles or self._story_for(path) is not None
+
+    def _story_for(self, path):
+        parts = path.strip("/").split("/")
+        if len(parts) == 2 and parts[0] == "stories":
+            return next((s for s in self.site.stories if s["slug"] == parts[1]), None)
+        return None
+
+    def _send_stories_json(self, query):
+        def first(name, default=""):
+            return query.get(name, [default])[0]
+
+        try:
+            offset = max(0, int(first("offset", "0") or 0))
+            limit = max(0, int(first("limit", str(PAGE_SIZE)) or PAGE_SIZE))
+        except ValueError:
+            return self._send(400, "offset and limit must be integers", "text/plain")
+        filters = {field: set(query.get(field, [])) for field in ("industry", "company_size", "region")}
+        stories, total = self.site.query_stories(
+            first("category") or None, first("sort", "newest"), filters, offset, limit,
+        )
+        body = json.dumps({"html": self.site.render_cards(stories), "count": len(stories), "total": total})
+        self._send(200, body, "application/json")
+
+    def _send_file(self, folder, name, attachment=False):
+        folder_path = os.path.join(SITE_DIR, folder)
+        full_path = os.path.normpath(os.path.join(folder_path, name))
+        if not full_path.startswith(folder_path + os.sep) or not os.path.isfile(full_path):
+            return self._send(404, "Not found", "text/plain")
+        with open(full_path, "rb") as f:
+            body = f.read()
+        headers = {"Cache-Control": "public, max-age=3600"}
+        if attachment:
+            headers["Content-Disposition"] = f'attachment; filename="{os.path.basename(full_path)}"'
+        content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        self._send(200, body, content_type, headers)
+
+    def _redirect(self, location):
+        self._send(301, "", "text/plain", {"Location": location})
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # keep test output readable
+
+
+def make_server(host="127.0.0.1", port=0):
+    """Create (but do not start) a fixture server; port 0 picks a free port"""
+    handler = type("BoundFixtureRequestHandler", (FixtureRequestHandler,), {"site": FixtureSite()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_background_server(host="127.0.0.1", port=0):
+    """Serve the fixtures from a daemon thread of this process and return the base URL"""
+    server = make_server(host, port)
+    threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True).start()
+    url = f"http://{host}:{server.server_address[1]}"
+    print(f"Fixture server running at {url}")
+    return url
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port)
+    print(f"Serving openai.com fixtures at http://{args.host}:{args.port} "
+          f"(set OPENAI_QA_BASE_URL=http://{args.host}:{args.port})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
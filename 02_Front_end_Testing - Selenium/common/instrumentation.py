@@ -0,0 +1,410 @@
+"""Opt-in timing of everything a test spends time on, and a "where did the time go" report
+
+With SELENIUM_INSTRUMENT=1 every WebDriver command, navigation, WebDriverWait, time.sleep,
+helper call and test is written with its duration to <dir>/<worker>.jsonl (one file per
+process, so parallel workers never share a file). Events carry the running test and the
+innermost helper they happened in; sleeps also carry the suite/helper line that asked for them.
+SELENIUM_INSTRUMENT=sleeps only records sleeps and tests, as a cheap sleep-budget profile.
+Sleeps polled inside a WebDriverWait or a condition_wait() loop are marked in_wait and are
+not counted as hard sleeps.
+
+Settings (environment variables):
+    SELENIUM_INSTRUMENT      1 (everything) | sleeps (default: off)
+    SELENIUM_INSTRUMENT_DIR  output folder (default: instrumentation/ next to common/)
+
+Reports (from the "02_Front_end_Testing - Selenium" folder):
+    python -m common.instrumentation report [dir] [--top 15]   where the time went
+    python -m common.instrumentation sleeps [dir] [--top 15]   time slept per test and call site
+"""
+import argparse
+import contextlib
+import functools
+import glob
+import inspect
+import json
+import math
+import multiprocessing.util
+import os
+import sys
+import threading
+import time
+import unittest
+from collections import defaultdict
+
+ENABLED_ENV_VAR = "SELENIUM_INSTRUMENT"
+DIR_ENV_VAR = "SELENIUM_INSTRUMENT_DIR"
+DEFAULT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'instrumentation'))
+SELENIUM_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+COMMON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules whose public functions and helper-class static methods are timed as "helper" events
+HELPER_MODULES = (
+    "test_helpers",
+    "MilaS.helpers.element_helpers",
+    "Lana_Chovgan.Unittest.Helpers_OpenAI",
+    "common.readiness",
+    "common.locator_race",
+    "common.text_harvest",
+    "common.fast_sleeps",
+)
+KINDS = ("command", "navigation", "wait", "sleep", "helper", "test")
+
+_real_sleep = time.sleep
+_state = threading.local()  # .test, .helpers (stack of names), .waits (nesting depth)
+_installed = False
+_writer = None
+
+
+def instrument_mode():
+    """'all', 'sleeps' or None, from SELENIUM_INSTRUMENT"""
+    setting = os.environ.get(ENABLED_ENV_VAR, "").strip().lower()
+    if setting in ("1", "true", "yes", "on", "all"):
+        return "all"
+    return "sleeps" if setting == "sleeps" else None
+
+
+class EventWriter:
+    """Appends events to this process's JSONL file"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.worker = os.environ.get("QA_WORKER_ID") or f"pid{os.getpid()}"
+        self.path = os.path.join(directory, f"{self.worker}.jsonl")
+        self.file = None  # opened on the first event, so processes that only collect tests leave no file
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def write(self, kind, name, start, duration, ok=True, **extra):
+        helpers = getattr(_state, "helpers", None)
+        event = {
+            "ts": round(start, 6),
+            "kind": kind,
+            "name": name,
+            "duration": round(duration, 6),
+            "ok": ok,
+            "test": getattr(_state, "test", None),
+            "helper": helpers[-1] if helpers else None,
+            "in_wait": bool(getattr(_state, "waits", 0)),
+            "worker": self.worker,
+        }
+        event.update(extra)
+        with self.lock:
+            if self.closed:  # events after the exit flush (e.g. pool shutdown) are dropped
+                return
+            if self.file is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self.file = open(self.path, "a", encoding="utf-8", buffering=1 << 16)
+            self.file.write(json.dumps(event) + "\n")
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            if self.file is not None:
+                self.file.close()
+
+
+def _timed(kind, name, call, **extra):
+    start = time.time()
+    began = time.perf_counter()
+    ok = True
+    try:
+        return call()
+    except BaseException:
+        ok = False
+        raise
+    finally:
+        _writer.write(kind, name, start, time.perf_counter() - began, ok, **extra)
+
+
+@contextlib.contextmanager
+def condition_wait(name, **extra):
+    """Mark a polling loop as a wait: its sleeps count as waiting, and in full mode it is timed as a wait"""
+    if not _installed:
+        yield
+        return
+    _state.waits = getattr(_state, "waits", 0) + 1
+    start = time.time()
+    began = time.perf_counter()
+    ok = True
+    try:
+        yield
+    except BaseException:
+        ok = False
+        raise
+    finally:
+        _state.waits -= 1
+        if _installed == "all":
+            _writer.write("wait", name, start, time.perf_counter() - began, ok, **extra)
+
+
+def install():
+    """Patch time.sleep, WebDriverWait and unittest test runs; a no-op unless SELENIUM_INSTRUMENT is set"""
+    global _installed, _writer
+    mode = instrument_mode()
+    if _installed or not mode:
+        return False
+    _installed = mode
+    _writer = EventWriter(os.environ.get(DIR_ENV_VAR) or DEFAULT_DIR)
+    multiprocessing.util.Finalize(None, _writer.close, exitpriority=30)
+
+    def sleep(seconds):
+        _timed("sleep", f"{seconds}s", lambda: _real_sleep(seconds), seconds=seconds, site=_call_site())
+    time.sleep = sleep
+
+    original_run = unittest.TestCase.run
+
+    def run(self, result=None):
+        _state.test = self.id()
+        try:
+            return _timed("test", self.id(), lambda: original_run(self, result))
+        finally:
+            _state.test = None
+    unittest.TestCase.run = run
+
+    from selenium.webdriver.support.wait import WebDriverWait
+    for method_name in ("until", "until_not"):
+        original = getattr(WebDriverWait, method_name)
+
+        def wait(self, method, message="", _original=original, _name=method_name):
+            with condition_wait(f"{_name} {_describe(method)}", timeout=getattr(self, "_timeout", None)):
+                return _original(self, method, message)
+        setattr(WebDriverWait, method_name, wait)
+    if mode == "sleeps":
+        return True
+    instrument_helpers()
+    return True
+
+
+def instrument_driver(driver):
+    """Time every command driver sends; 'get' is recorded as a navigation"""
+    if _installed != "all" or getattr(driver, "qa_instrumented", False):
+        return driver
+    executor = driver.command_executor
+    original_execute = executor.execute
+
+    def execute(command, params):
+        if command == "get":
+            return _timed("navigation", params.get("url", ""), lambda: original_execute(command, params))
+        return _timed("command", command, lambda: original_execute(command, params))
+    executor.execute = execute
+    driver.qa_instrumented = True
+    return driver
+
+
+def instrument_helpers():
+    """Wrap the helper functions of every already imported HELPER_MODULES module (safe to call repeatedly)"""
+    if _installed != "all":
+        return
+    wrapped = {}  # original function -> wrapper, so names imported into other helper modules match too
+    modules = [module for name, module in list(sys.modules.items()) if module and name.endswith(HELPER_MODULES)]
+    for module in modules:
+        for attr_name, value in list(vars(module).items()):
+            if inspect.isfunction(value) and value.__module__ == module.__name__ and not attr_name.startswith("_"):
+                setattr(module, attr_name, wrapped.setdefault(value, _helper_wrapper(value, attr_name)))
+            elif inspect.isclass(value) and value.__module__ == module.__name__:
+                for method_name, member in list(vars(value).items()):
+                    if isinstance(member, staticmethod) and not method_name.startswith("__"):
+                        function = member.__func__
+                        wrapper = wrapped.setdefault(function, _helper_wrapper(function, f"{value.__name__}.{method_name}"))
+                        setattr(value, method_name, staticmethod(wrapper))
+    for module in modules:
+        for attr_name, value in list(vars(module).items()):
+            if inspect.isfunction(value) and value in wrapped:
+                setattr(module, attr_name, wrapped[value])
+
+
+def _helper_wrapper(function, name):
+    if getattr(function, "qa_instrumented", False):
+        return function
+
+    @functools.wraps(function)
+    def helper(*args, **kwargs):
+        stack = _state.__dict__.setdefault("helpers", [])
+        stack.append(name)
+        try:
+            return _timed("helper", name, lambda: function(*args, **kwargs))
+        finally:
+            stack.pop()
+    helper.qa_instrumented = True
+    return helper
+
+
+def _call_site():
+    """'file:line in function' of the suite or helper code behind a sleep, skipping common/ and libraries"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(SELENIUM_DIR) and not filename.startswith(COMMON_DIR):
+            return f"{os.path.relpath(filename, SELENIUM_DIR)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def _describe(method):
+    name = getattr(method, "__qualname__", None) or type(method).__name__
+    return name.split(".<locals>")[0]
+
+
+# ---------------------------------------------------------------------------------------------
+# Report
+
+
+def load_events(directory):
+    events = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.jsonl"))):
+        with open(path, encoding="utf-8") as f:
+            events.extend(json.loads(line) for line in f if line.strip())
+    return events
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of values (0 < fraction <= 1)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(events, top=15):
+    """Aggregates for the report: per kind, per test, per helper and the biggest single time sinks
+
+    Commands and sleeps issued while a WebDriverWait polls are counted in the wait, not again on their own.
+    """
+    exclusive = [e for e in events if not e.get("in_wait") or e["kind"] in ("wait", "helper", "test")]
+    by_kind = defaultdict(list)
+    for event in exclusive:
+        by_kind[event["kind"]].append(event["duration"])
+
+    tests = {}
+    for event in events:
+        if event["kind"] == "test":
+            tests[event["name"]] = {"total": event["duration"], "ok": event["ok"],
+                                    **{kind: 0.0 for kind in ("navigation", "command", "wait", "sleep")}}
+    for event in exclusive:
+        if event["test"] in tests and event["kind"] in ("navigation", "command", "wait", "sleep"):
+            tests[event["test"]][event["kind"]] += event["duration"]
+
+    helpers = defaultdict(lambda: {"durations": [], "sleep": 0.0, "wait": 0.0, "command": 0.0, "navigation": 0.0})
+    for event in exclusive:
+        if event["kind"] == "helper":
+            helpers[event["name"]]["durations"].append(event["duration"])
+        elif event["helper"] and event["kind"] in ("sleep", "wait", "command", "navigation"):
+            helpers[event["helper"]][event["kind"]] += event["duration"]
+
+    sinks = defaultdict(list)
+    for event in exclusive:
+        if event["kind"] in ("navigation", "command", "wait", "sleep"):
+            sinks[(event["kind"], event["name"] if event["kind"] != "navigation" else "get")].append(event["duration"])
+
+    return {
+        "kinds": {kind: {"count": len(values), "total": sum(values)} for kind, values in by_kind.items()},
+        "tests": dict(sorted(tests.items(), key=lambda item: -item[1]["total"])),
+        "helpers": dict(sorted(((name, {
+            "calls": len(data["durations"]), "total": sum(data["durations"]),
+            "p50": percentile(data["durations"], 0.5), "p95": percentile(data["durations"], 0.95),
+            "max": max(data["durations"], default=0.0),
+            "sleep": data["sleep"], "wait": data["wait"], "command": data["command"] + data["navigation"],
+        }) for name, data in helpers.items() if data["durations"]), key=lambda item: -item[1]["total"])),
+        "sinks": [{"kind": kind, "name": name, "count": len(values), "total": sum(values),
+                   "p50": percentile(values, 0.5), "p95": percentile(values, 0.95)}
+                  for (kind, name), values in sorted(sinks.items(), key=lambda item: -sum(item[1]))[:top]],
+        "slowest": sorted((e for e in exclusive if e["kind"] in ("navigation", "wait", "sleep")),
+                          key=lambda e: -e["duration"])[:top],
+    }
+
+
+def print_report(summary, top=15):
+    print("Time by kind")
+    for kind in KINDS:
+        if kind in summary["kinds"]:
+            data = summary["kinds"][kind]
+            print(f"  {kind:<11} {data['count']:>7} events {data['total']:>9.1f}s")
+
+    print(f"\nTests (slowest {top}): total = navigation + commands + waits + sleeps + Python")
+    print(f"  {'total':>8} {'nav':>7} {'cmd':>7} {'wait':>7} {'sleep':>7}  test")
+    for name, data in list(summary["tests"].items())[:top]:
+        print(f"  {data['total']:>7.1f}s {data['navigation']:>6.1f}s {data['command']:>6.1f}s "
+              f"{data['wait']:>6.1f}s {data['sleep']:>6.1f}s  {name}{'' if data['ok'] else ' (failed)'}")
+
+    print(f"\nHelpers (top {top} by total time)")
+    print(f"  {'calls':>6} {'total':>8} {'p50':>7} {'p95':>7} {'max':>7} {'sleep':>7} {'wait':>7} {'cmd':>7}  helper")
+    for name, data in list(summary["helpers"].items())[:top]:
+        print(f"  {data['calls']:>6} {data['total']:>7.1f}s {data['p50']:>6.2f}s {data['p95']:>6.2f}s "
+              f"{data['max']:>6.2f}s {data['sleep']:>6.1f}s {data['wait']:>6.1f}s {data['command']:>6.1f}s  {name}")
+
+    print(f"\nTop {top} time sinks")
+    for sink in summary["sinks"]:
+        print(f"  {sink['total']:>7.1f}s {sink['count']:>6}x  p50 {sink['p50']:.3f}s  p95 {sink['p95']:.3f}s  "
+              f"{sink['kind']}: {sink['name']}")
+
+    print("\nSlowest single navigations, waits and sleeps")
+    for event in summary["slowest"]:
+        where = event["helper"] or "test body"
+        print(f"  {event['duration']:>7.2f}s  {event['kind']}: {event['name']}  [{where}] {event['test'] or ''}")
+
+
+def summarize_sleeps(events):
+    """Seconds slept per test and per call site; sleeps polled inside a wait are left out"""
+    sleeps = [e for e in events if e["kind"] == "sleep" and not e.get("in_wait")]
+    tests = {e["name"]: {"total": e["duration"], "slept": 0.0, "count": 0} for e in events if e["kind"] == "test"}
+    sites = defaultdict(lambda: {"slept": 0.0, "count": 0, "tests": set()})
+    for event in sleeps:
+        if event["test"] in tests:
+            tests[event["test"]]["slept"] += event["duration"]
+            tests[event["test"]]["count"] += 1
+        site = sites[event.get("site") or "unknown"]
+        site["slept"] += event["duration"]
+        site["count"] += 1
+        site["tests"].add(event["test"])
+    return {
+        "slept": sum(e["duration"] for e in sleeps),
+        "run": sum(test["total"] for test in tests.values()),
+        "tests": dict(sorted(tests.items(), key=lambda item: -item[1]["slept"])),
+        "sites": {name: {"slept": data["slept"], "count": data["count"], "tests": len(data["tests"])}
+                  for name, data in sorted(sites.items(), key=lambda item: -item[1]["slept"])},
+    }
+
+
+def print_sleep_report(summary, top=15):
+    share = summary["slept"] / summary["run"] * 100 if summary["run"] else 0
+    print(f"Slept {summary['slept']:.1f}s of {summary['run']:.1f}s spent in tests ({share:.0f}%)")
+    print(f"\nTests (top {top} by time slept)")
+    print(f"  {'slept':>8} {'of':>8} {'sleeps':>7}  test")
+    for name, data in list(summary["tests"].items())[:top]:
+        print(f"  {data['slept']:>7.1f}s {data['total']:>7.1f}s {data['count']:>7}  {name}")
+    print(f"\nCall sites (top {top} by time slept)")
+    print(f"  {'slept':>8} {'sleeps':>7} {'tests':>6}  site")
+    for name, data in list(summary["sites"].items())[:top]:
+        print(f"  {data['slept']:>7.1f}s {data['count']:>7} {data['tests']:>6}  {name}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("report", "where the time went, from recorded JSONL files"),
+                            ("sleeps", "time slept per test and per call site")):
+        report = subparsers.add_parser(name, help=help_text)
+        report.add_argument("directory", nargs="?", default=os.environ.get(DIR_ENV_VAR) or DEFAULT_DIR)
+        report.add_argument("--top", type=int, default=15)
+        report.add_argument("--json", help="also write the aggregates as JSON here")
+    args = parser.parse_args(argv)
+
+    events = load_events(args.directory)
+    if not events:
+        print(f"No instrumentation events in {args.directory} (run the suites with {ENABLED_ENV_VAR}=1)")
+        return 1
+    print(f"{len(events)} events from {args.directory}\n")
+    if args.command == "sleeps":
+        summary = summarize_sleeps(events)
+        print_sleep_report(summary, args.top)
+    else:
+        summary = summarize(events, args.top)
+        print_report(summary, args.top)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+import os
+
+# Chromium command-line switches applied on top of the factory's base arguments.
+# Chrome and Edge share the same switches, so one table serves both browsers;
+# Firefox gets its own equivalents in "firefox_arguments" / "firefox_prefs".
+# "mobile_emulation" is passed to Chrome/Edge as the mobileEmulation option.
+MOBILE_USER_AGENT = ("Mozilla/5.0 (Linux; Android 14; Pixel 7) AppleWebKit/537.36 (KHTML, like Gecko) "
+                     "Chrome/124.0.0.0 Mobile Safari/537.36")
+
+# Added for every Chromium profile: tabs in the background (common.tab_navigator) keep full-speed
+# timers and renderer priority instead of being throttled while another tab is in front
+BACKGROUND_TAB_ARGUMENTS = [
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+]
+
+PROFILES = {
+    "default": {
+        "arguments": ["--start-maximized"],
+        "firefox_arguments": [],
+    },
+    "headed-debug": {
+        "arguments": ["--start-maximized", "--auto-open-devtools-for-tabs", "--enable-logging", "--v=1"],
+        "firefox_arguments": ["-devtools"],
+    },
+    "headless": {
+        "arguments": [
+            "--headless=new",
+            "--window-size=1920,1080",
+            "--disable-gpu",
+            "--hide-scrollbars",
+            "--mute-audio",
+            "--renderer-process-limit=4",
+            "--disable-features=Translate,OptimizationHints,MediaRouter",
+        ],
+        "firefox_arguments": ["-headless", "--width=1920", "--height=1080"],
+    },
+    "headless-lowmem": {
+        "arguments": [
+            "--headless=new",
+            "--window-size=1366,768",
+            "--disable-gpu",
+            "--hide-scrollbars",
+            "--mute-audio",
+            "--renderer-process-limit=1",
+            "--disable-site-isolation-trials",
+            "--disable-features=site-per-process,Translate,OptimizationHints,MediaRouter",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--disk-cache-size=33554432",
+            "--js-flags=--max-old-space-size=512",
+        ],
+        "firefox_arguments": ["-headless", "--width=1366", "--height=768"],
+        "firefox_prefs": {"browser.cache.disk.enable": False, "dom.ipc.processCount": 1},
+    },
+    "mobile": {
+        "arguments": ["--window-size=430,932", "--hide-scrollbars"],
+        "mobile_emulation": {
+            "deviceMetrics": {"width": 412, "height": 915, "pixelRatio": 2.625, "touch": True},
+            "userAgent": MOBILE_USER_AGENT,
+        },
+        "firefox_arguments": ["--width=412", "--height=915"],
+        "firefox_prefs": {"general.useragent.override": MOBILE_USER_AGENT},
+    },
+}
+
+PROFILE_ENV_VAR = "SELENIUM_PROFILE"
+
+
+def get_profile_name():
+    """Name of the launch profile selected for this run"""
+    name = os.environ.get(PROFILE_ENV_VAR, "default")
+    if name not in PROFILES:
+        raise ValueError(f"Unknown launch profile '{name}', expected one of: {', '.join(PROFILES)}")
+    return name
+
+
+def get_profile(name=None):
+    """Launch profile settings by name (defaults to the selected profile)"""
+    return PROFILES[name or get_profile_name()]
+
+
+def apply_cli_profile(argv):
+    """Take --profile NAME / --profile=NAME out of argv and select it for this run
+
+    Call this before unittest.main() so the flag does not reach unittest's own parser.
+    """
+    for index, arg in enumerate(list(argv)):
+        if arg == "--profile" and index + 1 < len(argv):
+            name = argv[index + 1]
+            del argv[index:index + 2]
+        elif arg.startswith("--profile="):
+            name = arg.split("=", 1)[1]
+            del argv[index]
+        else:
+            continue
+        if name not in PROFILES:
+            raise ValueError(f"Unknown launch profile '{name}', expected one of: {', '.join(PROFILES)}")
+        os.environ[PROFILE_ENV_VAR] = name
+        return name
+    return get_profile_name()
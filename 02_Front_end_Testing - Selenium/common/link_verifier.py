@@ -0,0 +1,137 @@
+"""HTTP-first verification of the pages links lead to
+
+The hrefs of all links are read from the page in one script. The targets are fetched in
+parallel over pooled HTTP connections, carrying the browser's cookies and user agent. Each
+target's status, final URL and heading text are then checked in the static HTML with lxml.
+Only targets the static HTML cannot confirm are checked in the browser: a non-200 answer
+such as bot protection, a different final URL, or a heading that only JavaScript renders.
+Those are loaded together in background tabs (common.tab_navigator). Links without an href
+are clicked.
+
+SELENIUM_LINK_CHECK=browser skips the HTTP pass and verifies every link by clicking it, as
+before. Without lxml installed the HTTP pass still checks status and final URL, and leaves
+the headings to the browser.
+"""
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+import urllib3
+from common.tab_navigator import TabNavigator
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # lxml is optional: without it headings are always checked in the browser
+    lxml_html = None
+
+LINK_CHECK_ENV_VAR = "SELENIUM_LINK_CHECK"
+MAX_WORKERS = 8
+BROKEN_STATUSES = (404, 410)  # a browser would show the same error page, no need to click
+
+# One link to verify: the link, the URL fragment and heading (xpath + text) expected on its target
+LinkCheck = namedtuple("LinkCheck", "click_xpath url_contains text_xpath expected_text description")
+# Outcome of one LinkCheck; via is "http", "tab" or "browser" (clicked), detail says why a link failed or fell back
+LinkResult = namedtuple("LinkResult", "check href ok via detail")
+
+# href of the first element each xpath matches (or of the link around it), plus the user agent
+_COLLECT_SCRIPT = """
+var xpaths = arguments[0], hrefs = [];
+for (var i = 0; i < xpaths.length; i++) {
+    var el = null;
+    try {
+        el = document.evaluate(xpaths[i], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } catch (e) {}
+    var link = el && el.closest ? el.closest('a[href]') : null;
+    hrefs.push(link ? link.href : null);
+}
+return {hrefs: hrefs, userAgent: navigator.userAgent, host: location.host};
+"""
+
+_http = None
+
+
+def link_check_mode():
+    return "browser" if os.environ.get(LINK_CHECK_ENV_VAR, "").strip().lower() == "browser" else "http"
+
+
+def verify_links(driver, checks, fallback, timeout=10, check_page=None):
+    """LinkResult for every LinkCheck, over HTTP where possible and in the browser otherwise
+
+    Links the HTTP pass cannot confirm are opened in tabs and check_page(check) -> bool runs
+    on each loaded target. fallback(check) -> bool must click the link, check the target
+    and return the browser to the current page. It is used for links without an href, for
+    every link when check_page is None, and for all links with SELENIUM_LINK_CHECK=browser.
+    """
+    start = time.perf_counter()
+    checks = [LinkCheck(*check) for check in checks]
+    if link_check_mode() == "browser":
+        return [LinkResult(check, None, fallback(check), "browser", "SELENIUM_LINK_CHECK=browser") for check in checks]
+
+    page = driver.execute_script(_COLLECT_SCRIPT, [check.click_xpath for check in checks])
+    cookies = "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in driver.get_cookies())
+    _pool()  # created once, before the worker threads share it
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(checks)) or 1) as executor:
+        verdicts = list(executor.map(
+            lambda args: _check_static(*args, _headers_for(args[1], page, cookies), timeout), zip(checks, page["hrefs"])))
+
+    in_tabs = [index for index, (href, (ok, _)) in enumerate(zip(page["hrefs"], verdicts))
+               if ok is None and href and check_page is not None]
+    tab_results = dict(zip(in_tabs, TabNavigator(driver, timeout * 2).visit(
+        [page["hrefs"][index] for index in in_tabs], lambda position, url: check_page(checks[in_tabs[position]]))))
+
+    results = []
+    for index, (check, href, (ok, detail)) in enumerate(zip(checks, page["hrefs"], verdicts)):
+        if index in tab_results:
+            results.append(LinkResult(check, href, tab_results[index], "tab", detail))
+        elif ok is None:
+            results.append(LinkResult(check, href, fallback(check), "browser", detail))
+        else:
+            results.append(LinkResult(check, href, ok, "http", detail))
+    in_browser = sum(1 for result in results if result.via != "http")
+    print(f"Verified {len(results)} links in {time.perf_counter() - start:.1f}s: "
+          f"{len(results) - in_browser} over HTTP, {len(tab_results)} in tabs, {in_browser - len(tab_results)} by clicking")
+    return results
+
+
+def _check_static(check, href, headers, timeout):
+    """(True/False, detail) when the static target decides the check, (None, reason) when the browser must"""
+    if not href or not href.startswith(("http://", "https://")):
+        return None, f"no navigable href ({href!r})"
+    try:
+        response = _pool().request("GET", href, headers=headers, redirect=True,
+                                   retries=urllib3.Retry(total=5, connect=1, read=0, status=0),
+                                   timeout=urllib3.Timeout(total=timeout))
+    except urllib3.exceptions.HTTPError as error:
+        return None, f"HTTP fetch failed: {type(error).__name__}"
+    final_url = urljoin(href, response.url or "")  # urllib3 reports the path of the last request
+    if response.status in BROKEN_STATUSES:
+        return False, f"{final_url} answered HTTP {response.status}"
+    if response.status != 200:
+        return None, f"HTTP {response.status}"
+    if check.url_contains not in final_url:
+        return None, f"landed on {final_url}"
+    if "html" not in response.headers.get("Content-Type", ""):
+        return None, f"not an HTML page ({response.headers.get('Content-Type')})"
+    if lxml_html is None:
+        return None, "lxml not installed, heading checked in the browser"
+    elements = lxml_html.document_fromstring(response.data or b"<html></html>").xpath(check.text_xpath)
+    texts = [" ".join(element.text_content().split()) for element in elements if hasattr(element, "text_content")]
+    if not any(check.expected_text in text for text in texts):
+        return None, "heading not in the static HTML" if not texts else f"static heading is '{texts[0]}'"
+    return True, final_url
+
+
+def _headers_for(href, page, cookies):
+    """Browser-like request headers; the session cookies only go to the host of the current page"""
+    headers = {"User-Agent": page["userAgent"], "Accept": "text/html,application/xhtml+xml,*/*;q=0.8"}
+    if cookies and href and urlsplit(href).netloc == page["host"]:
+        headers["Cookie"] = cookies
+    return headers
+
+
+def _pool():
+    global _http
+    if _http is None:
+        _http = urllib3.PoolManager(num_pools=4, maxsize=MAX_WORKERS)
+    return _http
@@ -0,0 +1,136 @@
+import time
+from selenium.webdriver.common.by import By
+
+# Conditions an element must satisfy to count as a match
+CONDITIONS = ("present", "visible", "clickable", "visible-text")
+
+# How the winner is picked once at least one strategy matches:
+#   "first" - highest-priority (earliest in the list) strategy that matches
+#   "best"  - strategy with the most matching elements, ties broken by priority
+#   "all"   - every strategy that matches, e.g. to collect options from several selectors
+MODES = ("first", "best", "all")
+
+# In-page counterparts of (By, selector) locators, shared with common.text_harvest:
+# query(['css'|'xpath'|'id', value]) -> elements, visible(element) -> bool
+QUERY_FN = """
+function query(strategy) {
+    var how = strategy[0], what = strategy[1];
+    try {
+        if (how === 'xpath') {
+            var snapshot = document.evaluate(what, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                if (snapshot.snapshotItem(i).nodeType === 1) nodes.push(snapshot.snapshotItem(i));
+            }
+            return nodes;
+        }
+        if (how === 'id') { var el = document.getElementById(what); return el ? [el] : []; }
+        return Array.prototype.slice.call(document.querySelectorAll(what));
+    } catch (e) {
+        return [];  // invalid selector for this document; the other strategies still count
+    }
+}
+function visible(el) {
+    var rect = el.getBoundingClientRect(), style = getComputedStyle(el);
+    return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+"""
+
+# Polls every strategy together on each DOM mutation (plus a 100 ms safety interval) and
+# resolves the first time any of them matches, or at the timeout with no matches.
+_RACE_SCRIPT = QUERY_FN + """
+var strategies = arguments[0], condition = arguments[1], mode = arguments[2];
+var timeoutMs = arguments[3], limit = arguments[4];
+var done = arguments[arguments.length - 1];
+var start = performance.now(), finished = false, observer = null, timer = null;
+
+function accepts(el) {
+    if (condition === 'present') return true;
+    if (!visible(el)) return false;
+    if (condition === 'clickable') return !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+    if (condition === 'visible-text') return (el.innerText || '').trim().length > 0;
+    return true;
+}
+function check() {
+    if (finished) return;
+    var matches = [];
+    for (var i = 0; i < strategies.length; i++) {
+        var found = query(strategies[i]).filter(accepts);
+        if (!found.length) continue;
+        matches.push([i, limit ? found.slice(0, limit) : found]);
+        if (mode === 'first') break;
+    }
+    if (!matches.length && performance.now() - start < timeoutMs) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    if (timer) clearInterval(timer);
+    done({matches: matches, elapsed: (performance.now() - start) / 1000});
+}
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {childList: true, subtree: true, attributes: true});
+    timer = setInterval(check, 100);
+}
+"""
+
+_STRATEGIES = {
+    By.CSS_SELECTOR: lambda value: ("css", value),
+    By.XPATH: lambda value: ("xpath", value),
+    By.TAG_NAME: lambda value: ("css", value),
+    By.ID: lambda value: ("id", value),
+    By.CLASS_NAME: lambda value: ("css", "." + value),
+    By.NAME: lambda value: ("css", f'[name="{value}"]'),
+}
+
+
+def to_strategies(locators):
+    """(By, selector) locators as the [how, value] pairs QUERY_FN understands"""
+    strategies = []
+    for by_type, selector in locators:
+        if by_type not in _STRATEGIES:
+            raise ValueError(f"Locator strategy '{by_type}' cannot be evaluated in the page")
+        strategies.append(_STRATEGIES[by_type](selector))
+    return strategies
+
+
+class RaceResult:
+    """Winning locator and its elements; truthy when any strategy matched"""
+
+    def __init__(self, locators, matches, mode, elapsed):
+        self.matches = [(locators[index], elements) for index, elements in matches]
+        self.elapsed = elapsed
+        if mode == "best" and self.matches:
+            winner = max(self.matches, key=lambda match: len(match[1]))
+        else:
+            winner = self.matches[0] if self.matches else (None, [])
+        self.locator, self.elements = winner
+        if mode == "all":
+            self.elements = [element for _, elements in self.matches for element in elements]
+
+    @property
+    def selector(self):
+        return self.locator[1] if self.locator else None
+
+    def __bool__(self):
+        return bool(self.elements)
+
+    def __repr__(self):
+        return f"RaceResult({self.selector!r}, {len(self.elements)} elements, {self.elapsed:.3f}s)"
+
+
+def race_locators(driver, locators, timeout=5, condition="present", mode="first", limit=None):
+    """Poll all (By, selector) locators together in one in-page script and return a RaceResult
+
+    The worst case is bounded by a single timeout no matter how many fallbacks are listed.
+    """
+    if condition not in CONDITIONS:
+        raise ValueError(f"Unknown condition '{condition}', expected one of: {', '.join(CONDITIONS)}")
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of: {', '.join(MODES)}")
+    strategies = to_strategies(locators)
+    if timeout > 25:
+        driver.set_script_timeout(timeout + 5)
+    start = time.perf_counter()
+    result = driver.execute_async_script(_RACE_SCRIPT, strategies, condition, mode, timeout * 1000, limit)
+    return RaceResult(list(locators), result["matches"], mode, time.perf_counter() - start)
@@ -0,0 +1,279 @@
+"""Record the browser's network traffic to disk once, then replay it instead of refetching openai.com
+
+Works through CDP Fetch interception (Chrome and Edge): every request the page makes is paused,
+and in record mode its response is saved before the browser gets it, while in replay mode the
+response is served straight from the recording. Recordings are HAR-like gzip JSON files, one per
+process/worker, in the store folder; replay loads all of them.
+
+Settings (environment variables):
+    SELENIUM_NETWORK_MODE         off (default) | record | replay
+    SELENIUM_NETWORK_STORE        recordings folder (default: recordings/ next to common/)
+    SELENIUM_REPLAY_LATENCY_MS    extra delay per replayed response (default 0)
+    SELENIUM_REPLAY_BANDWIDTH_KBPS  simulated download speed for replayed bodies (default: unlimited)
+    SELENIUM_REPLAY_UNMATCHED     report (default: let the request through, list it at exit) | fail
+"""
+import base64
+import glob
+import gzip
+import hashlib
+import json
+import multiprocessing.util
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urldefrag
+
+MODE_ENV_VAR = "SELENIUM_NETWORK_MODE"
+STORE_ENV_VAR = "SELENIUM_NETWORK_STORE"
+LATENCY_ENV_VAR = "SELENIUM_REPLAY_LATENCY_MS"
+BANDWIDTH_ENV_VAR = "SELENIUM_REPLAY_BANDWIDTH_KBPS"
+UNMATCHED_ENV_VAR = "SELENIUM_REPLAY_UNMATCHED"
+
+MODES = ("off", "record", "replay")
+DEFAULT_STORE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'recordings'))
+# Headers that describe the original transfer, not the body we hand back
+DROPPED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def network_mode():
+    mode = os.environ.get(MODE_ENV_VAR, "off").strip().lower() or "off"
+    if mode not in MODES:
+        raise ValueError(f"Unknown network mode '{mode}', expected one of: {', '.join(MODES)}")
+    return mode
+
+
+def store_dir():
+    return os.environ.get(STORE_ENV_VAR) or DEFAULT_STORE_DIR
+
+
+def request_key(method, url, post_data=None):
+    """What a recorded entry is matched on: method, URL without fragment and a hash of the request body"""
+    key = f"{method.upper()} {urldefrag(url)[0]}"
+    if post_data:
+        key += " #" + hashlib.sha1(post_data.encode("utf-8")).hexdigest()[:12]
+    return key
+
+
+class HarStore:
+    """HAR-like recordings of one folder: entries in memory, matched by request_key()"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.entries = []    # new entries recorded by this process
+        self.by_key = {}     # request key -> [entries], in recording order
+        self.served = {}     # request key -> times served, to replay repeated requests in order
+        self.unmatched = []  # [(method, url)] replay misses
+        self.lock = threading.Lock()
+
+    def load(self):
+        for path in sorted(glob.glob(os.path.join(self.directory, "*.har.gz"))):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for entry in json.load(f)["log"]["entries"]:
+                    self._index(entry)
+        return self
+
+    def add(self, entry):
+        with self.lock:
+            self.entries.append(entry)
+            self._index(entry)
+
+    def match(self, method, url, post_data=None):
+        """Recorded entry for a request, or None; repeats of a request get the recordings in turn"""
+        key = request_key(method, url, post_data)
+        with self.lock:
+            candidates = self.by_key.get(key)
+            if not candidates:
+                self.unmatched.append((method, url))
+                return None
+            index = self.served.get(key, 0)
+            self.served[key] = index + 1
+            return candidates[min(index, len(candidates) - 1)]
+
+    def save(self, name):
+        """Write this process's recorded entries to <directory>/<name>.har.gz"""
+        with self.lock:
+            entries = list(self.entries)
+        if not entries:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{name}.har.gz")
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+            json.dump({"log": {"version": "1.2", "creator": {"name": "common.network_replay", "version": "1"},
+                               "entries": entries}}, f)
+        os.replace(temp_path, path)
+        return path
+
+    def _index(self, entry):
+        request = entry["request"]
+        key = request_key(request["method"], request["url"], request.get("postData", {}).get("text"))
+        self.by_key.setdefault(key, []).append(entry)
+
+
+class NetworkLayer:
+    """Fetch interception of a driver's main tab, running in a background thread on its own CDP connection"""
+
+    def __init__(self, driver, mode, store, browser_name="", latency_ms=0, bandwidth_kbps=0, unmatched="report"):
+        self.driver = driver
+        self.mode = mode
+        self.store = store
+        self.browser_name = browser_name
+        self.latency = latency_ms / 1000
+        self.bandwidth = bandwidth_kbps * 1024 / 8  # bytes per second
+        self.unmatched = unmatched
+        self.handled = 0
+        self._ready = threading.Event()
+        self._thread = None
+        self._trio_token = None
+        self._cancel_scope = None
+        self._error = None
+
+    def start(self, timeout=10):
+        """Start intercepting; returns once Fetch is enabled so the first page load is covered"""
+        self._thread = threading.Thread(target=self._run, name=f"network-{self.mode}", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout) or self._error:
+            raise RuntimeError(f"{self.browser_name}: Network {self.mode} layer did not start: {self._error}")
+        return self
+
+    def stop(self):
+        if self._trio_token and self._cancel_scope:
+            import trio
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._trio_token)
+            except (RuntimeError, trio.RunFinishedError):
+                pass  # already finished
+        if self._thread:
+            self._thread.join(5)
+
+    def _run(self):
+        import trio
+        try:
+            trio.run(self._intercept)
+        except BaseException as e:  # the browser closed under us, or CDP connection failed
+            self._error = e
+            self._ready.set()
+
+    async def _intercept(self):
+        import trio
+        self._trio_token = trio.lowlevel.current_trio_token()
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            stage = devtools.fetch.RequestStage.RESPONSE if self.mode == "record" else devtools.fetch.RequestStage.REQUEST
+            await session.execute(devtools.fetch.enable(
+                patterns=[devtools.fetch.RequestPattern(url_pattern="*", request_stage=stage)]))
+            async with trio.open_nursery() as nursery:
+                self._cancel_scope = nursery.cancel_scope
+                self._ready.set()
+                async for event in session.listen(devtools.fetch.RequestPaused, buffer_size=256):
+                    handle = self._record if self.mode == "record" else self._replay
+                    nursery.start_soon(handle, session, devtools, event)
+
+    async def _record(self, session, devtools, event):
+        started = time.time()
+        body, base64_encoded = "", False
+        status = event.response_status_code or 0
+        if not 300 <= status < 400:  # redirects have no body to fetch
+            try:
+                body, base64_encoded = await session.execute(devtools.fetch.get_response_body(event.request_id))
+            except Exception:
+                pass  # e.g. the request was cancelled meanwhile
+        try:
+            await session.execute(devtools.fetch.continue_request(event.request_id))
+        except Exception:
+            return
+        self.handled += 1
+        headers = [{"name": h.name, "value": h.value} for h in (event.response_headers or [])]
+        content_type = next((h["value"] for h in headers if h["name"].lower() == "content-type"), "")
+        request = {
+            "method": event.request.method,
+            "url": event.request.url,
+            "headers": [{"name": name, "value": value} for name, value in event.request.headers.items()],
+        }
+        if event.request.post_data:
+            request["postData"] = {"mimeType": event.request.headers.get("Content-Type", ""),
+                                   "text": event.request.post_data}
+        self.store.add({
+            "startedDateTime": datetime.fromtimestamp(started, timezone.utc).isoformat(),
+            "time": (time.time() - started) * 1000,
+            "_resourceType": event.resource_type.value,
+            "request": request,
+            "response": {
+                "status": status,
+                "statusText": event.response_status_text or "",
+                "headers": headers,
+                "content": {"size": len(body), "mimeType": content_type, "text": body,
+                            "encoding": "base64" if base64_encoded else ""},
+            },
+        })
+
+    async def _replay(self, session, devtools, event):
+        import trio
+        request = event.request
+        entry = self.store.match(request.method, request.url, request.post_data)
+        try:
+            if entry is None:
+                if self.unmatched == "fail":
+                    await session.execute(devtools.fetch.fail_request(
+                        event.request_id, devtools.network.ErrorReason.BLOCKED_BY_CLIENT))
+                else:
+                    await session.execute(devtools.fetch.continue_request(event.request_id))
+                return
+            response = entry["response"]
+            content = response["content"]
+            body = content["text"] if content.get("encoding") == "base64" else \
+                base64.b64encode(content["text"].encode("utf-8")).decode("ascii")
+            delay = self.latency + (len(body) * 3 / 4 / self.bandwidth if self.bandwidth else 0)
+            if delay:
+                await trio.sleep(delay)
+            headers = [devtools.fetch.HeaderEntry(name=h["name"], value=h["value"]) for h in response["headers"]
+                       if h["name"].lower() not in DROPPED_RESPONSE_HEADERS]
+            await session.execute(devtools.fetch.fulfill_request(
+                event.request_id, response["status"], response_headers=headers, body=body,
+                response_phrase=response.get("statusText") or None))
+            self.handled += 1
+        except Exception:
+            pass  # the page navigated away and the request is gone
+
+
+_stores = {}  # store folder -> HarStore shared by every driver of this process
+
+
+def attach_network_layer(driver, browser_name):
+    """Start record/replay interception on a freshly launched Chromium driver per SELENIUM_NETWORK_MODE"""
+    mode = network_mode()
+    if mode == "off":
+        return None
+    directory = store_dir()
+    if directory not in _stores:
+        _stores[directory] = HarStore(directory).load() if mode == "replay" else HarStore(directory)
+        # Finalize (unlike atexit) also runs in common.parallel_runner workers, before their pool shuts down
+        multiprocessing.util.Finalize(None, _finish, args=(_stores[directory], mode), exitpriority=20)
+        if mode == "replay":
+            print(f"Network replay: {len(_stores[directory].by_key)} recorded requests loaded from {directory}")
+    layer = NetworkLayer(
+        driver, mode, _stores[directory], browser_name,
+        latency_ms=float(os.environ.get(LATENCY_ENV_VAR, 0) or 0),
+        bandwidth_kbps=float(os.environ.get(BANDWIDTH_ENV_VAR, 0) or 0),
+        unmatched=os.environ.get(UNMATCHED_ENV_VAR, "report").strip().lower() or "report",
+    ).start()
+    driver.qa_network_layer = layer
+    print(f"{browser_name}: Network {mode} enabled ({directory})")
+    return layer
+
+
+def _finish(store, mode):
+    """Save what was recorded, or list what replay could not serve"""
+    if mode == "record":
+        path = store.save(os.environ.get("QA_WORKER_ID") or f"pid{os.getpid()}")
+        if path:
+            print(f"Network record: {len(store.entries)} responses saved to {path}")
+        return
+    if store.unmatched:
+        print(f"Network replay: {len(store.unmatched)} requests were not in the recording:")
+        for method, url in store.unmatched[:20]:
+            print(f"  {method} {url}")
+        if len(store.unmatched) > 20:
+            print(f"  ... and {len(store.unmatched) - 20} more")
@@ -0,0 +1,148 @@
+import uuid
+
+# Serializes the document and, in the same script, arms a MutationObserver that marks the
+# snapshot dirty on the next DOM change. Navigation replaces window, which drops the marker.
+_SNAPSHOT_SCRIPT = """
+var token = arguments[0];
+if (window.__qaSnapshot && window.__qaSnapshot.observer) window.__qaSnapshot.observer.disconnect();
+var state = {token: token, dirty: false};
+state.observer = new MutationObserver(function (records) {
+    for (var i = 0; i < records.length; i++) {
+        if (records[i].type !== 'attributes' || records[i].attributeName !== 'style') {
+            state.dirty = true;
+            state.observer.disconnect();
+            return;
+        }
+    }
+});
+state.observer.observe(document, {childList: true, subtree: true, characterData: true, attributes: true});
+window.__qaSnapshot = state;
+return {html: document.documentElement.outerHTML, url: location.href, title: document.title};
+"""
+_FRESH_SCRIPT = "return !!window.__qaSnapshot && window.__qaSnapshot.token === arguments[0] && !window.__qaSnapshot.dirty;"
+
+# Not part of what a user reads on the page
+NON_TEXT_TAGS = ("script", "style", "noscript", "template")
+
+
+class PageSnapshot:
+    """Parsed copy of the current page, fetched once per page state and queried locally with lxml
+
+    Every query first asks the page (a tiny script) whether the copy is still current; the
+    multi-megabyte DOM is only transferred again after a navigation or DOM mutation. Inside
+    `with snapshot:` that check runs once on entry and the block queries the same copy.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.source = None
+        self.url = None
+        self._title = None
+        self._tree = None
+        self._token = None
+        self._pinned = False
+        self.fetches = 0
+        self.reuses = 0
+
+    def __enter__(self):
+        self.tree
+        self._pinned = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self._pinned = False
+
+    @property
+    def tree(self):
+        if self._tree is not None and (self._pinned or self.is_fresh()):
+            self.reuses += 1
+        else:
+            self.refresh()
+        return self._tree
+
+    @property
+    def title(self):
+        self.tree
+        return self._title
+
+    def is_fresh(self):
+        if self._token is None:  # page scripts unavailable: only a URL change is noticed
+            return self.driver.current_url == self.url
+        try:
+            return bool(self.driver.execute_script(_FRESH_SCRIPT, self._token))
+        except Exception:
+            return False
+
+    def refresh(self):
+        """Fetch and parse the current DOM"""
+        token = uuid.uuid4().hex
+        try:
+            state = self.driver.execute_script(_SNAPSHOT_SCRIPT, token)
+            self.source, self.url, self._title, self._token = state["html"], state["url"], state["title"], token
+        except Exception:
+            self.source, self.url, self._title, self._token = \
+                self.driver.page_source, self.driver.current_url, self.driver.title, None
+        from lxml import html as lxml_html  # only snapshot users need lxml
+        self._tree = lxml_html.document_fromstring(self.source or "<html></html>")
+        self.fetches += 1
+        return self
+
+    def invalidate(self):
+        self._tree = None
+
+    def contains(self, text):
+        """Substring check against the serialized DOM, like `text in driver.page_source`"""
+        self.tree
+        return text in self.source
+
+    def text(self, xpath="//body", skip_tags=NON_TEXT_TAGS):
+        """Text of the first element matching xpath, whitespace collapsed and skip_tags/hidden markup left out"""
+        elements = self.xpath(xpath)
+        return _text_of(elements[0], skip_tags) if elements else ""
+
+    def xpath(self, expression):
+        return self.tree.xpath(expression)
+
+    def css(self, selector):
+        from lxml.cssselect import CSSSelector  # needs the cssselect package
+        return CSSSelector(selector)(self.tree)
+
+    def exists(self, xpath, visible=False):
+        """Whether xpath matches; visible=True ignores elements hidden by markup (hidden, aria-hidden, display:none)"""
+        elements = self.xpath(xpath)
+        return any(not _hidden_by_markup(element) for element in elements) if visible else bool(elements)
+
+
+def snapshot_for(driver):
+    """The PageSnapshot kept for driver, so helpers and tests share one parsed copy"""
+    snapshot = getattr(driver, "qa_page_snapshot", None)
+    if snapshot is None:
+        snapshot = driver.qa_page_snapshot = PageSnapshot(driver)
+    return snapshot
+
+
+def _text_of(element, skip_tags):
+    parts = []
+
+    def walk(node):
+        if node.tag in skip_tags or _hides(node):
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str):  # skip comments and processing instructions, keep their tails
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(element)
+    return " ".join(" ".join(parts).split())
+
+
+def _hidden_by_markup(element):
+    return any(_hides(node) for node in [element] + list(element.iterancestors()))
+
+
+def _hides(node):
+    style = (node.get("style") or "").replace(" ", "").lower()
+    return node.get("hidden") is not None or node.get("aria-hidden") == "true" or "display:none" in style
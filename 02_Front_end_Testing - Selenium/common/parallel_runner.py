@@ -0,0 +1,239 @@
+"""Run the Selenium suites in parallel across a process pool and merge the results into one report
+
+Each worker process owns its own browsers (through its own WebDriverFactory pool) and an
+isolated user-data-dir, so tests never share cookies, cache or profile locks. Scenarios written
+with common.browser_matrix become one work item per browser x launch profile.
+
+Usage (from the "02_Front_end_Testing - Selenium" folder):
+    python -m common.parallel_runner --workers 4 [--split method|class] [--profile headless]
+                                     [--browser chrome,firefox] [--matrix-profiles default,mobile]
+                                     [--junit report.xml] [--json report.json] [suite.py ...]
+"""
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from common.browser_matrix import BROWSERS_ENV_VAR, PROFILES_ENV_VAR, browser_of
+
+SELENIUM_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+DEFAULT_SUITES = [
+    "Elena Otrosnova/PositiveTest_openai_stories.py",
+    "Elena Otrosnova/NegativeTest_openai_stories.py",
+    "MilaS/untittest_Open_AI.py",
+    "MilaS/untittest_Open_AI_Negative.py",
+    "Lana_Chovgan/Unittest/Tests_OpenAI.py",
+]
+
+
+def load_suite_module(path):
+    """Import a suite file the same way running it from its own folder would"""
+    path = os.path.abspath(path)
+    folder = os.path.dirname(path)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    return importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+
+
+def iter_tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
+
+
+def collect_work_items(paths, split="method", browsers=None):
+    """[(suite path, 'Class' or 'Class.method')] for every test in the given suite files
+
+    browsers limits the items to test classes running in one of those browsers.
+    """
+    items = []
+    loader = unittest.TestLoader()
+    for path in paths:
+        module = load_suite_module(path)
+        names = []
+        for test in iter_tests(loader.loadTestsFromModule(module)):
+            if browsers and browser_of(type(test)) not in browsers:
+                continue
+            class_name, method_name = test.id().split(".")[-2:]
+            name = class_name if split == "class" else f"{class_name}.{method_name}"
+            if name not in names:
+                names.append(name)
+        items.extend((path, name) for name in names)
+    return items
+
+
+class CollectingResult(unittest.TestResult):
+    """TestResult that keeps one picklable record per test"""
+
+    def __init__(self):
+        super().__init__()
+        self.buffer = True
+        self.records = []
+        self._started = {}
+
+    def startTest(self, test):
+        self._started[test.id()] = time.perf_counter()
+        super().startTest(test)
+
+    def _record(self, test, outcome, message=""):
+        started = self._started.pop(test.id(), time.perf_counter())
+        self.records.append({
+            "id": test.id(),
+            "outcome": outcome,
+            "duration": time.perf_counter() - started,
+            "message": message,
+            "worker": os.environ.get("QA_WORKER_ID", ""),
+        })
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._record(test, "passed")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record(test, "failed", self.failures[-1][1])
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._record(test, "error", self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record(test, "skipped", reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._record(test, "passed", "expected failure")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._record(test, "failed", "unexpected success")
+
+
+def _init_worker(counter):
+    """Give the worker an id and an isolated user-data-dir, and clean both up at exit"""
+    with counter.get_lock():
+        counter.value += 1
+        worker_id = counter.value
+    user_data_dir = tempfile.mkdtemp(prefix=f"qa-worker-{worker_id}-")
+    os.environ["QA_WORKER_ID"] = f"w{worker_id}"
+    os.environ["SELENIUM_USER_DATA_DIR"] = user_data_dir
+    multiprocessing.util.Finalize(None, _shutdown_worker, args=(user_data_dir,), exitpriority=10)
+
+
+def _shutdown_worker(user_data_dir):
+    from common.driver_pool import pool
+    pool.shutdown()
+    shutil.rmtree(user_data_dir, ignore_errors=True)
+
+
+def _run_item(path, name):
+    """Run one class or method in this worker and return its records"""
+    module = load_suite_module(path)
+    suite = unittest.TestLoader().loadTestsFromName(name, module)
+    result = CollectingResult()
+    suite.run(result)
+    if not result.records and result.errors:  # e.g. setUpClass or module import failure
+        result.records.append({"id": f"{module.__name__}.{name}", "outcome": "error", "duration": 0.0,
+                               "message": result.errors[-1][1], "worker": os.environ.get("QA_WORKER_ID", "")})
+    return result.records
+
+
+def run_parallel(paths, workers, split="method", browsers=None):
+    """Run every test in paths on a pool of worker processes and return the merged records"""
+    items = collect_work_items(paths, split, browsers)
+    context = multiprocessing.get_context("spawn")
+    counter = context.Value("i", 0)
+    records = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(counter,)) as executor:
+        futures = {executor.submit(_run_item, path, name): name for path, name in items}
+        for future in as_completed(futures):
+            try:
+                item_records = future.result()
+            except Exception as e:
+                item_records = [{"id": futures[future], "outcome": "error", "duration": 0.0,
+                                 "message": repr(e), "worker": ""}]
+            for record in item_records:
+                print(f"[{record['worker'] or '-'}] {record['outcome']:<7} {record['id']} ({record['duration']:.1f}s)")
+            records.extend(item_records)
+    return records
+
+
+def write_junit(records, path, elapsed):
+    suite = ET.Element("testsuite", name="selenium-parallel", tests=str(len(records)), time=f"{elapsed:.3f}",
+                       failures=str(sum(r["outcome"] == "failed" for r in records)),
+                       errors=str(sum(r["outcome"] == "error" for r in records)),
+                       skipped=str(sum(r["outcome"] == "skipped" for r in records)))
+    for record in sorted(records, key=lambda r: r["id"]):
+        class_name, _, method_name = record["id"].rpartition(".")
+        case = ET.SubElement(suite, "testcase", classname=class_name, name=method_name,
+                             time=f"{record['duration']:.3f}")
+        if record["outcome"] in ("failed", "error", "skipped"):
+            tag = {"failed": "failure", "error": "error", "skipped": "skipped"}[record["outcome"]]
+            ET.SubElement(case, tag, message=record["message"].strip().splitlines()[-1] if record["message"] else "")
+            case[-1].text = record["message"]
+        ET.SubElement(case, "properties").append(ET.Element("property", name="worker", value=record["worker"]))
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("suites", nargs="*", help="suite files (default: all Chrome/Edge suites)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--split", choices=["method", "class"], default="method",
+                        help="schedule individual test methods or whole test classes")
+    parser.add_argument("--profile", help="launch profile (see common.launch_profiles)")
+    parser.add_argument("--browser", help="comma-separated browsers to run: chrome, edge, firefox")
+    parser.add_argument("--matrix-profiles", help="comma-separated launch profiles to fan matrix scenarios out to")
+    parser.add_argument("--junit", help="write a merged JUnit XML report here")
+    parser.add_argument("--json", help="write merged results as JSON here")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        os.environ["SELENIUM_PROFILE"] = args.profile
+    browsers = [name.strip() for name in args.browser.split(",")] if args.browser else None
+    if browsers:
+        os.environ[BROWSERS_ENV_VAR] = ",".join(browsers)
+    if args.matrix_profiles:
+        os.environ[PROFILES_ENV_VAR] = args.matrix_profiles
+    paths = [os.path.join(SELENIUM_DIR, suite) if not os.path.isabs(suite) else suite
+             for suite in (args.suites or DEFAULT_SUITES)]
+
+    start = time.perf_counter()
+    records = run_parallel(paths, args.workers, args.split, browsers)
+    elapsed = time.perf_counter() - start
+
+    counts = {outcome: sum(r["outcome"] == outcome for r in records)
+              for outcome in ("passed", "failed", "error", "skipped")}
+    print("-" * 70)
+    print(f"Ran {len(records)} tests in {elapsed:.1f}s on {args.workers} workers")
+    print("OK" if not counts["failed"] and not counts["error"] else "FAILED",
+          f"(passed={counts['passed']}, failures={counts['failed']}, errors={counts['error']}, "
+          f"skipped={counts['skipped']})")
+    for record in records:
+        if record["outcome"] in ("failed", "error"):
+            print("=" * 70)
+            print(f"{record['outcome'].upper()}: {record['id']} [{record['worker']}]")
+            print(record["message"])
+
+    if args.junit:
+        write_junit(records, args.junit, elapsed)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"elapsed": elapsed, "workers": args.workers, "tests": records}, f, indent=2)
+    return 1 if counts["failed"] or counts["error"] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
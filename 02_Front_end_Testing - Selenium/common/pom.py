@@ -0,0 +1,235 @@
+"""Page Object Model base: locators declared once per page, element handles cached per page load
+
+A page class declares its elements as Locator class attributes. XPath locators are compiled
+with lxml when the class is defined, so a typo fails at import instead of mid-test (without
+lxml installed that check is skipped and the browser reports the typo on use). A locator
+can take parameters: {label} fields are filled in as XPath string literals, e.g.
+AboutPage.card_title(label="Sora 2 is here"). Each parameter set is built once.
+
+BasePage.find() looks an element up once and hands back the same handle until the page
+changes. The driver counts navigations (get, back/forward/refresh, clicks, window and frame
+switches) and every page drops its handles when the count moves. A handle that goes stale
+anyway, for example after a script re-renders part of the page, looks itself up again and
+retries the call. Lookups, cache hits, stale retries and lookup time are counted per page
+class.
+
+Settings (environment variables):
+    SELENIUM_POM_STATS   1 prints the per-page lookup statistics when the process exits
+"""
+import multiprocessing.util
+import os
+import time
+from string import Formatter
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from common.site_config import site_url
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional: without it XPath locators are not checked up front
+    etree = None
+
+STATS_ENV_VAR = "SELENIUM_POM_STATS"
+
+# Commands after which handles found earlier may belong to a different document
+NAVIGATION_COMMANDS = {
+    Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH, Command.CLICK_ELEMENT,
+    Command.SWITCH_TO_WINDOW, Command.NEW_WINDOW, Command.CLOSE, Command.SWITCH_TO_FRAME,
+    Command.SWITCH_TO_PARENT_FRAME,
+}
+
+_stats = {}  # page class name -> counters
+
+
+def xpath_literal(text):
+    """text as an XPath 1.0 string literal, using concat() when it holds both quote kinds"""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ")"
+
+
+class Locator:
+    """A (By, selector) pair declared on a page class; {name} fields make it a template"""
+
+    def __init__(self, by, value, description=""):
+        self.by = by
+        self.value = value
+        self.description = description
+        self.name = None
+        self.fields = [field for _, field, _, _ in Formatter().parse(value) if field]
+        self._bound = {}
+        if by == By.XPATH and etree is not None:
+            try:
+                etree.XPath(value.format(**{field: "''" for field in self.fields}) if self.fields else value)
+            except etree.XPathSyntaxError as e:
+                raise ValueError(f"Invalid XPath in locator: {value} ({e})") from None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __call__(self, **params):
+        """This template with its fields filled in; the result is built once per parameter set"""
+        key = tuple(sorted(params.items()))
+        bound = self._bound.get(key)
+        if bound is None:
+            quote = xpath_literal if self.by == By.XPATH else str
+            bound = Locator(self.by, self.value.format(**{name: quote(value) for name, value in params.items()}),
+                            self.description)
+            bound.name = self.name
+            self._bound[key] = bound
+        return bound
+
+    @property
+    def key(self):
+        if self.fields:
+            raise ValueError(f"Locator '{self.name}' needs values for {', '.join(self.fields)}")
+        return self.by, self.value
+
+    def __repr__(self):
+        return f"Locator({self.by!r}, {self.value!r})"
+
+
+class CachedElement(WebElement):
+    """WebElement that looks itself up again and retries once when its handle has gone stale"""
+
+    def __init__(self, element, relocate, stats):
+        super().__init__(element.parent, element.id)
+        self._relocate = relocate
+        self._stats = stats
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            self._stats["stale_retries"] += 1
+            self._id = self._relocate().id
+            return super()._execute(command, params)
+
+
+class BasePage:
+    """Base of the page objects: open() the page's path and find() its declared locators"""
+
+    path = "/"
+
+    def __init__(self, driver):
+        self.driver = driver
+        _watch_navigation(driver)
+        self.stats = page_stats(type(self).__name__)
+        self._cache = {}
+        self._epoch = driver.qa_navigation_epoch
+
+    @property
+    def url(self):
+        return site_url(self.path)
+
+    def open(self):
+        self.driver.get(self.url)
+        return self
+
+    def find(self, locator, **params):
+        """Element for locator (filled with params), reused until the page navigates"""
+        key = (locator(**params) if params else locator).key
+        self._check_epoch()
+        element = self._cache.get(key)
+        if element is not None:
+            self.stats["cache_hits"] += 1
+            return element
+        element = CachedElement(self._lookup(self.driver.find_element, key), lambda: self._refind(key), self.stats)
+        self._cache[key] = element
+        return element
+
+    def find_all(self, locator, **params):
+        """All elements for locator (filled with params), reused until the page navigates"""
+        key = ("all",) + (locator(**params) if params else locator).key
+        self._check_epoch()
+        elements = self._cache.get(key)
+        if elements is not None:
+            self.stats["cache_hits"] += 1
+            return elements
+        found = self._lookup(self.driver.find_elements, key[1:])
+        elements = [CachedElement(element, lambda index=index: self._refind_nth(key[1:], index), self.stats)
+                    for index, element in enumerate(found)]
+        self._cache[key] = elements
+        return elements
+
+    def is_displayed(self, locator, **params):
+        return self.find(locator, **params).is_displayed()
+
+    def text_of(self, locator, **params):
+        return self.find(locator, **params).text.strip()
+
+    def invalidate(self):
+        self._cache.clear()
+
+    def _check_epoch(self):
+        if self._epoch != self.driver.qa_navigation_epoch:
+            if self._cache:
+                self.stats["invalidations"] += 1
+                self._cache.clear()
+            self._epoch = self.driver.qa_navigation_epoch
+
+    def _lookup(self, finder, key):
+        start = time.perf_counter()
+        try:
+            return finder(*key)
+        finally:
+            self.stats["lookups"] += 1
+            self.stats["lookup_seconds"] += time.perf_counter() - start
+
+    def _refind(self, key):
+        return self._lookup(self.driver.find_element, key)
+
+    def _refind_nth(self, key, index):
+        elements = self._lookup(self.driver.find_elements, key)
+        if index >= len(elements):
+            raise StaleElementReferenceException(f"Element {index} of {key[1]} is gone")
+        return elements[index]
+
+
+def page_stats(page_name):
+    """Lookup counters of one page class, created on first use"""
+    if page_name not in _stats:
+        _stats[page_name] = {"lookups": 0, "cache_hits": 0, "stale_retries": 0, "invalidations": 0, "lookup_seconds": 0.0}
+    return _stats[page_name]
+
+
+def lookup_stats():
+    return {name: dict(counters) for name, counters in _stats.items()}
+
+
+def print_lookup_stats():
+    if not _stats:
+        return
+    print(f"\n{'page':<16} {'lookups':>8} {'hits':>8} {'stale':>6} {'resets':>7} {'lookup s':>9} {'ms/lookup':>10}")
+    for name, counters in sorted(_stats.items()):
+        per_lookup = counters["lookup_seconds"] / counters["lookups"] * 1000 if counters["lookups"] else 0.0
+        print(f"{name:<16} {counters['lookups']:>8} {counters['cache_hits']:>8} {counters['stale_retries']:>6} "
+              f"{counters['invalidations']:>7} {counters['lookup_seconds']:>9.2f} {per_lookup:>10.1f}")
+
+
+def _watch_navigation(driver):
+    """Count navigation commands on driver.qa_navigation_epoch (once per driver)"""
+    if getattr(driver, "qa_navigation_epoch", None) is not None:
+        return
+    driver.qa_navigation_epoch = 0
+    execute = driver.execute
+
+    def execute_and_count(driver_command, params=None):
+        if driver_command in NAVIGATION_COMMANDS:
+            driver.qa_navigation_epoch += 1
+        return execute(driver_command, params)
+
+    driver.execute = execute_and_count
+
+
+def _print_stats_at_exit():
+    if os.environ.get(STATS_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on"):
+        print_lookup_stats()
+
+
+# Finalize (unlike atexit) also runs in common.parallel_runner workers
+multiprocessing.util.Finalize(None, _print_stats_at_exit, exitpriority=20)
@@ -0,0 +1,224 @@
+import json
+import time
+from selenium.common.exceptions import WebDriverException
+from common.instrumentation import condition_wait
+
+# Criteria understood by wait_until_ready():
+#   "dom"          - DOMContentLoaded has fired (readyState is no longer "loading")
+#   "load"         - the load event has fired (readyState is "complete")
+#   "network-idle" - no request in flight for idle_ms, tracked through CDP Network events
+#   "selector"     - the CSS selector passed as selector= matches a visible element
+#   "dom-quiet"    - no DOM mutation (animations, late rendering) for idle_ms
+CRITERIA = ("dom", "load", "network-idle", "selector", "dom-quiet")
+
+# Resolves as soon as every in-page criterion holds, driven by readyState/load events and a
+# MutationObserver, with a short interval as a safety net for style-only visibility changes.
+# "network-idle" only reaches this script when CDP events are unavailable; it then falls back
+# to "no new resource timing entries for idleMs".
+_READY_SCRIPT = """
+var criteria = arguments[0], selector = arguments[1], timeoutMs = arguments[2], idleMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var start = performance.now(), lastResource = performance.now(), lastMutation = performance.now(), finished = false;
+var resourceCount = performance.getEntriesByType('resource').length;
+
+function visible(el) {
+    if (!el) return false;
+    var rect = el.getBoundingClientRect(), style = getComputedStyle(el);
+    return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+function unmet() {
+    var missing = [];
+    if (criteria.indexOf('dom') >= 0 && document.readyState === 'loading') missing.push('dom');
+    if (criteria.indexOf('load') >= 0 && document.readyState !== 'complete') missing.push('load');
+    if (criteria.indexOf('selector') >= 0 && !visible(document.querySelector(selector))) missing.push('selector');
+    if (criteria.indexOf('dom-quiet') >= 0 && performance.now() - lastMutation < idleMs) missing.push('dom-quiet');
+    if (criteria.indexOf('network-idle') >= 0) {
+        var count = performance.getEntriesByType('resource').length;
+        if (count !== resourceCount) { resourceCount = count; lastResource = performance.now(); }
+        if (performance.now() - lastResource < idleMs) missing.push('network-idle');
+    }
+    return missing;
+}
+function check() {
+    if (finished) return;
+    var missing = unmet();
+    if (missing.length && performance.now() - start < timeoutMs) return;
+    finished = true;
+    observer.disconnect();
+    clearInterval(timer);
+    document.removeEventListener('readystatechange', check);
+    window.removeEventListener('load', check);
+    done({missing: missing, elapsed: (performance.now() - start) / 1000});
+}
+var observer = new MutationObserver(function () { lastMutation = performance.now(); check(); });
+observer.observe(document, {childList: true, subtree: true, attributes: true});
+document.addEventListener('readystatechange', check);
+window.addEventListener('load', check);
+var timer = setInterval(check, 50);
+check();
+"""
+
+
+class ReadinessResult:
+    """Outcome of a readiness wait; truthy when every criterion was met"""
+
+    def __init__(self, criteria, unmet, elapsed):
+        self.criteria = tuple(criteria)
+        self.unmet = tuple(unmet)
+        self.elapsed = elapsed
+
+    def __bool__(self):
+        return not self.unmet
+
+    def __repr__(self):
+        state = "ready" if self else f"unmet={list(self.unmet)}"
+        return f"ReadinessResult({list(self.criteria)}, {state}, {self.elapsed:.3f}s)"
+
+
+def wait_until_ready(driver, criteria=("load",), timeout=10, idle_ms=500, selector=None, network_log=None):
+    """Wait until the current page meets all criteria and return a ReadinessResult
+
+    Returns as soon as the criteria hold instead of sleeping a fixed amount; on timeout
+    the result is falsy and lists the criteria that were not met. Pass a list as network_log
+    to receive the CDP Network events consumed while waiting for network idle.
+    """
+    criteria = tuple(criteria)
+    for criterion in criteria:
+        if criterion not in CRITERIA:
+            raise ValueError(f"Unknown readiness criterion '{criterion}', expected one of: {', '.join(CRITERIA)}")
+    if "selector" in criteria and not selector:
+        raise ValueError("The 'selector' criterion needs a CSS selector")
+
+    start = time.perf_counter()
+    deadline = start + timeout
+    use_cdp = "network-idle" in criteria and _has_network_events(driver)
+    page_criteria = [c for c in criteria if not (use_cdp and c == "network-idle")]
+
+    unmet = list(page_criteria)
+    with condition_wait(f"wait_until_ready {','.join(criteria)}", timeout=timeout):
+        if page_criteria:
+            unmet = _wait_in_page(driver, page_criteria, selector, deadline, idle_ms)
+        if use_cdp:
+            if not _wait_for_network_idle(driver, deadline, idle_ms, network_log):
+                unmet.append("network-idle")
+
+    return ReadinessResult(criteria, unmet, time.perf_counter() - start)
+
+
+def drain_performance_log(driver):
+    """Read and clear the browser's CDP performance log, returning the parsed event messages"""
+    return [json.loads(entry["message"])["message"] for entry in driver.get_log("performance")]
+
+
+def _wait_in_page(driver, criteria, selector, deadline, idle_ms):
+    """Run the in-page waiter, retrying when a navigation tears the document down mid-wait"""
+    unmet = list(criteria)
+    while time.perf_counter() < deadline:
+        remaining = deadline - time.perf_counter()
+        if remaining > 25:
+            driver.set_script_timeout(remaining + 5)
+        try:
+            result = driver.execute_async_script(_READY_SCRIPT, list(criteria), selector or "", remaining * 1000, idle_ms)
+            unmet = result["missing"]
+            if not unmet:
+                return []
+        except WebDriverException:
+            time.sleep(0.05)  # document was replaced while waiting; try again on the new one
+    return unmet
+
+
+def _wait_for_network_idle(driver, deadline, idle_ms, network_log=None):
+    """Track in-flight requests from CDP Network events until none are pending for idle_ms"""
+    in_flight = set()
+    last_activity = time.perf_counter()
+    while True:
+        messages = drain_performance_log(driver)
+        if network_log is not None:
+            network_log.extend(messages)
+        for message in messages:
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                if params.get("type") not in ("WebSocket", "EventSource") and \
+                        not params.get("request", {}).get("url", "").startswith("data:"):
+                    in_flight.add(params["requestId"])
+                    last_activity = time.perf_counter()
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                in_flight.discard(params.get("requestId"))
+                last_activity = time.perf_counter()
+
+        now = time.perf_counter()
+        if not in_flight and (now - last_activity) * 1000 >= idle_ms:
+            return True
+        if now >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+def _has_network_events(driver):
+    """Whether the driver was started with CDP performance logging (see WebDriverFactory)"""
+    return getattr(driver, "qa_network_events", False)
+
+
+# Waits for the value of a caller-supplied counting function body (spliced in at /*COUNT*/
+# so no eval is needed under a strict CSP) to grow past a baseline, or to hold still for quietMs.
+_COUNT_CHANGE_SCRIPT = """
+var previous = arguments[0], quietMs = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+function countNow() { /*COUNT*/ }
+var start = performance.now(), lastChange = start, finished = false;
+var baseline = previous === null ? countNow() : previous, current = countNow();
+
+function finish(timedOut) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearInterval(timer);
+    done({count: current, previous: baseline, grew: current > baseline, timedOut: timedOut,
+          elapsed: (performance.now() - start) / 1000});
+}
+function check() {
+    var count = countNow();
+    if (count !== current) { current = count; lastChange = performance.now(); }
+    if (current > baseline) return finish(false);
+    if (performance.now() - lastChange >= quietMs) return finish(false);
+    if (performance.now() - start >= timeoutMs) return finish(true);
+}
+var observer = new MutationObserver(check);
+observer.observe(document.body, {childList: true, subtree: true});
+var timer = setInterval(check, 50);
+window.scrollBy(0, 100);
+window.scrollBy(0, -100);
+check();
+"""
+
+
+class CountChangeResult:
+    """Outcome of wait_for_count_change(); truthy unless the count was still moving at the timeout"""
+
+    def __init__(self, count, previous_count, grew, timed_out, elapsed):
+        self.count = count
+        self.previous_count = previous_count
+        self.grew = grew
+        self.timed_out = timed_out
+        self.elapsed = elapsed
+
+    def __bool__(self):
+        return not self.timed_out
+
+    def __repr__(self):
+        return (f"CountChangeResult(count={self.count}, previous={self.previous_count}, grew={self.grew}, "
+                f"timed_out={self.timed_out}, {self.elapsed:.3f}s)")
+
+
+def wait_for_count_change(driver, count_js, previous_count=None, quiet_ms=1500, timeout=10):
+    """Wait in one round trip until count_js grows past previous_count or stays unchanged for quiet_ms
+
+    count_js is the body of a JavaScript function returning a number. previous_count defaults
+    to the count when the wait starts.
+    """
+    if timeout > 25:
+        driver.set_script_timeout(timeout + 5)
+    script = _COUNT_CHANGE_SCRIPT.replace("/*COUNT*/", count_js)
+    result = driver.execute_async_script(script, previous_count, quiet_ms, timeout * 1000)
+    return CountChangeResult(result["count"], result["previous"], result["grew"], result["timedOut"],
+                             result["elapsed"])
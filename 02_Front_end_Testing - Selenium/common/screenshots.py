@@ -0,0 +1,152 @@
+"""Screenshot service: unique per-test/per-worker files, element clips, encoding and writing off the test thread
+
+Only the capture itself runs on the test thread (the driver is not thread-safe); decoding,
+optional re-encoding with Pillow and the disk write happen on a small thread pool. A capture
+identical to the previous one of the same test and name is not written again.
+
+Settings (environment variables):
+    SELENIUM_SCREENSHOT_DIR     output folder (default: screenshots/ next to common/)
+    SELENIUM_SCREENSHOT_FORMAT  png (default) | webp | jpeg
+"""
+import base64
+import hashlib
+import multiprocessing.util
+import os
+import re
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: without it files keep the format the browser captured
+    Image = None
+
+DIR_ENV_VAR = "SELENIUM_SCREENSHOT_DIR"
+FORMAT_ENV_VAR = "SELENIUM_SCREENSHOT_FORMAT"
+DEFAULT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'screenshots'))
+FORMATS = ("png", "webp", "jpeg")
+JPEG_QUALITY = 85
+
+_ELEMENT_RECT_JS = """
+var rect = arguments[0].getBoundingClientRect();
+return [rect.left + window.scrollX, rect.top + window.scrollY, rect.width, rect.height];
+"""
+
+
+def current_test_id():
+    """id() of the unittest test running on this thread, found by walking up the call stack"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        candidate = frame.f_locals.get("self")
+        if isinstance(candidate, unittest.TestCase):
+            return candidate.id()
+        frame = frame.f_back
+    return "no-test"
+
+
+class ScreenshotService:
+    """Captures screenshots into <dir>/<worker>/<test id>/<NN>-<name>.<ext> without blocking on encoding"""
+
+    def __init__(self, workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot")
+        self.pending = []
+        self.sequence = {}    # test id -> screenshots taken so far
+        self.last_frame = {}  # (test id, name) -> (content hash, path) of the latest capture
+        self.written = 0
+        self.deduplicated = 0
+
+    @property
+    def directory(self):
+        return os.environ.get(DIR_ENV_VAR) or DEFAULT_DIR
+
+    @property
+    def image_format(self):
+        image_format = os.environ.get(FORMAT_ENV_VAR, "png").strip().lower() or "png"
+        if image_format not in FORMATS:
+            raise ValueError(f"Unknown screenshot format '{image_format}', expected one of: {', '.join(FORMATS)}")
+        return image_format
+
+    def capture(self, driver, name="screenshot", element=None):
+        """Screenshot the page (or just element) and return the path it is being written to"""
+        image_format = self.image_format
+        data, encoded_format = self._grab(driver, element, image_format)
+        test_id = current_test_id()
+        content_hash = hashlib.sha1(data.encode("ascii")).hexdigest()
+        previous = self.last_frame.get((test_id, name))
+        if previous and previous[0] == content_hash:
+            self.deduplicated += 1
+            return previous[1]
+
+        self.sequence[test_id] = self.sequence.get(test_id, 0) + 1
+        folder = os.path.join(self.directory, os.environ.get("QA_WORKER_ID") or "main", _safe(test_id))
+        if Image is None:
+            image_format = encoded_format
+        path = os.path.join(folder, f"{self.sequence[test_id]:02d}-{_safe(name)}.{image_format}")
+        self.last_frame[(test_id, name)] = (content_hash, path)
+        self.pending = [future for future in self.pending if not future.done()]
+        self.pending.append(self.executor.submit(self._write, data, encoded_format, image_format, path))
+        print(f"Screenshot: {path}")
+        return path
+
+    def flush(self):
+        """Wait until every queued screenshot is on disk"""
+        for future in self.pending:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Screenshot could not be written: {e}")
+        self.pending = []
+
+    def shutdown(self):
+        self.flush()
+        self.executor.shutdown()
+        if self.written or self.deduplicated:
+            print(f"Screenshots: {self.written} written, {self.deduplicated} identical frames skipped")
+
+    @staticmethod
+    def _grab(driver, element, image_format):
+        """(base64 image, its format) - through CDP where available so Chromium encodes and clips for us"""
+        params = {"format": image_format}
+        if image_format != "png":
+            params["quality"] = JPEG_QUALITY
+        if element is not None:
+            x, y, width, height = driver.execute_script(_ELEMENT_RECT_JS, element)
+            params.update(clip={"x": x, "y": y, "width": max(width, 1), "height": max(height, 1), "scale": 1},
+                          captureBeyondViewport=True)
+        try:
+            return driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"], image_format
+        except Exception:
+            pass  # not a Chromium driver
+        data = element.screenshot_as_base64 if element is not None else driver.get_screenshot_as_base64()
+        return data, "png"
+
+    def _write(self, data, encoded_format, image_format, path):
+        image = base64.b64decode(data)
+        if Image is not None and (encoded_format != image_format or image_format == "png"):
+            image = _reencode(image, image_format)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(image)
+        self.written += 1
+
+
+def _reencode(image, image_format):
+    """Optimised PNG, or the capture converted to WebP/JPEG"""
+    source = Image.open(BytesIO(image))
+    output = BytesIO()
+    if image_format == "png":
+        source.save(output, "PNG", optimize=True)
+    else:
+        source.convert("RGB").save(output, image_format.upper(), quality=JPEG_QUALITY)
+    return output.getvalue()
+
+
+def _safe(name):
+    return re.sub(r"[^\w.-]+", "_", name)
+
+
+screenshots = ScreenshotService()
+# Finalize (unlike atexit) also runs in common.parallel_runner workers
+multiprocessing.util.Finalize(None, screenshots.shutdown, exitpriority=20)
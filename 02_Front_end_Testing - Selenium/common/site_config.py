@@ -0,0 +1,46 @@
+import os
+from urllib.parse import urlsplit
+
+LIVE_BASE_URL = "https://openai.com"
+LIVE_PLATFORM_LOGIN_URL = "https://platform.openai.com/login"
+
+# Where the suites point their browsers:
+#   unset / "live"     - the public openai.com pages
+#   "local"            - the bundled offline fixture server, started in this process on first use
+#   "http://host:port" - an already running fixture server (python -m common.fixture_server)
+BASE_URL_ENV_VAR = "OPENAI_QA_BASE_URL"
+
+_local_server_url = None
+
+
+def base_url():
+    """Scheme and host every page URL is built on, without a trailing slash"""
+    global _local_server_url
+    setting = os.environ.get(BASE_URL_ENV_VAR, "").strip()
+    if setting in ("", "live"):
+        return LIVE_BASE_URL
+    if setting == "local":
+        if _local_server_url is None:
+            from common.fixture_server import start_background_server
+            _local_server_url = start_background_server()
+        return _local_server_url
+    return setting.rstrip("/")
+
+
+def is_live():
+    return base_url() == LIVE_BASE_URL
+
+
+def site_url(path="/"):
+    """Absolute URL of an openai.com path on the configured site"""
+    return base_url() + path
+
+
+def site_host():
+    """Host (and port) of the configured site, e.g. 'openai.com', for url_contains checks"""
+    return urlsplit(base_url()).netloc
+
+
+def platform_login_url():
+    """URL of the OpenAI Platform login form the site's 'Log in' link points to"""
+    return LIVE_PLATFORM_LOGIN_URL if is_live() else site_url("/platform/login")
@@ -0,0 +1,171 @@
+"""Save the browser state a multi-step setup ends in and restore it later in one navigation
+
+A storage state is the URL plus the cookies, localStorage and sessionStorage a page had. The
+first test that needs, say, "platform login form open" builds it the long way and captures it.
+Later tests restore it: Chrome and Edge set the cookies with CDP and seed both storages from a
+script that runs before the page's own scripts, then load the URL once. Firefox has no CDP,
+so it opens the site first to set the cookies and storages and then loads the URL.
+
+States are JSON files, one per name and site host, written atomically so parallel workers can
+share them. A state older than the maximum age is rebuilt.
+
+Settings (environment variables):
+    SELENIUM_STATE_DIR       state folder (default: storage_states/ next to common/, git-ignored: it holds session cookies)
+    SELENIUM_STATE_MAX_AGE   seconds a saved state stays valid (default 3600, 0 disables restoring)
+"""
+import json
+import os
+import re
+import tempfile
+import time
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from common.site_config import site_host
+
+DIR_ENV_VAR = "SELENIUM_STATE_DIR"
+MAX_AGE_ENV_VAR = "SELENIUM_STATE_MAX_AGE"
+DEFAULT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'storage_states'))
+DEFAULT_MAX_AGE = 3600
+
+_STORAGE_SCRIPT = """
+function dump(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) items[storage.key(i)] = storage.getItem(storage.key(i));
+    return items;
+}
+return {url: location.href, origin: location.origin, title: document.title,
+        localStorage: dump(window.localStorage), sessionStorage: dump(window.sessionStorage)};
+"""
+
+# Runs before the page's scripts on every new document while a restore is in progress
+_SEED_TEMPLATE = """
+(function (state) {
+    if (location.origin !== state.origin) return;
+    try {
+        Object.keys(state.localStorage).forEach(function (key) { localStorage.setItem(key, state.localStorage[key]); });
+        Object.keys(state.sessionStorage).forEach(function (key) { sessionStorage.setItem(key, state.sessionStorage[key]); });
+    } catch (e) {}
+})(%s);
+"""
+_SET_STORAGE_SCRIPT = """
+var state = arguments[0];
+Object.keys(state.localStorage).forEach(function (key) { localStorage.setItem(key, state.localStorage[key]); });
+Object.keys(state.sessionStorage).forEach(function (key) { sessionStorage.setItem(key, state.sessionStorage[key]); });
+"""
+_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+
+def state_dir():
+    return os.environ.get(DIR_ENV_VAR) or DEFAULT_DIR
+
+
+def max_age():
+    return float(os.environ.get(MAX_AGE_ENV_VAR, DEFAULT_MAX_AGE))
+
+
+def state_path(name):
+    """File of the named state for the site the run points at (live, fixture server, ...)"""
+    return os.path.join(state_dir(), f"{_safe(name)}@{_safe(site_host())}.json")
+
+
+def capture_state(driver, name):
+    """Save the current page's URL, cookies and storages as the named state and return it"""
+    state = driver.execute_script(_STORAGE_SCRIPT)
+    if getattr(driver, "qa_network_events", False):  # Chromium: cookies of every domain, HttpOnly included
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    else:
+        cookies = driver.get_cookies()
+        for cookie in cookies:
+            if "expiry" in cookie:
+                cookie["expires"] = cookie.pop("expiry")
+    state.update(name=name, saved_at=time.time(),
+                 cookies=[{field: cookie[field] for field in _COOKIE_FIELDS if field in cookie} for cookie in cookies])
+    path = state_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=1)
+    os.replace(temp_path, path)
+    return state
+
+
+def load_state(name, max_age_seconds=None):
+    """The named state, or None when it was never saved or is older than max_age_seconds"""
+    limit = max_age() if max_age_seconds is None else max_age_seconds
+    try:
+        with open(state_path(name), encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - state.get("saved_at", 0) > limit:
+        return None
+    return state
+
+
+def restore_state(driver, name, max_age_seconds=None):
+    """Put the browser into the named state; False (and nothing changed) when there is no fresh state"""
+    state = load_state(name, max_age_seconds)
+    if state is None:
+        return False
+    if getattr(driver, "qa_network_events", False):
+        _restore_with_cdp(driver, state)
+    else:
+        _restore_with_webdriver(driver, state)
+    return True
+
+
+def storage_state(driver, name, build, max_age_seconds=None):
+    """Restore the named state, or run build(driver) to reach it and save it for the next test
+
+    Returns "restored" or "built".
+    """
+    start = time.perf_counter()
+    try:
+        if restore_state(driver, name, max_age_seconds):
+            print(f"Storage state '{name}' restored in {time.perf_counter() - start:.1f}s")
+            return "restored"
+    except WebDriverException as e:
+        print(f"Storage state '{name}' could not be restored ({e.msg}), building it")
+    build(driver)
+    capture_state(driver, name)
+    print(f"Storage state '{name}' built and saved in {time.perf_counter() - start:.1f}s")
+    return "built"
+
+
+def _restore_with_cdp(driver, state):
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_cdp_cookie(cookie) for cookie in state["cookies"]]})
+    seed = _SEED_TEMPLATE % json.dumps({key: state[key] for key in ("origin", "localStorage", "sessionStorage")})
+    script_id = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": seed})["identifier"]
+    try:
+        driver.get(state["url"])
+    finally:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id})
+
+
+def _restore_with_webdriver(driver, state):
+    # WebDriver only sets cookies and storage for the page that is open, so open the origin first
+    driver.get(state["origin"] + "/")
+    host = urlsplit(state["origin"]).hostname
+    for cookie in state["cookies"]:
+        if host and host.endswith(cookie.get("domain", host).lstrip(".")):
+            cookie = dict(cookie)
+            if "expires" in cookie:
+                cookie["expiry"] = int(cookie.pop("expires"))
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)
+            driver.add_cookie(cookie)
+    driver.execute_script(_SET_STORAGE_SCRIPT, state)
+    driver.get(state["url"])
+
+
+def _cdp_cookie(cookie):
+    cookie = dict(cookie)
+    if cookie.get("expires", -1) < 0:
+        cookie.pop("expires", None)  # session cookie
+    if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+        cookie.pop("sameSite", None)
+    return cookie
+
+
+def _safe(text):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text)
@@ -0,0 +1,85 @@
+"""Load several pages side by side in tabs of one browser session and check them one by one
+
+A check that has to see a page in the browser does not need its own navigate / assert /
+back cycle per target. TabNavigator starts every target loading in its own tab without
+waiting. It then waits for each tab's load event, so the loads overlap. Finally it runs the
+check in each tab in turn, closes the tabs and switches back to the original window.
+WebDriverFactory starts Chrome and Edge with background throttling off, so tabs that are not
+in front keep loading at full speed.
+"""
+import time
+from selenium.common.exceptions import WebDriverException
+from common.instrumentation import condition_wait
+from common.readiness import wait_until_ready
+
+MAX_TABS = 6  # more tabs than this compete for the same renderer processes and gain nothing
+
+
+class TabNavigator:
+    """Visits target URLs in background tabs of driver's session, MAX_TABS at a time"""
+
+    def __init__(self, driver, timeout=20, criteria=("load",), max_tabs=MAX_TABS):
+        self.driver = driver
+        self.timeout = timeout
+        self.criteria = criteria
+        self.max_tabs = max_tabs
+
+    def visit(self, urls, check):
+        """[check(index, url) for every url], each called with its tab selected and loaded
+
+        An exception from check is raised after the tabs are closed and the original window is
+        back in front; check results gathered until then are lost.
+        """
+        urls = list(urls)
+        results = []
+        for first in range(0, len(urls), self.max_tabs):
+            batch = urls[first:first + self.max_tabs]
+            results.extend(self._visit_batch(first, batch, check))
+        return results
+
+    def _visit_batch(self, offset, urls, check):
+        driver = self.driver
+        original = driver.current_window_handle
+        tabs = []
+        start = time.perf_counter()
+        try:
+            for url in urls:
+                driver.switch_to.new_window("tab")
+                tabs.append(driver.current_window_handle)
+                # Assigning location returns at once, unlike driver.get(), so the loads run in parallel
+                driver.execute_script("window.location.href = arguments[0];", url)
+            deadline = start + self.timeout
+            for tab in tabs:
+                driver.switch_to.window(tab)
+                self._wait_loaded(max(0.5, deadline - time.perf_counter()))
+            print(f"Loaded {len(tabs)} tabs in {time.perf_counter() - start:.1f}s")
+            results = []
+            for index, (tab, url) in enumerate(zip(tabs, urls)):
+                driver.switch_to.window(tab)
+                results.append(check(offset + index, url))
+            return results
+        finally:
+            self._close(tabs, original)
+
+    def _wait_loaded(self, timeout):
+        """Wait for the navigation away from about:blank, then for the page's readiness criteria"""
+        deadline = time.perf_counter() + timeout
+        with condition_wait("tab navigation", timeout=timeout):
+            while time.perf_counter() < deadline:
+                try:
+                    if self.driver.execute_script("return location.href") != "about:blank":
+                        break
+                except WebDriverException:
+                    pass  # document replaced mid-call; ask the new one
+                time.sleep(0.05)
+        wait_until_ready(self.driver, self.criteria, timeout=max(0.5, deadline - time.perf_counter()))
+
+    def _close(self, tabs, original):
+        for tab in tabs:
+            try:
+                self.driver.switch_to.window(tab)
+                self.driver.close()
+            except WebDriverException:
+                pass  # tab already gone
+        self.driver.switch_to.window(original)
+
@@ -0,0 +1,68 @@
+from collections import namedtuple
+from common.locator_race import QUERY_FN, to_strategies
+
+# One harvested element; locator is the (By, selector) that matched it first
+TextItem = namedtuple("TextItem", "text length tag class_name visible locator")
+
+# Walks the strategies in priority order and reads every match's text and attributes in the page,
+# so the whole harvest is one round trip instead of one element.text call per element. An element
+# matched by several strategies is reported once. Waits on DOM mutations (plus a 100 ms safety
+# interval) until something is harvested or timeoutMs has passed.
+_HARVEST_SCRIPT = QUERY_FN + """
+var strategies = arguments[0], minLength = arguments[1], visibleOnly = arguments[2];
+var perLocator = arguments[3], enough = arguments[4], timeoutMs = arguments[5];
+var done = arguments[arguments.length - 1];
+var start = performance.now(), finished = false, observer = null, timer = null;
+
+function harvest() {
+    var items = [], seen = new Set();
+    for (var i = 0; i < strategies.length; i++) {
+        var found = query(strategies[i]), taken = 0;
+        for (var j = 0; j < found.length && (!perLocator || taken < perLocator); j++) {
+            var el = found[j];
+            if (seen.has(el)) continue;
+            seen.add(el);
+            var shown = visible(el);
+            if (visibleOnly && !shown) continue;
+            var text = ((shown ? el.innerText : el.textContent) || '').trim();
+            if (text.length < minLength) continue;
+            taken++;
+            items.push([text, text.length, el.tagName.toLowerCase(), el.getAttribute('class') || '', shown, i]);
+        }
+        if (enough && items.length >= enough) break;
+    }
+    return items;
+}
+function check() {
+    if (finished) return;
+    var items = harvest();
+    if (!items.length && performance.now() - start < timeoutMs) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    if (timer) clearInterval(timer);
+    done(items);
+}
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {childList: true, subtree: true, characterData: true});
+    timer = setInterval(check, 100);
+}
+"""
+
+
+def harvest_text(driver, locators, timeout=0, min_length=1, visible_only=False, per_locator=None, enough=None):
+    """Text, length, tag, class and visibility of every element matching locators, in a single call
+
+    Elements come in locator priority order; per_locator caps the elements taken from one
+    locator and enough stops at the first locator that brings the total to that many.
+    With a timeout the call waits for the page to produce at least one item.
+    """
+    if timeout > 25:
+        driver.set_script_timeout(timeout + 5)
+    locators = list(locators)
+    rows = driver.execute_async_script(_HARVEST_SCRIPT, to_strategies(locators), min_length, visible_only,
+                                       per_locator or 0, enough or 0, timeout * 1000)
+    return [TextItem(text, length, tag, class_name, shown, locators[index])
+            for text, length, tag, class_name, shown, index in rows]
+
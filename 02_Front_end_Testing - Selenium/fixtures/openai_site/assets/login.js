@@ -0,0 +1,33 @@
+// Client-side validation of the Platform login form, mirroring the messages of the live form
+(function () {
+    var form = document.querySelector('.login-form');
+    var error = document.querySelector('.field-error');
+    var email = document.querySelector('input[name="email"]');
+    var phone = document.getElementById('tel');
+    var usePhone = false;
+
+    document.querySelector('.phone-toggle').addEventListener('click', function () {
+        usePhone = !usePhone;
+        document.querySelector('.email-field').hidden = usePhone;
+        document.querySelector('.phone-field').hidden = !usePhone;
+        this.textContent = usePhone ? 'Continue with email' : 'Continue with phone';
+        error.textContent = '';
+        (usePhone ? phone : email).focus();
+    });
+
+    form.addEventListener('submit', function (event) {
+        event.preventDefault();
+        var message = '';
+        if (usePhone) {
+            var digits = phone.value.replace(/\D/g, '');
+            if (!digits) message = 'Phone number is required';
+            else if (digits.length < 8 || digits.length > 15) message = 'Phone number is not valid';
+        } else {
+            var value = email.value.trim();
+            if (!value) message = 'Email is required';
+            else if (!/^[^\s@]+@[^\s@]+\.[^\s@]{2,}$/.test(value)) message = 'Email is not valid';
+        }
+        error.textContent = message;
+        if (!message) error.textContent = 'Check your inbox to continue.';
+    });
+})();
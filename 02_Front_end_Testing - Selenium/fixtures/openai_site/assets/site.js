@@ -0,0 +1,110 @@
+// Behaviour shared by every mirrored openai.com page: search overlay, media buttons and the stories grid
+(function () {
+    var overlay = document.querySelector('.search-overlay');
+    var searchToggle = document.querySelector('.search-toggle');
+    if (overlay && searchToggle) {
+        searchToggle.addEventListener('click', function () {
+            overlay.hidden = !overlay.hidden;
+            if (!overlay.hidden) overlay.querySelector('textarea').focus();
+        });
+        overlay.querySelector('form').addEventListener('submit', function (event) {
+            if (!overlay.querySelector('textarea').value.trim()) event.preventDefault();  // empty search does nothing
+        });
+    }
+
+    var videoToggle = document.querySelector('.video-toggle');
+    if (videoToggle) {
+        videoToggle.addEventListener('click', function () {
+            var video = document.querySelector('.safety-video');
+            var playing = videoToggle.getAttribute('aria-label') === 'Pause video';
+            if (playing) { video.pause(); } else { video.play().catch(function () {}); }
+            videoToggle.setAttribute('aria-label', playing ? 'Play video' : 'Pause video');
+        });
+    }
+
+    var listen = document.querySelector('.listen-button');
+    if (listen) {
+        listen.addEventListener('click', function () {
+            var playing = listen.getAttribute('aria-pressed') === 'true';
+            listen.setAttribute('aria-pressed', playing ? 'false' : 'true');
+            listen.textContent = playing ? 'Listen to article' : 'Pause article';
+        });
+    }
+
+    var grid = document.querySelector('.stories-grid');
+    if (!grid) return;
+
+    var loadMore = document.querySelector('.load-more-button');
+    var endMessage = document.querySelector('.stories-end');
+    var state = {sort: 'newest', total: parseInt(grid.getAttribute('data-total'), 10)};
+
+    function cardCount() { return grid.querySelectorAll('article').length; }
+
+    function query(offset, limit) {
+        var params = new URLSearchParams({offset: offset, limit: limit, sort: state.sort,
+                                          category: grid.getAttribute('data-category') || ''});
+        document.querySelectorAll('.filter-panel input:checked').forEach(function (input) {
+            params.append(input.name, input.value);
+        });
+        return fetch('/_data/stories?' + params.toString()).then(function (response) { return response.json(); });
+    }
+
+    function updateMore() {
+        var done = cardCount() >= state.total;
+        loadMore.hidden = done;
+        endMessage.hidden = !done;
+    }
+
+    function reload() {
+        query(0, Math.max(cardCount(), 12)).then(function (data) {
+            grid.innerHTML = data.html;
+            state.total = data.total;
+            updateMore();
+        });
+    }
+
+    loadMore.addEventListener('click', function () {
+        loadMore.disabled = true;
+        query(cardCount(), 12).then(function (data) {
+            grid.insertAdjacentHTML('beforeend', data.html);
+            state.total = data.total;
+            loadMore.disabled = false;
+            updateMore();
+        });
+    });
+
+    function closePopovers(except) {
+        document.querySelectorAll('.stories-toolbar .popover').forEach(function (popover) {
+            if (popover === except) return;
+            popover.hidden = true;
+            popover.previousElementSibling.setAttribute('aria-expanded', 'false');
+        });
+    }
+
+    document.querySelectorAll('.stories-toolbar .toolbar-control > button').forEach(function (button) {
+        button.addEventListener('click', function (event) {
+            event.stopPropagation();
+            var popover = button.nextElementSibling;
+            closePopovers(popover);
+            popover.hidden = !popover.hidden;
+            button.setAttribute('aria-expanded', String(!popover.hidden));
+        });
+    });
+    document.querySelectorAll('.stories-toolbar .popover').forEach(function (popover) {
+        popover.addEventListener('click', function (event) { event.stopPropagation(); });
+    });
+    document.addEventListener('click', function () { closePopovers(null); });
+
+    document.querySelectorAll('.sort-option').forEach(function (option) {
+        option.addEventListener('click', function () {
+            state.sort = option.getAttribute('data-sort');
+            closePopovers(null);
+            reload();
+        });
+    });
+    document.querySelectorAll('.filter-panel input').forEach(function (input) {
+        input.addEventListener('change', reload);
+    });
+
+    updateMore();
+})();
@@ -0,0 +1,25 @@
+"""openai.com/about: vision header, Plan and Charter links and the news, research and product cards"""
+from selenium.webdriver.common.by import By
+from common.pom import BasePage, Locator
+
+
+class AboutPage(BasePage):
+    """The Company (About) page"""
+
+    path = "/about/"
+
+    vision_header = Locator(By.XPATH, "//h3[normalize-space()='Our vision for the future of AGI']", "Header")
+    plan_link = Locator(By.XPATH, "//a[normalize-space()='Our plan for AGI']", "Our plan for AGI button")
+    charter_link = Locator(By.XPATH, "//a[normalize-space()='Our Charter']", "Our Charter button")
+    latest_news_heading = Locator(By.XPATH, "//h2[normalize-space()='Latest news']", "Latest news section")
+    first_section = Locator(By.XPATH, "//section[1]", "1st card picture")
+    first_card_title = Locator(By.XPATH, "//div[contains(@class,'text-h5')]", "1st card title")
+    # Cards are found by (part of) their aria-label, e.g. card_title(label="Sora 2")
+    card_link = Locator(By.XPATH, "//a[contains(@aria-label,{label})]", "card")
+    card_title = Locator(By.XPATH, "//a[contains(@aria-label,{label})]//div[contains(@class,'text-h5')]", "card title")
+    # Heading of the article a card leads to
+    article_heading = Locator(By.XPATH, "//h1[contains(text(),{text})]", "article heading")
+
+    def card_link_check(self, label, url_contains, title, description):
+        """(click_xpath, url_contains, text_xpath, expected_text, description) for h.verify_links"""
+        return (self.card_link(label=label).value, url_contains, self.article_heading(text=title).value, title, description)
@@ -0,0 +1,39 @@
+"""openai.com/safety: parental controls, video, section links, latest news and search"""
+from selenium.webdriver.common.by import By
+from common.pom import BasePage, Locator
+from common.site_config import platform_login_url
+
+
+class SafetyPage(BasePage):
+    """The Safety page"""
+
+    path = "/safety/"
+
+    parental_controls = Locator(By.XPATH, "(//a[@id='65FG7bFcn1JxADqHbF1nQx'])[1]", "Parental controls card")
+    test_diagram = Locator(By.XPATH, "//div[@class='relative font-mono uppercase md:h-[1080px] md:w-[1920px]']", "Test diagram")
+    where_is_ai_going_video = Locator(
+        By.XPATH, "//div[@class='group relative flex h-full w-full overflow-hidden outline-none rounded-md aspect-16/9 "
+                  "md:aspect-16/9 lg:aspect-16/9 bg-primary-4']", "'Where is AI going?' video")
+    pause_video_button = Locator(By.XPATH, "//div[@class='flex-initial']//button[@aria-label='Pause video']//*[name()='svg']",
+                                 "Pause video button")
+    security_privacy_link = Locator(
+        By.XPATH, "//a[@class='transition ease-curve-a duration-250 ps-3xs pe-xs py-4xs block h-full w-full "
+                  "focus-visible:rounded-sm'][normalize-space()='Security & Privacy']", "Security & Privacy link")
+    go_deeper_section = Locator(
+        By.XPATH, "//body/div[@class='duration-sidebar ease-curve-sidebar grid transition-[grid-template-columns] "
+                  "grid-cols-[0_1fr] md:grid-cols-[0_theme(spacing.nav-width)_1fr]']/div[@class='pt-header-h relative']"
+                  "/div/main[@id='main']/div[@class='flex flex-col mt-10 gap-2xl @md:gap-3xl']/div[3]/div[1]",
+        "Go deeper on safety section")
+    evaluations_hub_link = Locator(By.XPATH, "//a[normalize-space()='Explore the safety evaluations hub']",
+                                   "Explore the safety evaluations hub link")
+    latest_news_heading = Locator(By.XPATH, "//h2[normalize-space()='Latest news on safety']", "Latest news on safety")
+    safety_update_link = Locator(By.XPATH, "//a[@id='56VJpNfXGEenoGLOvzemCi']", "OpenAI Safety Update link")
+    search_button = Locator(By.XPATH, "//button[@aria-label='Open Search']//*[name()='svg']", "Search button")
+    search_input = Locator(
+        By.XPATH, "//textarea[@class='placeholder:text-primary-44 text-h3 @md:text-h2 z-[1] min-h-[1lh] w-full "
+                  "resize-none bg-transparent focus:outline-none']", "Search input")
+    link_to = Locator(By.XPATH, "//a[@href={href}]", "link")
+
+    def api_log_in_link(self):
+        """The 'API log in' link, which opens the platform login in a new tab"""
+        return self.find(self.link_to, href=platform_login_url())
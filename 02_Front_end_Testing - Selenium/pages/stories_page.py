@@ -0,0 +1,58 @@
+"""openai.com/stories: the story cards of the customer stories listing"""
+from common.pom import BasePage
+
+# Collects story cards with a fallback chain: the first strategy that finds anything wins and
+# story links (/stories/<slug>/) are deduplicated by href.
+STORY_CARDS_FN = """
+function storyCards(includeTitles) {
+    var strategies = [
+        function () {
+            return Array.prototype.filter.call(document.querySelectorAll("a[href*='/stories/']"), function (a) {
+                var href = a.getAttribute('href');
+                return href.indexOf('/stories?') < 0 && href.indexOf('/stories#') < 0;
+            });
+        },
+        function () { return document.querySelectorAll("a[href*='/stories/'][href*='-']"); },
+        function () { return document.querySelectorAll('article'); },
+        function () { return document.querySelectorAll('.story-card'); },
+        function () { return document.querySelectorAll("[class*='story-card']"); },
+        function () { return document.querySelectorAll('[data-story]'); }
+    ];
+    function title(card) {
+        var heading = card.querySelector("[class*='text-h'], h2, h3");
+        var text = heading ? heading.innerText : (card.getAttribute('aria-label') || card.textContent);
+        return (text || '').trim();
+    }
+    for (var i = 0; i < strategies.length; i++) {
+        var cards = [], seen = {};
+        Array.prototype.forEach.call(strategies[i](), function (card) {
+            var href = card.tagName === 'A' ? card.href : null;
+            if (card.tagName === 'A') {
+                if (!href || href.indexOf('/stories/') < 0 || seen[href]) return;
+                seen[href] = true;
+            }
+            cards.push(includeTitles ? {href: href, title: title(card)} : {href: href});
+        });
+        if (cards.length) return cards;
+    }
+    return [];
+}
+"""
+STORY_CARDS_JS = STORY_CARDS_FN + "return storyCards(arguments[0]);"
+STORY_COUNT_JS = STORY_CARDS_FN + "return storyCards(false).length;"
+
+
+class StoriesPage(BasePage):
+    """The customer stories listing; cards are collected in one script rather than per element"""
+
+    path = "/stories/"
+
+    def story_cards(self, include_titles=False):
+        """Deduplicated story cards as [{'href': ..., 'title': ...}]; the query counts as one lookup"""
+        return self._lookup(self.driver.execute_script, (STORY_CARDS_JS, include_titles)) or []
+
+    def story_count(self):
+        return len(self.story_cards())
+
+    def story_hrefs(self):
+        return [card["href"] for card in self.story_cards() if card["href"]]
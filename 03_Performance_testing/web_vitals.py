@@ -0,0 +1,251 @@
+"""Measure Core Web Vitals of openai.com pages in a headless browser and check them against budgets
+
+Replaces the manual Lighthouse / GTmetrix / SpeedLab screenshots with numbers a CI job can gate on.
+Every URL is loaded --samples times with a cold cache in a browser from WebDriverFactory; LCP,
+FCP, CLS and TBT come from PerformanceObserver, TTFB from Navigation Timing and transfer bytes
+from CDP Network events (Resource Timing on Firefox). Medians and p90 are reported and the
+chosen statistic is compared with the budgets.
+
+Usage (from the repository root):
+    python 03_Performance_testing/web_vitals.py [/stories/ /safety/ https://...] [--samples 5]
+        [--local | --base-url URL] [--browser chrome] [--profile headless]
+        [--budget lcp=2500 --budget cls=0.1 | --budgets budgets.json] [--stat median|p90] [--json out.json]
+
+--local serves the pages from the bundled offline fixture site (common.fixture_server), so the
+run needs no network. Exit code is 1 when a budget is exceeded.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+SELENIUM_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '02_Front_end_Testing - Selenium'))
+sys.path.append(SELENIUM_DIR)
+from common.driver_factory import WebDriverFactory
+from common.readiness import wait_until_ready
+from common.site_config import BASE_URL_ENV_VAR, site_url
+
+DEFAULT_PATHS = ["/stories/"]  # Constants.STORIES_URL of the Stories suites
+METRICS = ("ttfb", "fcp", "lcp", "tbt", "cls", "transfer_kb")
+UNITS = {"ttfb": "ms", "fcp": "ms", "lcp": "ms", "tbt": "ms", "cls": "", "transfer_kb": "KB"}
+# "Good" thresholds of Core Web Vitals / Lighthouse; the transfer budget matches the stories page today
+DEFAULT_BUDGETS = {"ttfb": 800, "fcp": 1800, "lcp": 2500, "tbt": 200, "cls": 0.1, "transfer_kb": 5000}
+
+# Installed before the page's own scripts (CDP) or, without CDP, right after load with buffered
+# entries. CLS is the largest session window (shifts < 1 s apart, window <= 5 s), as in web-vitals.
+OBSERVER_JS = """
+(function () {
+    if (window.__qaVitals) return;
+    var vitals = window.__qaVitals = {fcp: null, lcp: null, cls: 0, longTasks: [], longTasksSupported: false};
+    var session = {value: 0, start: 0, last: 0};
+    function observe(type, callback) {
+        try {
+            new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+                .observe({type: type, buffered: true});
+            return true;
+        } catch (e) {
+            return false;
+        }
+    }
+    observe('paint', function (entry) { if (entry.name === 'first-contentful-paint') vitals.fcp = entry.startTime; });
+    observe('largest-contentful-paint', function (entry) { vitals.lcp = entry.startTime; });
+    observe('layout-shift', function (entry) {
+        if (entry.hadRecentInput) return;
+        if (session.value && entry.startTime - session.last < 1000 && entry.startTime - session.start < 5000) {
+            session.value += entry.value;
+        } else {
+            session.value = entry.value;
+            session.start = entry.startTime;
+        }
+        session.last = entry.startTime;
+        vitals.cls = Math.max(vitals.cls, session.value);
+    });
+    vitals.longTasksSupported = observe('longtask', function (entry) {
+        vitals.longTasks.push([entry.startTime, entry.duration]);
+    });
+})();
+"""
+
+# Reads the vitals after two animation frames, so buffered observer callbacks have been delivered.
+# TBT sums the blocking part (> 50 ms) of long tasks after FCP up to the time of measurement.
+COLLECT_JS = """
+var done = arguments[arguments.length - 1];
+requestAnimationFrame(function () { requestAnimationFrame(function () { setTimeout(function () {
+    var vitals = window.__qaVitals || {}, nav = performance.getEntriesByType('navigation')[0] || {};
+    var tbt = null;
+    if (vitals.longTasksSupported && vitals.fcp !== null) {
+        tbt = 0;
+        vitals.longTasks.forEach(function (task) { if (task[0] >= vitals.fcp) tbt += Math.max(0, task[1] - 50); });
+    }
+    var bytes = nav.transferSize || 0;
+    performance.getEntriesByType('resource').forEach(function (entry) { bytes += entry.transferSize || 0; });
+    done({ttfb: nav.responseStart || null, fcp: vitals.fcp, lcp: vitals.lcp, cls: vitals.cls === undefined ? null : vitals.cls,
+          tbt: tbt, resourceTimingBytes: bytes});
+}, 0); }); });
+"""
+
+
+def sample_page(driver, url, settle_ms=1000, timeout=30):
+    """One cold-cache load of url and its metrics: ttfb/fcp/lcp/tbt in ms, cls, transfer_kb"""
+    chromium = getattr(driver, "qa_network_events", False)
+    script_id = None
+    network_log = []
+    if chromium:
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        script_id = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_JS})["identifier"]
+        driver.get_log("performance")  # drop events of earlier pages
+    try:
+        driver.get(url)
+        wait_until_ready(driver, ("load", "network-idle"), timeout=timeout, idle_ms=settle_ms, network_log=network_log)
+        if not chromium:
+            driver.execute_script(OBSERVER_JS)
+        metrics = driver.execute_async_script(COLLECT_JS)
+    finally:
+        if script_id is not None:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id})
+
+    if chromium:
+        transfer_bytes = sum(message["params"].get("encodedDataLength", 0) for message in network_log
+                             if message.get("method") == "Network.loadingFinished")
+    else:
+        transfer_bytes = metrics["resourceTimingBytes"]
+    return {
+        "ttfb": metrics["ttfb"],
+        "fcp": metrics["fcp"],
+        "lcp": metrics["lcp"],
+        "tbt": metrics["tbt"],
+        "cls": metrics["cls"],
+        "transfer_kb": transfer_bytes / 1024,
+    }
+
+
+def percentile(values, fraction):
+    """Linearly interpolated percentile, e.g. fraction=0.9 for p90"""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples):
+    """{metric: {"median", "p90", "samples"}} over the samples that produced the metric"""
+    summary = {}
+    for metric in METRICS:
+        values = [sample[metric] for sample in samples if sample.get(metric) is not None]
+        summary[metric] = {
+            "median": statistics.median(values) if values else None,
+            "p90": percentile(values, 0.9) if values else None,
+            "samples": values,
+        }
+    return summary
+
+
+def check_budgets(summary, budgets, stat="median"):
+    """[(metric, value, budget)] for every budgeted metric whose statistic is over budget"""
+    return [(metric, summary[metric][stat], budget) for metric, budget in budgets.items()
+            if summary.get(metric, {}).get(stat) is not None and summary[metric][stat] > budget]
+
+
+def measure(urls, samples=5, browser="chrome", profile="headless", settle_ms=1000):
+    """{url: [sample, ...]}, one browser for the whole run"""
+    driver = WebDriverFactory.create_driver(browser, profile=profile)
+    results = {}
+    try:
+        for url in urls:
+            results[url] = []
+            for index in range(samples):
+                start = time.perf_counter()
+                sample = sample_page(driver, url, settle_ms)
+                results[url].append(sample)
+                print(f"{url} sample {index + 1}/{samples} ({time.perf_counter() - start:.1f}s): "
+                      + ", ".join(f"{metric}={_format(sample[metric])}" for metric in METRICS))
+    finally:
+        WebDriverFactory.release_driver(driver, browser)
+    return results
+
+
+def print_summary(url, summary, budgets, stat):
+    print(f"\n{url}")
+    print(f"  {'metric':<12} {'median':>10} {'p90':>10} {'budget':>10}  status")
+    for metric in METRICS:
+        data, budget = summary[metric], budgets.get(metric)
+        if data[stat] is None:
+            status = "n/a"
+        elif budget is None:
+            status = "-"
+        else:
+            status = "OK" if data[stat] <= budget else f"OVER ({stat})"
+        print(f"  {metric:<12} {_format(data['median']):>10} {_format(data['p90']):>10} "
+              f"{_format(budget) if budget is not None else '-':>10}  {status}")
+
+
+def parse_budgets(pairs, path=None):
+    budgets = dict(DEFAULT_BUDGETS)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            budgets.update(json.load(f))
+    for pair in pairs or []:
+        metric, _, value = pair.partition("=")
+        if metric not in METRICS or not value:
+            raise ValueError(f"Bad budget '{pair}', expected <metric>=<number> with metric one of: {', '.join(METRICS)}")
+        budgets[metric] = float(value)
+    return budgets
+
+
+def _format(value):
+    if value is None:
+        return "n/a"
+    return f"{value:.3f}" if isinstance(value, float) and value < 1 else f"{value:.0f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="site paths like /stories/ or absolute URLs (default: /stories/)")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--browser", default="chrome", choices=["chrome", "edge", "firefox"])
+    parser.add_argument("--profile", default="headless", help="launch profile (see common.launch_profiles)")
+    parser.add_argument("--local", action="store_true", help="measure the bundled offline fixture site")
+    parser.add_argument("--base-url", help="measure a running fixture server or another deployment")
+    parser.add_argument("--settle-ms", type=int, default=1000, help="network quiet period that ends a sample")
+    parser.add_argument("--budget", action="append", metavar="METRIC=VALUE", help=f"one of: {', '.join(METRICS)}")
+    parser.add_argument("--budgets", help="JSON file of {metric: budget}")
+    parser.add_argument("--stat", choices=["median", "p90"], default="median", help="statistic checked against budgets")
+    parser.add_argument("--json", help="write samples, summaries and budget results here")
+    args = parser.parse_args(argv)
+
+    if args.local:
+        os.environ[BASE_URL_ENV_VAR] = "local"
+    elif args.base_url:
+        os.environ[BASE_URL_ENV_VAR] = args.base_url
+    budgets = parse_budgets(args.budget, args.budgets)
+    urls = [page if "://" in page else site_url(page) for page in (args.pages or DEFAULT_PATHS)]
+
+    results = measure(urls, args.samples, args.browser, args.profile, args.settle_ms)
+    report, failures = {}, []
+    for url, samples in results.items():
+        summary = summarize(samples)
+        over = check_budgets(summary, budgets, args.stat)
+        print_summary(url, summary, budgets, args.stat)
+        failures.extend((url, *item) for item in over)
+        report[url] = {"summary": summary, "over_budget": [metric for metric, _, _ in over]}
+
+    print()
+    if failures:
+        for url, metric, value, budget in failures:
+            print(f"OVER BUDGET: {url} {metric} {args.stat} {_format(value)}{UNITS[metric]} > {_format(budget)}{UNITS[metric]}")
+    else:
+        print(f"All pages within budget ({args.stat} of {args.samples} samples)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"browser": args.browser, "profile": args.profile, "stat": args.stat,
+                       "budgets": budgets, "pages": report}, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,318 @@
+"""Audit security headers, cookie flags and mixed content of openai.com pages, many URLs at a time
+
+An automated counterpart of the HTTP / Astra / ImmuniWeb scanner screenshots in this folder.
+Every URL is fetched over one pooled aiohttp session and checked for:
+  headers      Content-Security-Policy, Strict-Transport-Security, X-Frame-Options (or CSP
+               frame-ancestors), X-Content-Type-Options, Referrer-Policy, Permissions-Policy,
+               and version-leaking Server / X-Powered-By values
+  cookies      Secure, HttpOnly and SameSite flags and the __Host- / __Secure- prefix rules
+  mixed content  http:// scripts, frames, styles, forms (active) and images/media (passive)
+               referenced by an https page (--assume-https applies the check to http pages,
+               e.g. the offline fixtures)
+Findings carry a severity (high, medium, low, info); the JSON report lists them per URL with
+totals, and the exit code is 1 when a finding at or above --fail-on is present.
+
+Usage (from the repository root):
+    python 04_Security_testing/security_scan.py [URL or /path ...] [--urls urls.txt] [--crawl 200]
+        [--local | --base-url URL] [--concurrency 50] [--assume-https] [--fail-on high] [--json report.json]
+
+Without URLs the site root is scanned; paths are resolved against the configured site
+(OPENAI_QA_BASE_URL, see common.site_config) and --local serves the offline fixture site.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from http.cookies import SimpleCookie
+from urllib.parse import urldefrag, urljoin, urlsplit
+import aiohttp
+
+SELENIUM_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '02_Front_end_Testing - Selenium'))
+sys.path.append(SELENIUM_DIR)
+from common.site_config import BASE_URL_ENV_VAR, site_url
+
+SEVERITIES = ("info", "low", "medium", "high")
+HSTS_MIN_MAX_AGE = 15552000  # 180 days
+WEAK_REFERRER_POLICIES = {"unsafe-url", "no-referrer-when-downgrade"}
+SENSITIVE_COOKIE = re.compile(r"sess|auth|token|sid|login|csrf|xsrf", re.I)
+VERSION_LEAK = re.compile(r"\d+\.\d+")
+
+# Tags whose URL attributes load sub-resources; "active" ones can run code or read the page when loaded over http
+TAG_PATTERN = re.compile(r"<(script|iframe|frame|link|form|object|embed|img|audio|video|source|track|input)\b([^>]*)>", re.I)
+ATTRIBUTE_PATTERN = re.compile(r"""\b(src|href|action|data|srcset|poster)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+CSS_URL_PATTERN = re.compile(r"""url\(\s*['"]?(http://[^'")\s]+)""", re.I)
+LINK_PATTERN = re.compile(r"""<a\b[^>]*?\bhref\s*=\s*["']([^"'#]+)""", re.I)
+ACTIVE_TAGS = {"script", "iframe", "frame", "object", "embed", "form"}
+
+
+def finding(check, severity, message):
+    return {"check": check, "severity": severity, "message": message}
+
+
+def audit_headers(url, headers):
+    """Findings for the security headers of one response"""
+    https = url.startswith("https://")
+    findings = []
+    csp = headers.get("Content-Security-Policy", "")
+    directives = {}
+    for directive in csp.split(";"):
+        name, _, value = directive.strip().partition(" ")
+        if name:
+            directives[name.lower()] = value.split()
+    if not csp:
+        level = "low" if headers.get("Content-Security-Policy-Report-Only") else "medium"
+        findings.append(finding("csp", level, "Content-Security-Policy missing" +
+                                (" (only Report-Only is set)" if level == "low" else "")))
+    else:
+        scripts = directives.get("script-src", directives.get("default-src"))
+        if scripts is None:
+            findings.append(finding("csp", "medium", "CSP has neither script-src nor default-src"))
+        else:
+            for keyword in ("'unsafe-inline'", "'unsafe-eval'"):
+                nonce_or_hash = any(source.startswith(("'nonce-", "'sha256-", "'sha384-", "'sha512-")) for source in scripts)
+                if keyword in scripts and not (keyword == "'unsafe-inline'" and nonce_or_hash):
+                    findings.append(finding("csp", "low", f"CSP script sources allow {keyword}"))
+            if "*" in scripts or "http:" in scripts or "data:" in scripts:
+                findings.append(finding("csp", "medium", "CSP script sources allow any host, http: or data:"))
+        if "object-src" not in directives and "default-src" not in directives:
+            findings.append(finding("csp", "low", "CSP does not restrict object-src"))
+
+    if https:
+        hsts = headers.get("Strict-Transport-Security", "")
+        match = re.search(r"max-age\s*=\s*\"?(\d+)", hsts, re.I)
+        if not hsts:
+            findings.append(finding("hsts", "high", "Strict-Transport-Security missing"))
+        elif not match or int(match.group(1)) < HSTS_MIN_MAX_AGE:
+            findings.append(finding("hsts", "medium", f"HSTS max-age below {HSTS_MIN_MAX_AGE} s: '{hsts}'"))
+        elif "includesubdomains" not in hsts.lower():
+            findings.append(finding("hsts", "info", "HSTS without includeSubDomains"))
+
+    frame_options = headers.get("X-Frame-Options", "").strip().upper()
+    if "frame-ancestors" not in directives and frame_options not in ("DENY", "SAMEORIGIN"):
+        findings.append(finding("x-frame-options", "medium", "Clickjacking protection missing: no X-Frame-Options "
+                                "DENY/SAMEORIGIN and no CSP frame-ancestors" +
+                                (f" (X-Frame-Options is '{frame_options}')" if frame_options else "")))
+    if headers.get("X-Content-Type-Options", "").strip().lower() != "nosniff":
+        findings.append(finding("x-content-type-options", "low", "X-Content-Type-Options: nosniff missing"))
+
+    referrer = headers.get("Referrer-Policy", "").strip().lower()
+    if not referrer:
+        findings.append(finding("referrer-policy", "low", "Referrer-Policy missing"))
+    elif referrer.split(",")[-1].strip() in WEAK_REFERRER_POLICIES:
+        findings.append(finding("referrer-policy", "medium", f"Referrer-Policy '{referrer}' leaks full URLs"))
+    if not headers.get("Permissions-Policy"):
+        findings.append(finding("permissions-policy", "low", "Permissions-Policy missing"))
+
+    for name in ("Server", "X-Powered-By", "X-AspNet-Version"):
+        value = headers.get(name, "")
+        if VERSION_LEAK.search(value):
+            findings.append(finding("information-leak", "low", f"{name} reveals a version: '{value}'"))
+    return findings
+
+
+def audit_cookies(url, set_cookie_headers):
+    """Findings for every Set-Cookie header of one response"""
+    https = url.startswith("https://")
+    findings = []
+    for header in set_cookie_headers:
+        cookie = SimpleCookie()
+        try:
+            cookie.load(header)
+        except Exception:
+            findings.append(finding("cookie", "info", f"Unparsable Set-Cookie header: '{header[:80]}'"))
+            continue
+        for name, morsel in cookie.items():
+            flags = {part.strip().split("=")[0].lower() for part in header.split(";")[1:]}
+            same_site = morsel["samesite"].lower()
+            sensitive = bool(SENSITIVE_COOKIE.search(name))
+            if https and "secure" not in flags:
+                findings.append(finding("cookie", "high" if sensitive else "medium", f"Cookie {name} without Secure"))
+            if sensitive and "httponly" not in flags:
+                findings.append(finding("cookie", "medium", f"Session-like cookie {name} without HttpOnly"))
+            if not same_site:
+                findings.append(finding("cookie", "low", f"Cookie {name} without SameSite"))
+            elif same_site == "none" and "secure" not in flags:
+                findings.append(finding("cookie", "medium", f"Cookie {name} is SameSite=None without Secure"))
+            if name.startswith("__Host-") and ("secure" not in flags or morsel["domain"] or morsel["path"] != "/"):
+                findings.append(finding("cookie", "medium", f"Cookie {name} breaks the __Host- prefix rules"))
+            elif name.startswith("__Secure-") and "secure" not in flags:
+                findings.append(finding("cookie", "medium", f"Cookie {name} breaks the __Secure- prefix rules"))
+    return findings
+
+
+def audit_mixed_content(page):
+    """Findings for http:// sub-resources referenced by an HTML page served (or assumed) over https"""
+    findings = []
+    seen = set()
+    for tag, attributes in TAG_PATTERN.findall(page):
+        tag = tag.lower()
+        for attribute, *values in ATTRIBUTE_PATTERN.findall(attributes):
+            attribute = attribute.lower()
+            if tag == "link" and attribute == "href" and not re.search(r"rel\s*=\s*['\"]?[^'\">]*(stylesheet|preload|icon|manifest)", attributes, re.I):
+                continue  # rel=canonical/alternate links are navigations, not sub-resources
+            value = next(value for value in values if value) if any(values) else ""
+            urls = [candidate.split()[0] for candidate in value.split(",") if candidate.strip()] if attribute == "srcset" else [value]
+            for reference in urls:
+                if reference.lower().startswith("http://") and (tag, reference) not in seen:
+                    seen.add((tag, reference))
+                    active = tag in ACTIVE_TAGS or (tag == "link" and "stylesheet" in attributes.lower())
+                    findings.append(finding("mixed-content", "high" if active else "low",
+                                            f"{'Active' if active else 'Passive'} mixed content: <{tag} {attribute}> {reference}"))
+    for reference in sorted(set(CSS_URL_PATTERN.findall(page))):
+        findings.append(finding("mixed-content", "low", f"Passive mixed content: CSS url() {reference}"))
+    return findings
+
+
+def same_site_links(base, page):
+    """Absolute same-host page links of an HTML page, fragments removed"""
+    host = urlsplit(base).netloc
+    links = set()
+    for href in LINK_PATTERN.findall(page):
+        url = urldefrag(urljoin(base, href.strip()))[0]
+        if urlsplit(url).netloc == host and url.startswith(("http://", "https://")):
+            links.add(url)
+    return links
+
+
+class SecurityScanner:
+    """Fetches URLs concurrently over one pooled session and audits every response"""
+
+    def __init__(self, concurrency=50, timeout=20.0, assume_https=False, crawl_limit=0):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.assume_https = assume_https
+        self.crawl_limit = crawl_limit
+        self.results = []
+
+    async def scan(self, urls):
+        queue = asyncio.Queue()
+        queued = set()
+        for url in urls:
+            if url not in queued:
+                queued.add(url)
+                queue.put_nowait(url)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency, ttl_dns_cache=300)
+        headers = {"User-Agent": "Mozilla/5.0 (security-scan; +openai-qa)", "Accept": "text/html,*/*;q=0.8"}
+        async with aiohttp.ClientSession(connector=connector, headers=headers,
+                                         timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
+
+            async def worker():
+                while True:
+                    url = await queue.get()
+                    try:
+                        links = await self._scan_one(session, url)
+                        for link in links:
+                            if link not in queued and len(queued) < self.crawl_limit:
+                                queued.add(link)
+                                queue.put_nowait(link)
+                    finally:
+                        queue.task_done()
+
+            workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+            await queue.join()
+            for task in workers:
+                task.cancel()
+        return self.results
+
+    async def _scan_one(self, session, url):
+        start = time.perf_counter()
+        result = {"url": url, "final_url": url, "status": None, "findings": []}
+        self.results.append(result)
+        try:
+            async with session.get(url, allow_redirects=True) as response:
+                final_url = str(response.url)
+                page = await response.text(errors="replace") if "html" in response.content_type else ""
+                result.update(final_url=final_url, status=response.status,
+                              headers={name: response.headers.get(name) for name in (
+                                  "Content-Security-Policy", "Strict-Transport-Security", "X-Frame-Options",
+                                  "X-Content-Type-Options", "Referrer-Policy", "Permissions-Policy") if name in response.headers})
+                findings = audit_headers(final_url, response.headers)
+                set_cookies = [value for hop in list(response.history) + [response]
+                               for value in hop.headers.getall("Set-Cookie", [])]
+                findings += audit_cookies(final_url, set_cookies)
+                if url.startswith("https://") and final_url.startswith("http://"):
+                    findings.append(finding("transport", "high", f"https request redirected to {final_url}"))
+                if page and (final_url.startswith("https://") or self.assume_https):
+                    findings += audit_mixed_content(page)
+                result["findings"] = findings
+                return same_site_links(final_url, page) if self.crawl_limit and page else set()
+        except asyncio.TimeoutError:
+            result["error"] = "timeout"
+        except aiohttp.ClientError as error:
+            result["error"] = f"{type(error).__name__}: {error}"
+        finally:
+            result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return set()
+
+
+def summarize(results):
+    by_severity = {severity: 0 for severity in reversed(SEVERITIES)}
+    by_check = {}
+    for result in results:
+        for item in result["findings"]:
+            by_severity[item["severity"]] += 1
+            by_check[item["check"]] = by_check.get(item["check"], 0) + 1
+    return {"urls": len(results), "errors": sum(1 for result in results if "error" in result),
+            "findings_by_severity": by_severity, "findings_by_check": dict(sorted(by_check.items()))}
+
+
+def print_report(results, summary, elapsed, fail_on):
+    threshold = SEVERITIES.index(fail_on)
+    for result in sorted(results, key=lambda result: result["url"]):
+        serious = [item for item in result["findings"] if SEVERITIES.index(item["severity"]) >= threshold]
+        if serious or "error" in result:
+            print(f"\n{result['url']} [{result.get('status') or result.get('error')}]")
+            for item in serious:
+                print(f"  {item['severity'].upper():<6} {item['check']:<22} {item['message']}")
+    print(f"\nScanned {summary['urls']} URLs in {elapsed:.1f}s ({summary['urls'] / elapsed:.0f}/s), "
+          f"{summary['errors']} failed to load")
+    print("  findings: " + ", ".join(f"{severity} {count}" for severity, count in summary["findings_by_severity"].items()))
+    print("  by check: " + ", ".join(f"{check} {count}" for check, count in summary["findings_by_check"].items()))
+
+
+def read_url_list(path):
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", help="absolute URLs or site paths like /stories/")
+    parser.add_argument("--urls", help="file with one URL or path per line")
+    parser.add_argument("--crawl", type=int, default=0, metavar="N", help="follow same-host links up to N URLs in total")
+    parser.add_argument("--local", action="store_true", help="scan the bundled offline fixture site")
+    parser.add_argument("--base-url", help="site the paths are resolved against")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=20)
+    parser.add_argument("--assume-https", action="store_true", help="check mixed content on http pages too")
+    parser.add_argument("--fail-on", choices=SEVERITIES, default="high", help="lowest severity that fails the run")
+    parser.add_argument("--json", help="write the full report here")
+    args = parser.parse_args(argv)
+
+    if args.local:
+        os.environ[BASE_URL_ENV_VAR] = "local"
+    elif args.base_url:
+        os.environ[BASE_URL_ENV_VAR] = args.base_url
+    targets = args.targets + (read_url_list(args.urls) if args.urls else [])
+    urls = [target if "://" in target else site_url(target) for target in (targets or ["/"])]
+
+    scanner = SecurityScanner(args.concurrency, args.timeout, args.assume_https, args.crawl)
+    start = time.perf_counter()
+    results = asyncio.run(scanner.scan(urls))
+    elapsed = time.perf_counter() - start
+    summary = summarize(results)
+    print_report(results, summary, elapsed, args.fail_on)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"generated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "elapsed_s": round(elapsed, 2),
+                       "summary": summary, "results": sorted(results, key=lambda result: result["url"])}, f, indent=2)
+    threshold = SEVERITIES.index(args.fail_on)
+    failed = any(SEVERITIES.index(item["severity"]) >= threshold for result in results for item in result["findings"])
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
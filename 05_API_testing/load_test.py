@@ -0,0 +1,306 @@
+"""Load test the OpenAI REST API (or a local stand-in) with open-model or closed-model traffic
+
+Open model (--rate): requests arrive at a fixed rate, evenly spaced or Poisson, no matter how
+fast the server answers; this is how real clients hit an API and shows queueing and 429s.
+Closed model (--users): N virtual users each send a request, wait for the answer, optionally
+think, and send the next; throughput is then limited by latency.
+
+All requests share one aiohttp session, so connections are pooled and kept alive
+(--connections caps the pool). Latency percentiles, throughput, error and 429 rates are
+reported for the whole run and per --interval seconds.
+
+Usage:
+    OPENAI_API_KEY=sk-... python 05_API_testing/load_test.py --rate 50 --duration 30 [--arrivals poisson]
+    python 05_API_testing/load_test.py --users 20 --duration 30 [--think-ms 500] [--respect-retry-after]
+        [--base-url http://127.0.0.1:8080/v1] [--endpoint chat|models|/custom/path]
+        [--model gpt-4o-mini] [--max-tokens 16] [--stream] [--json report.json]
+
+The base URL and key default to OPENAI_API_BASE (https://api.openai.com/v1) and OPENAI_API_KEY.
+Against a local base URL (e.g. mock_openai_server.py) with no key set, the placeholder key
+sk-mock is sent, which the mock accepts unless it was started with its own --api-key.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+from urllib.parse import urlsplit
+import aiohttp
+
+API_BASE_ENV_VAR = "OPENAI_API_BASE"
+API_KEY_ENV_VAR = "OPENAI_API_KEY"
+DEFAULT_API_BASE = "https://api.openai.com/v1"
+MOCK_API_KEY = "sk-mock"  # mock_openai_server.py accepts any key starting with sk- by default
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, math.ceil(percent / 100 * len(values)) - 1))]
+
+
+def build_request(endpoint, model, prompt, max_tokens, stream=False):
+    """(method, path, json body) of one request to endpoint: chat, models or a literal path"""
+    if endpoint == "chat":
+        body = {"model": model, "messages": [{"role": "user", "content": prompt}], "max_tokens": max_tokens}
+        if stream:
+            body["stream"] = True
+        return "POST", "/chat/completions", body
+    if endpoint == "models":
+        return "GET", "/models", None
+    return "GET", endpoint if endpoint.startswith("/") else "/" + endpoint, None
+
+
+class LoadStats:
+    """Outcome of every request, bucketed by the second of the run it started in"""
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.latencies = []
+        self.statuses = {}
+        self.errors = {}
+        self.dropped = 0
+        self.buckets = {}
+
+    def record(self, start, latency, status=None, error=None):
+        index = int((start - self.started) / self.interval)
+        bucket = self.buckets.setdefault(index, {"requests": 0, "errors": 0, "throttled": 0, "latencies": []})
+        bucket["requests"] += 1
+        if status is not None:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        if status == 429:
+            bucket["throttled"] += 1
+        if error is not None or status is None or status >= 400:
+            bucket["errors"] += 1
+        else:
+            self.latencies.append(latency)
+            bucket["latencies"].append(latency)
+
+    @property
+    def requests(self):
+        return sum(bucket["requests"] for bucket in self.buckets.values())
+
+    def summary(self, elapsed):
+        latencies = sorted(self.latencies)
+        requests = self.requests
+        failed = requests - len(latencies)
+        return {
+            "requests": requests,
+            "ok": len(latencies),
+            "failed": failed,
+            "dropped": self.dropped,
+            "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+            "error_rate": failed / requests if requests else 0.0,
+            "throttle_rate": self.statuses.get(429, 0) / requests if requests else 0.0,
+            "latency_ms": _latency_summary(latencies),
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "errors": self.errors,
+        }
+
+    def timeline(self):
+        rows = []
+        for index in sorted(self.buckets):
+            bucket = self.buckets[index]
+            latencies = sorted(bucket["latencies"])
+            rows.append({
+                "t": index * self.interval,
+                "requests": bucket["requests"],
+                "rps": len(latencies) / self.interval,
+                "error_rate": bucket["errors"] / bucket["requests"],
+                "throttle_rate": bucket["throttled"] / bucket["requests"],
+                "p50_ms": percentile(latencies, 50),
+                "p99_ms": percentile(latencies, 99),
+            })
+        return rows
+
+
+class LoadGenerator:
+    """Sends the configured request over one pooled session and records each outcome in stats"""
+
+    def __init__(self, base_url, request, api_key="", connections=100, timeout=60.0, interval=1.0):
+        self.base_url = base_url.rstrip("/")
+        self.method, self.path, self.body = request
+        self.api_key = api_key
+        self.connections = connections
+        self.timeout = timeout
+        self.stats = LoadStats(interval)
+        self.session = None
+
+    async def __aenter__(self):
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        connector = aiohttp.TCPConnector(limit=self.connections, limit_per_host=self.connections,
+                                         keepalive_timeout=30, ttl_dns_cache=300)
+        self.session = aiohttp.ClientSession(connector=connector, headers=headers,
+                                             timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+
+    async def send(self):
+        """One request; returns (status, Retry-After seconds or None), status None on a transport error"""
+        start = time.perf_counter()
+        try:
+            async with self.session.request(self.method, self.base_url + self.path, json=self.body) as response:
+                async for _ in response.content.iter_any():  # read (and discard) the body, streamed or not
+                    pass
+                self.stats.record(start, (time.perf_counter() - start) * 1000, response.status)
+                return response.status, _retry_after(response.headers.get("Retry-After"))
+        except asyncio.TimeoutError:
+            self.stats.record(start, (time.perf_counter() - start) * 1000, error="timeout")
+        except aiohttp.ClientError as error:
+            self.stats.record(start, (time.perf_counter() - start) * 1000, error=type(error).__name__)
+        return None, None
+
+    async def run_open(self, rate, duration, arrivals="constant", max_in_flight=None):
+        """Start requests at rate per second for duration seconds; arrivals over max_in_flight are dropped"""
+        in_flight = set()
+        start = time.perf_counter()
+        next_at = 0.0
+        while next_at < duration:
+            delay = start + next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if max_in_flight and len(in_flight) >= max_in_flight:
+                self.stats.dropped += 1
+            else:
+                task = asyncio.ensure_future(self.send())
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            next_at += random.expovariate(rate) if arrivals == "poisson" else 1.0 / rate
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+    async def run_closed(self, users, duration, think_ms=0, respect_retry_after=False):
+        """Users virtual users in a send / wait / think loop until duration seconds have passed"""
+        deadline = time.perf_counter() + duration
+
+        async def user():
+            while time.perf_counter() < deadline:
+                status, retry_after = await self.send()
+                pause = think_ms / 1000
+                if status == 429 and respect_retry_after and retry_after:
+                    pause = max(pause, retry_after)
+                if pause:
+                    await asyncio.sleep(min(pause, max(0.0, deadline - time.perf_counter())))
+
+        await asyncio.gather(*(user() for _ in range(users)))
+
+
+async def run(args):
+    request = build_request(args.endpoint, args.model, args.prompt, args.max_tokens, args.stream)
+    connections = args.connections or (args.users if args.users else 100)
+    async with LoadGenerator(args.base_url, request, args.api_key, connections, args.timeout, args.interval) as generator:
+        reporter = asyncio.ensure_future(_report_progress(generator.stats, args.interval))
+        start = time.perf_counter()
+        try:
+            if args.users:
+                await generator.run_closed(args.users, args.duration, args.think_ms, args.respect_retry_after)
+            else:
+                await generator.run_open(args.rate, args.duration, args.arrivals, args.max_in_flight)
+        finally:
+            reporter.cancel()
+        return generator.stats, time.perf_counter() - start
+
+
+async def _report_progress(stats, interval):
+    reported = 0
+    while True:
+        await asyncio.sleep(interval)
+        requests = stats.requests
+        print(f"  {time.perf_counter() - stats.started:6.1f}s  {requests - reported:5d} requests  "
+              f"statuses {dict(sorted(stats.statuses.items()))}  errors {stats.errors or '{}'}")
+        reported = requests
+
+
+def print_report(summary, timeline, label):
+    latency = summary["latency_ms"]
+    print(f"\n{label}")
+    print(f"  requests {summary['requests']}  ok {summary['ok']}  failed {summary['failed']}  dropped {summary['dropped']}")
+    print(f"  throughput {summary['throughput_rps']:.1f} req/s  error rate {summary['error_rate']:.1%}  "
+          f"429 rate {summary['throttle_rate']:.1%}")
+    if latency:
+        print("  latency ms  " + "  ".join(f"{name} {value:.1f}" for name, value in latency.items()))
+    print(f"  statuses {summary['statuses']}  errors {summary['errors']}")
+    print(f"\n  {'t(s)':>6} {'req':>6} {'ok/s':>8} {'err':>7} {'429':>7} {'p50 ms':>9} {'p99 ms':>9}")
+    for row in timeline:
+        print(f"  {row['t']:6.0f} {row['requests']:6d} {row['rps']:8.1f} {row['error_rate']:7.1%} "
+              f"{row['throttle_rate']:7.1%} {_ms(row['p50_ms']):>9} {_ms(row['p99_ms']):>9}")
+
+
+def _latency_summary(latencies):
+    if not latencies:
+        return {}
+    summary = {"min": latencies[0], "mean": sum(latencies) / len(latencies)}
+    summary.update({f"p{percent}": percentile(latencies, percent) for percent in PERCENTILES})
+    summary["max"] = latencies[-1]
+    return summary
+
+
+def _retry_after(value):
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None  # HTTP-date form; treated as unknown
+
+
+def api_key_for(base_url, api_key):
+    """api_key, or the placeholder MOCK_API_KEY when none is set and base_url is a local stand-in"""
+    if api_key or urlsplit(base_url).hostname not in LOCAL_HOSTS:
+        return api_key
+    return MOCK_API_KEY
+
+
+def _ms(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    model = parser.add_mutually_exclusive_group(required=True)
+    model.add_argument("--rate", type=float, help="open model: requests started per second")
+    model.add_argument("--users", type=int, help="closed model: concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of traffic")
+    parser.add_argument("--arrivals", choices=["constant", "poisson"], default="constant")
+    parser.add_argument("--max-in-flight", type=int, help="open model: drop arrivals beyond this many outstanding requests")
+    parser.add_argument("--think-ms", type=float, default=0, help="closed model: pause between a user's requests")
+    parser.add_argument("--respect-retry-after", action="store_true", help="closed model: back off on 429 as told")
+    parser.add_argument("--base-url", default=os.environ.get(API_BASE_ENV_VAR, DEFAULT_API_BASE))
+    parser.add_argument("--api-key", default=os.environ.get(API_KEY_ENV_VAR, ""))
+    parser.add_argument("--endpoint", default="chat", help="chat, models or a path under the base URL")
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--prompt", default="Say hello in one short sentence.")
+    parser.add_argument("--max-tokens", type=int, default=16)
+    parser.add_argument("--stream", action="store_true", help="ask chat completions for an SSE stream")
+    parser.add_argument("--connections", type=int, help="connection pool size (default: users, or 100)")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds before a request counts as failed")
+    parser.add_argument("--interval", type=float, default=1.0, help="timeline bucket in seconds")
+    parser.add_argument("--json", help="write the summary and timeline here")
+    args = parser.parse_args(argv)
+    if (args.rate is not None and args.rate <= 0) or (args.users is not None and args.users <= 0):
+        parser.error("--rate and --users must be positive")
+    args.api_key = api_key_for(args.base_url, args.api_key)
+
+    label = f"{args.users} users" if args.users else f"{args.rate:g} req/s {args.arrivals}"
+    label = f"{label} for {args.duration:g}s against {args.base_url.rstrip('/')}{build_request(args.endpoint, '', '', 0)[1]}"
+    print(label)
+    stats, elapsed = asyncio.run(run(args))
+    summary, timeline = stats.summary(elapsed), stats.timeline()
+    print_report(summary, timeline, label)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"scenario": label, "summary": summary, "timeline": timeline}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
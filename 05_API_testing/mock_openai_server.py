@@ -0,0 +1,301 @@
+"""Local stand-in for the OpenAI REST API, for offline and load testing of the API area
+
+Implements GET /v1/models, GET /v1/models/{id} and POST /v1/chat/completions (JSON or SSE
+stream) with OpenAI's response and error shapes: 401 for a missing or wrong key, 404 for an
+unknown model, 400 for a bad body, 429 from a per-key token bucket with Retry-After and
+x-ratelimit-* headers, and injected 5xx faults. GET /mock/stats returns the request counters.
+
+Latencies are distributions in milliseconds: fixed:50, uniform:20:80, normal:50:10,
+lognormal:<median>:<sigma> or exp:<mean>. --latency is applied before the first byte,
+--token-latency between streamed chunks. A request can force a fault with the header
+X-Mock-Fault: <status>.
+
+Responses are assembled from pre-encoded fragments and nothing is logged per request, so one
+core serves thousands of requests per second and the server does not skew load test numbers.
+
+Usage (from the repository root):
+    python 05_API_testing/mock_openai_server.py [--port 8080] [--latency lognormal:120:0.4]
+        [--token-latency uniform:5:20] [--rate-limit 50 --burst 100] [--fault-rate 0.01]
+        [--fault-statuses 500,502,503] [--abort-rate 0.01] [--api-key sk-test]
+Then point clients at http://127.0.0.1:8080/v1 (OPENAI_API_BASE for load_test.py).
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import sys
+import threading
+import time
+from aiohttp import web
+
+MODELS = ("gpt-4o", "gpt-4o-mini", "gpt-4.1", "gpt-4.1-mini", "o3-mini", "text-embedding-3-small")
+DEFAULT_MAX_TOKENS = 16
+COMPLETION_WORDS = ("Hello! This is a simulated response from the local mock of the OpenAI API, "
+                    "generated one word at a time so streaming clients see realistic chunks.").split()
+JSON_HEADERS = {"Content-Type": "application/json"}
+SSE_HEADERS = {"Content-Type": "text/event-stream", "Cache-Control": "no-cache", "Connection": "keep-alive"}
+FAULT_MESSAGES = {
+    500: "The server had an error while processing your request. Sorry about that!",
+    502: "Bad gateway.",
+    503: "The engine is currently overloaded, please try again later.",
+    504: "Gateway timeout.",
+}
+
+
+def parse_latency(spec):
+    """Sampler returning seconds for a distribution spec in ms, e.g. 'lognormal:120:0.4'; None/'0' means no delay"""
+    if not spec or spec in ("0", "none"):
+        return None
+    name, *params = spec.split(":")
+    try:
+        values = [float(param) for param in params]
+        samplers = {
+            "fixed": lambda: values[0],
+            "uniform": lambda: random.uniform(values[0], values[1]),
+            "normal": lambda: max(0.0, random.gauss(values[0], values[1])),
+            "lognormal": lambda: random.lognormvariate(math.log(values[0]), values[1]),
+            "exp": lambda: random.expovariate(1 / values[0]),
+        }
+        sampler = samplers[name]
+        sampler()
+    except (KeyError, IndexError, ValueError, ZeroDivisionError):
+        raise ValueError(f"Bad latency '{spec}', expected fixed:MS, uniform:LO:HI, normal:MEAN:SD, "
+                         f"lognormal:MEDIAN:SIGMA or exp:MEAN") from None
+    return lambda: sampler() / 1000
+
+
+class TokenBucket:
+    """Allows rate requests per second on average with bursts of up to burst requests"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self):
+        """0 if the request may proceed, otherwise seconds until a token is available"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+def _error_body(message, error_type, code=None, param=None):
+    return json.dumps({"error": {"message": message, "type": error_type, "param": param, "code": code}}).encode()
+
+
+class MockOpenAI:
+    """State and request handlers of one mock server"""
+
+    def __init__(self, latency=None, token_latency=None, rate_limit=0, burst=None, fault_rate=0.0,
+                 fault_statuses=(500, 502, 503), abort_rate=0.0, api_key=None):
+        self.latency = parse_latency(latency)
+        self.token_latency = parse_latency(token_latency)
+        self.rate_limit = rate_limit
+        self.burst = burst or max(1, int(rate_limit))
+        self.fault_rate = fault_rate
+        self.fault_statuses = tuple(fault_statuses)
+        self.abort_rate = abort_rate
+        self.api_key = api_key
+        self.buckets = {}
+        self.counters = {}
+        self._ids = itertools.count(1)
+        self._models_body = json.dumps({"object": "list", "data": [self._model(name) for name in MODELS]}).encode()
+        self._model_bodies = {name: json.dumps(self._model(name)).encode() for name in MODELS}
+        self._deltas = [json.dumps((" " if index else "") + word) for index, word in enumerate(COMPLETION_WORDS)]
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_get("/v1/models", self.list_models)
+        app.router.add_get("/v1/models/{model}", self.get_model)
+        app.router.add_post("/v1/chat/completions", self.chat_completions)
+        app.router.add_get("/mock/stats", self.stats)
+        return app
+
+    async def list_models(self, request):
+        rejection = self._admit(request)
+        if rejection is not None:
+            return rejection
+        await self._delay()
+        return self._respond(200, self._models_body)
+
+    async def get_model(self, request):
+        rejection = self._admit(request)
+        if rejection is not None:
+            return rejection
+        await self._delay()
+        body = self._model_bodies.get(request.match_info["model"])
+        if body is None:
+            return self._model_not_found(request.match_info["model"])
+        return self._respond(200, body)
+
+    async def chat_completions(self, request):
+        rejection = self._admit(request)
+        if rejection is not None:
+            return rejection
+        try:
+            payload = await request.json(loads=json.loads)
+            model, messages = payload["model"], payload["messages"]
+            if not isinstance(messages, list) or not messages:
+                raise ValueError
+            max_tokens = int(payload.get("max_completion_tokens") or payload.get("max_tokens") or DEFAULT_MAX_TOKENS)
+            prompt_tokens = sum(len(str(message.get("content", "")).split()) for message in messages) + 3
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return self._respond(400, _error_body("Invalid body: 'model' and a non-empty 'messages' list are required.",
+                                                  "invalid_request_error", param="messages"))
+        if model not in self._model_bodies:
+            return self._model_not_found(model)
+
+        completion_tokens = min(max_tokens, len(self._deltas))
+        finish_reason = "length" if completion_tokens == max_tokens else "stop"
+        completion_id = f"chatcmpl-mock{next(self._ids):012d}"
+        await self._delay()
+        if payload.get("stream"):
+            include_usage = bool((payload.get("stream_options") or {}).get("include_usage"))
+            return await self._stream(request, completion_id, model, completion_tokens, finish_reason,
+                                      prompt_tokens, include_usage)
+
+        content = "".join(json.loads(delta) for delta in self._deltas[:completion_tokens])
+        body = json.dumps({
+            "id": completion_id, "object": "chat.completion", "created": int(time.time()), "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                         "finish_reason": finish_reason}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+        }).encode()
+        return self._respond(200, body)
+
+    async def stats(self, request):
+        return web.json_response({"requests": {str(status): count for status, count in sorted(self.counters.items())}})
+
+    async def _stream(self, request, completion_id, model, completion_tokens, finish_reason, prompt_tokens, include_usage):
+        response = web.StreamResponse(status=200, headers=SSE_HEADERS)
+        self.counters[200] = self.counters.get(200, 0) + 1
+        await response.prepare(request)
+        prefix = (f'data: {{"id":"{completion_id}","object":"chat.completion.chunk",'
+                  f'"created":{int(time.time())},"model":"{model}","choices":[{{"index":0,"delta":')
+        await response.write(f'{prefix}{{"role":"assistant","content":""}},"finish_reason":null}}]}}\n\n'.encode())
+        abort_at = random.randrange(completion_tokens) if self.abort_rate and random.random() < self.abort_rate else None
+        for index, delta in enumerate(self._deltas[:completion_tokens]):
+            if self.token_latency:
+                await asyncio.sleep(self.token_latency())
+            if index == abort_at:
+                request.transport.close()  # connection drops mid-stream, no [DONE]
+                return response
+            await response.write(f'{prefix}{{"content":{delta}}},"finish_reason":null}}]}}\n\n'.encode())
+        tail = f'{prefix}{{}},"finish_reason":"{finish_reason}"}}]}}\n\n'
+        if include_usage:
+            tail += (f'data: {{"id":"{completion_id}","object":"chat.completion.chunk","model":"{model}","choices":[],'
+                     f'"usage":{{"prompt_tokens":{prompt_tokens},"completion_tokens":{completion_tokens},'
+                     f'"total_tokens":{prompt_tokens + completion_tokens}}}}}\n\n')
+        await response.write((tail + "data: [DONE]\n\n").encode())
+        await response.write_eof()
+        return response
+
+    def _admit(self, request):
+        """Error response for a bad key, an exhausted rate limit or an injected fault, else None"""
+        authorization = request.headers.get("Authorization", "")
+        key = authorization[7:] if authorization.startswith("Bearer ") else ""
+        if not key:
+            return self._respond(401, _error_body(
+                "You didn't provide an API key. You need to provide your API key in an Authorization header "
+                "using Bearer auth (i.e. Authorization: Bearer YOUR_KEY).", "invalid_request_error"))
+        if (self.api_key and key != self.api_key) or (not self.api_key and not key.startswith("sk-")):
+            return self._respond(401, _error_body(f"Incorrect API key provided: {key[:3]}***{key[-4:]}.",
+                                                  "invalid_request_error", code="invalid_api_key"))
+        if self.rate_limit:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = self.buckets[key] = TokenBucket(self.rate_limit, self.burst)
+            wait = bucket.take()
+            headers = {"x-ratelimit-limit-requests": str(self.burst),
+                       "x-ratelimit-remaining-requests": str(int(bucket.tokens)),
+                       "x-ratelimit-reset-requests": f"{(self.burst - bucket.tokens) / self.rate_limit:.3f}s"}
+            if wait:
+                headers["Retry-After"] = str(math.ceil(wait))
+                headers["retry-after-ms"] = str(math.ceil(wait * 1000))
+                return self._respond(429, _error_body("Rate limit reached for requests. Please try again later.",
+                                                      "requests", code="rate_limit_exceeded"), headers)
+        fault = request.headers.get("X-Mock-Fault")
+        if fault is None and self.fault_rate and random.random() < self.fault_rate:
+            fault = random.choice(self.fault_statuses)
+        if fault is not None:
+            status = int(fault)
+            return self._respond(status, _error_body(FAULT_MESSAGES.get(status, "Injected fault."), "server_error"))
+        return None
+
+    async def _delay(self):
+        if self.latency:
+            await asyncio.sleep(self.latency())
+
+    def _respond(self, status, body, headers=None):
+        self.counters[status] = self.counters.get(status, 0) + 1
+        return web.Response(status=status, body=body, headers=dict(JSON_HEADERS, **headers) if headers else JSON_HEADERS)
+
+    def _model_not_found(self, model):
+        return self._respond(404, _error_body(f"The model `{model}` does not exist or you do not have access to it.",
+                                              "invalid_request_error", code="model_not_found"))
+
+    @staticmethod
+    def _model(name):
+        return {"id": name, "object": "model", "created": 1715367049, "owned_by": "system"}
+
+
+def start_background_server(mock=None, host="127.0.0.1", port=0):
+    """Serve mock (default: no latency, limits or faults) from a daemon thread and return the /v1 base URL"""
+    mock = mock or MockOpenAI()
+    started = threading.Event()
+    address = {}
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        runner = web.AppRunner(mock.make_app(), access_log=None)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, host, port)
+        loop.run_until_complete(site.start())
+        address["port"] = runner.addresses[0][1]
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, name="mock-openai-server", daemon=True).start()
+    started.wait()
+    url = f"http://{host}:{address['port']}/v1"
+    print(f"Mock OpenAI API running at {url}")
+    return url
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", help="delay before the response, e.g. lognormal:120:0.4 (ms)")
+    parser.add_argument("--token-latency", help="delay between streamed chunks, e.g. uniform:5:20 (ms)")
+    parser.add_argument("--rate-limit", type=float, default=0, help="requests per second per API key (0: unlimited)")
+    parser.add_argument("--burst", type=int, help="token bucket size (default: one second of --rate-limit)")
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="fraction of requests answered with a 5xx")
+    parser.add_argument("--fault-statuses", default="500,502,503", help="statuses injected faults pick from")
+    parser.add_argument("--abort-rate", type=float, default=0.0, help="fraction of streams cut off mid-response")
+    parser.add_argument("--api-key", help="the only key accepted (default: any key starting with sk-)")
+    args = parser.parse_args(argv)
+
+    try:
+        mock = MockOpenAI(args.latency, args.token_latency, args.rate_limit, args.burst, args.fault_rate,
+                          [int(status) for status in args.fault_statuses.split(",")], args.abort_rate, args.api_key)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"Mock OpenAI API at http://{args.host}:{args.port}/v1 "
+          f"(set OPENAI_API_BASE=http://{args.host}:{args.port}/v1)")
+    web.run_app(mock.make_app(), host=args.host, port=args.port, access_log=None, print=None)
+    print("Requests by status: " + json.dumps({str(status): count for status, count in sorted(mock.counters.items())}))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""Time-to-first-token and inter-token latency of streamed chat completions
+
+Each response is parsed as Server-Sent Events while it arrives, chunk by chunk, and never
+buffered whole. For every request it records:
+- time to first byte (TTFB) and time to first token (TTFT, the first non-empty content delta);
+- the gaps between content chunks;
+- tokens per second after the first token;
+- whether the stream finished with [DONE].
+Results are folded into fixed-size log-bucket histograms, so memory stays the same for
+10 or 100 000 streams.
+
+Usage (from the repository root):
+    OPENAI_API_KEY=sk-... python 05_API_testing/stream_latency.py [--requests 1000] [--concurrency 100]
+        [--base-url http://127.0.0.1:8080/v1 | --mock [--mock-latency lognormal:200:0.3]
+         [--mock-token-latency uniform:5:30]] [--model gpt-4o-mini] [--max-tokens 16] [--json out.json]
+
+--mock runs mock_openai_server.py in this process; otherwise OPENAI_API_BASE / OPENAI_API_KEY apply.
+With --mock or a local base URL and no key set, the placeholder key sk-mock is sent.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+import aiohttp
+from load_test import API_BASE_ENV_VAR, API_KEY_ENV_VAR, DEFAULT_API_BASE, api_key_for, build_request
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class SSEParser:
+    """Incremental text/event-stream parser: feed() raw bytes, get back the data of completed events"""
+
+    def __init__(self):
+        self._buffer = b""
+        self._data = []
+
+    def feed(self, chunk):
+        events = []
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split(b"\n")
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if not line:  # blank line ends the event
+                if self._data:
+                    events.append("\n".join(self._data))
+                    self._data = []
+            elif line.startswith(b"data:"):
+                value = line[5:]
+                self._data.append((value[1:] if value.startswith(b" ") else value).decode("utf-8"))
+            # comments (":") and event/id/retry fields carry nothing the timings need
+        return events
+
+
+class Histogram:
+    """Log-bucketed histogram with about 2% relative error over [low, high]; memory is fixed"""
+
+    def __init__(self, low=0.01, high=600_000.0, growth=1.04):
+        self.low = low
+        self.log_growth = math.log(growth)
+        self.counts = [0] * (int(math.log(high / low) / self.log_growth) + 2)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        index = 0 if value <= self.low else min(len(self.counts) - 1, int(math.log(value / self.low) / self.log_growth) + 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def bucket_value(self, index):
+        """Geometric middle of bucket index"""
+        return self.low if index == 0 else self.low * math.exp((index - 0.5) * self.log_growth)
+
+    def percentile(self, percent):
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(max(self.bucket_value(index), self.min), self.max)
+        return self.max
+
+    def summary(self):
+        if not self.count:
+            return {}
+        summary = {"count": self.count, "min": self.min, "mean": self.total / self.count}
+        summary.update({f"p{percent}": self.percentile(percent) for percent in PERCENTILES})
+        summary["max"] = self.max
+        return summary
+
+    def coarse(self, bins=12):
+        """[(upper bound, count)] over bins equal-width ranges of log(value), for printing
+
+        Values at or below low (e.g. chunks delivered in the same read) get a row of their own.
+        """
+        rows = [(self.low, self.counts[0])] if self.counts[0] else []
+        used = [index for index, count in enumerate(self.counts) if count and index]
+        if not used:
+            return rows
+        first, last = used[0], used[-1]
+        width = max(1, math.ceil((last - first + 1) / bins))
+        for start in range(first, last + 1, width):
+            rows.append((self.bucket_value(min(start + width, len(self.counts) - 1)), sum(self.counts[start:start + width])))
+        return rows
+
+
+class StreamTiming:
+    """Timings of one streamed response, in ms from the moment the request was sent"""
+
+    def __init__(self, start):
+        self.start = start
+        self.ttfb = None
+        self.ttft = None
+        self.last_token = None
+        self.gaps = []
+        self.tokens = 0
+        self.usage_tokens = None
+        self.done = False
+
+    def on_bytes(self, now):
+        if self.ttfb is None:
+            self.ttfb = (now - self.start) * 1000
+
+    def on_event(self, data, now):
+        if data == "[DONE]":
+            self.done = True
+            return
+        chunk = json.loads(data)
+        if chunk.get("usage"):
+            self.usage_tokens = chunk["usage"].get("completion_tokens")
+        for choice in chunk.get("choices") or ():
+            if (choice.get("delta") or {}).get("content"):
+                elapsed = (now - self.start) * 1000
+                if self.ttft is None:
+                    self.ttft = elapsed
+                else:
+                    self.gaps.append(elapsed - self.last_token)
+                self.last_token = elapsed
+                self.tokens += 1
+
+    @property
+    def tokens_per_second(self):
+        """Generation speed after the first token (usage.completion_tokens when the server sent it)"""
+        tokens = self.usage_tokens or self.tokens
+        if self.ttft is None or tokens < 2 or self.last_token <= self.ttft:
+            return None
+        return (tokens - 1) / ((self.last_token - self.ttft) / 1000)
+
+
+class StreamStats:
+    """Aggregate of many StreamTimings in fixed memory"""
+
+    def __init__(self):
+        self.ttfb = Histogram()
+        self.ttft = Histogram()
+        self.gaps = Histogram()
+        self.total = Histogram()
+        self.tokens_per_second = Histogram(low=0.1, high=100_000.0)
+        self.streams = 0
+        self.incomplete = 0
+        self.statuses = {}
+        self.errors = {}
+
+    def add(self, timing, total_ms):
+        self.streams += 1
+        if timing.ttfb is not None:
+            self.ttfb.add(timing.ttfb)
+        if timing.ttft is not None:
+            self.ttft.add(timing.ttft)
+        for gap in timing.gaps:
+            self.gaps.add(gap)
+        if timing.tokens_per_second is not None:
+            self.tokens_per_second.add(timing.tokens_per_second)
+        self.total.add(total_ms)
+        if not timing.done:
+            self.incomplete += 1
+
+    def count(self, status=None, error=None):
+        if status is not None:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def summary(self):
+        return {
+            "streams": self.streams,
+            "incomplete": self.incomplete,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "errors": self.errors,
+            "ttfb_ms": self.ttfb.summary(),
+            "ttft_ms": self.ttft.summary(),
+            "inter_chunk_gap_ms": self.gaps.summary(),
+            "total_ms": self.total.summary(),
+            "tokens_per_second": self.tokens_per_second.summary(),
+            "gap_histogram_ms": self.gaps.coarse(),
+        }
+
+
+async def measure_stream(session, url, body, stats):
+    """Send one streaming request and add its timings to stats"""
+    start = time.perf_counter()
+    timing = StreamTiming(start)
+    parser = SSEParser()
+    try:
+        async with session.post(url, json=body) as response:
+            stats.count(status=response.status)
+            if response.status != 200:
+                await response.read()
+                return
+            async for chunk in response.content.iter_any():
+                now = time.perf_counter()
+                timing.on_bytes(now)
+                for data in parser.feed(chunk):
+                    timing.on_event(data, now)
+    except asyncio.TimeoutError:
+        stats.count(error="timeout")
+    except aiohttp.ClientError as error:
+        stats.count(error=type(error).__name__)
+    except ValueError:
+        stats.count(error="bad-chunk")
+    if timing.ttfb is not None:  # a stream was received, complete or not
+        stats.add(timing, (time.perf_counter() - start) * 1000)
+
+
+async def run(base_url, api_key, body, requests, concurrency, timeout=120.0):
+    """Stream requests completions, at most concurrency at a time, over one pooled session"""
+    stats = StreamStats()
+    url = base_url.rstrip("/") + "/chat/completions"
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency)
+    async with aiohttp.ClientSession(connector=connector, headers=headers,
+                                     timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        remaining = iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                await measure_stream(session, url, body, stats)
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    return stats
+
+
+def print_report(summary, elapsed):
+    print(f"\n{summary['streams']} streams in {elapsed:.1f}s, {summary['incomplete']} without [DONE]; "
+          f"statuses {summary['statuses']} errors {summary['errors']}")
+    columns = ("count", "min", "mean") + tuple(f"p{percent}" for percent in PERCENTILES) + ("max",)
+    print(f"  {'':<22}" + "".join(f"{column:>10}" for column in columns))
+    for name in ("ttfb_ms", "ttft_ms", "inter_chunk_gap_ms", "total_ms", "tokens_per_second"):
+        data = summary[name]
+        if data:
+            print(f"  {name:<22}" + "".join(f"{data[column]:>10.1f}" if column != "count" else f"{data[column]:>10d}"
+                                            for column in columns))
+    rows = summary["gap_histogram_ms"]
+    if rows:
+        print("\n  inter-chunk gaps")
+        peak = max(count for _, count in rows)
+        for upper, count in rows:
+            print(f"  <= {upper:9.2f} ms {count:>9d} {'#' * max(1 if count else 0, round(40 * count / peak))}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--base-url", default=os.environ.get(API_BASE_ENV_VAR, DEFAULT_API_BASE))
+    parser.add_argument("--api-key", default=os.environ.get(API_KEY_ENV_VAR, ""))
+    parser.add_argument("--mock", action="store_true", help="stream from an in-process mock_openai_server")
+    parser.add_argument("--mock-latency", default="lognormal:200:0.3", help="mock delay before the first byte (ms)")
+    parser.add_argument("--mock-token-latency", default="uniform:5:30", help="mock delay between chunks (ms)")
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--prompt", default="Say hello in one short sentence.")
+    parser.add_argument("--max-tokens", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--json", help="write the summary here")
+    args = parser.parse_args(argv)
+
+    base_url, api_key = args.base_url, args.api_key
+    if args.mock:
+        from mock_openai_server import MockOpenAI, start_background_server
+        base_url = start_background_server(MockOpenAI(args.mock_latency, args.mock_token_latency))
+    api_key = api_key_for(base_url, api_key)
+    _, _, body = build_request("chat", args.model, args.prompt, args.max_tokens, stream=True)
+    body["stream_options"] = {"include_usage": True}
+
+    print(f"{args.requests} streamed completions, {args.concurrency} concurrent, against {base_url}")
+    start = time.perf_counter()
+    stats = asyncio.run(run(base_url, api_key, body, args.requests, args.concurrency, args.timeout))
+    summary = stats.summary()
+    print_report(summary, time.perf_counter() - start)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())